@@ -18,6 +18,7 @@ namespace ClassicUO.Assets
         private UOFileMul[] _staDif;
         private UOFileMul[] _staDifi;
         private UOFileMul[] _staDifl;
+        private readonly object _loadLock = new object();
 
         // cannot be a const, due to UOLive implementation
         public static int MAPS_COUNT = 6;
@@ -249,7 +250,18 @@ namespace ClassicUO.Assets
             _filesStatics.CopyTo(_currentStaticsFiles, 0);
         }
 
-        public unsafe void LoadMap(int i, bool useXFiles = false)
+        /// <summary>
+        /// Load the block index of a facet. Serialized, map readers on other threads can load facets the player hasn't visited.
+        /// </summary>
+        public void LoadMap(int i, bool useXFiles = false)
+        {
+            lock (_loadLock)
+            {
+                LoadMapUnlocked(i, useXFiles);
+            }
+        }
+
+        private unsafe void LoadMapUnlocked(int i, bool useXFiles)
         {
             if (i < 0 || i + 1 > MAPS_COUNT || _currentMapFiles[i] == null)
             {
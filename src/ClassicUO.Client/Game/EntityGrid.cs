@@ -0,0 +1,96 @@
+using System;
+using System.Collections.Generic;
+using ClassicUO.Game.GameObjects;
+
+namespace ClassicUO.Game
+{
+    /// <summary>
+    /// Buckets entities placed in the world by 8x8 cell (the same size as a map chunk) so range lookups only visit nearby cells.
+    /// Entities are added and removed as they are placed on and taken off map tiles.
+    /// Main thread only.
+    /// </summary>
+    public sealed class EntityGrid<T> where T : Entity
+    {
+        public const int CELL_SHIFT = 3;
+
+        private readonly Dictionary<int, HashSet<T>> _cells = new();
+
+        public int Count { get; private set; }
+
+        public void Add(T entity, int x, int y)
+        {
+            if (x < 0 || y < 0)
+            {
+                Remove(entity);
+
+                return;
+            }
+
+            int key = Key(x >> CELL_SHIFT, y >> CELL_SHIFT);
+
+            if (entity.GridCell == key)
+                return;
+
+            Remove(entity);
+
+            if (!_cells.TryGetValue(key, out HashSet<T> cell))
+                _cells[key] = cell = new HashSet<T>(ReferenceEqualityComparer.Instance);
+
+            cell.Add(entity);
+            entity.GridCell = key;
+            Count++;
+        }
+
+        public void Remove(T entity)
+        {
+            if (entity.GridCell < 0)
+                return;
+
+            if (_cells.TryGetValue(entity.GridCell, out HashSet<T> cell) && cell.Remove(entity))
+            {
+                Count--;
+
+                if (cell.Count == 0)
+                    _cells.Remove(entity.GridCell);
+            }
+
+            entity.GridCell = -1;
+        }
+
+        public void Clear()
+        {
+            foreach (HashSet<T> cell in _cells.Values)
+                foreach (T entity in cell)
+                    entity.GridCell = -1;
+
+            _cells.Clear();
+            Count = 0;
+        }
+
+        /// <summary>
+        /// Add every entity in the cells overlapping the square of <paramref name="range"/> tiles around x, y.
+        /// Results are a superset, callers still need to check the exact distance.
+        /// </summary>
+        public void Query(int x, int y, int range, List<T> results)
+        {
+            if (range < 0)
+                return;
+
+            int minX = Math.Max(0, x - range) >> CELL_SHIFT;
+            int minY = Math.Max(0, y - range) >> CELL_SHIFT;
+            int maxX = (x + range) >> CELL_SHIFT;
+            int maxY = (y + range) >> CELL_SHIFT;
+
+            for (int cx = minX; cx <= maxX; cx++)
+            {
+                for (int cy = minY; cy <= maxY; cy++)
+                {
+                    if (_cells.TryGetValue(Key(cx, cy), out HashSet<T> cell))
+                        results.AddRange(cell);
+                }
+            }
+        }
+
+        private static int Key(int cellX, int cellY) => (cellX << 16) | (cellY & 0xFFFF);
+    }
+}
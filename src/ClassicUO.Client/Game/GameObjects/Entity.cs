@@ -32,6 +32,10 @@ namespace ClassicUO.Game.GameObjects
 
         public byte AnimIndex;
         public bool ExecuteAnimation = true;
+        /// <summary>
+        /// Cell this entity is filed under in the world's <see cref="EntityGrid{T}"/>, -1 when not placed
+        /// </summary>
+        internal int GridCell = -1;
         internal long LastAnimationChangeTime;
         public Flags Flags;
         public ushort Hits { get => hits; set
@@ -120,6 +120,7 @@ namespace ClassicUO.Game.GameObjects
                 byte type = GetGraphicObjectType();
                 GraphicsReplacement.ReplaceHue(OriginalGraphic, type, ref value);
                 hue = value;
+                OnHueSet(hue);
             }
         }
         public Vector3 Offset;
@@ -134,6 +135,8 @@ namespace ClassicUO.Game.GameObjects
 
         public virtual void OnGraphicSet(ushort newGraphic) { }
 
+        public virtual void OnHueSet(ushort newHue) { }
+
         public void AddDamage(int damage)
         {
             _averageOverTime ??= new AverageOverTime(TimeSpan.FromSeconds(15));
@@ -161,15 +164,30 @@ namespace ClassicUO.Game.GameObjects
 
         public void AddToTile(Chunk chunk, int chunkX, int chunkY)
         {
-            RemoveFromTile();
+            // Only unlink here, OnAddedToTile moves the entity between grid cells without a remove and re-add on every step
+            UnlinkFromTile();
 
             if (!IsDestroyed && chunk != null)
             {
                 chunk.AddGameObject(this, chunkX, chunkY);
+                OnAddedToTile((chunk.X << 3) + chunkX, (chunk.Y << 3) + chunkY);
+            }
+            else
+            {
+                OnRemovedFromTile();
             }
         }
 
         public void RemoveFromTile()
+        {
+            UnlinkFromTile();
+            OnRemovedFromTile();
+        }
+
+        /// <summary>
+        /// Take the object out of its tile's list without telling the entity grid, for when it is placed again right away.
+        /// </summary>
+        internal void UnlinkFromTile()
         {
             if (TPrevious != null)
             {
@@ -185,6 +203,10 @@ namespace ClassicUO.Game.GameObjects
             TPrevious = null;
         }
 
+        protected virtual void OnAddedToTile(int x, int y) { }
+
+        protected virtual void OnRemovedFromTile() { }
+
         public virtual void UpdateGraphicBySeason() { }
 
         public void UpdateScreenPosition()
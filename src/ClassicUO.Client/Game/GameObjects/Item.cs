@@ -150,7 +150,19 @@ namespace ClassicUO.Game.GameObjects
             && Graphic != 0;
 
         public ushort Amount;
-        public uint Container = 0xFFFF_FFFF;
+
+        public uint Container
+        {
+            get => _container;
+            set
+            {
+                if (_container == value)
+                    return;
+
+                _container = value;
+                World?.ItemIndex.Update(this);
+            }
+        }
 
         public bool IsDamageable;
         public Layer Layer;
@@ -165,6 +177,14 @@ namespace ClassicUO.Game.GameObjects
 
         private bool _isLight;
         private bool _wasCorpse; // Track if this item was previously a corpse
+        private uint _container = 0xFFFF_FFFF;
+
+        /// <summary>
+        /// The keys this item is currently filed under in <see cref="ItemIndex"/>
+        /// </summary>
+        internal readonly record struct IndexKeys(bool Indexed, ushort Graphic, uint Container, ushort Hue);
+
+        internal IndexKeys IndexState;
 
         public static Item Create(World world, uint serial)
         {
@@ -184,6 +204,8 @@ namespace ClassicUO.Game.GameObjects
         {
             base.OnGraphicSet(newGraphic);
 
+            World?.ItemIndex.Update(this);
+
             // Check if this item became a corpse or stopped being a corpse
             bool isNowCorpse = newGraphic == 0x2006;
 
@@ -201,6 +223,17 @@ namespace ClassicUO.Game.GameObjects
             }
         }
 
+        protected override void OnAddedToTile(int x, int y) => World?.ItemGrid.Add(this, x, y);
+
+        protected override void OnRemovedFromTile() => World?.ItemGrid.Remove(this);
+
+        public override void OnHueSet(ushort newHue)
+        {
+            base.OnHueSet(newHue);
+
+            World?.ItemIndex.Update(this);
+        }
+
         public override void Destroy()
         {
             if (IsDestroyed)
@@ -231,6 +264,8 @@ namespace ClassicUO.Game.GameObjects
                 Opened = false;
             }
 
+            World?.ItemIndex.Remove(this);
+
             base.Destroy();
 
             //_pool.ReturnOne(this);
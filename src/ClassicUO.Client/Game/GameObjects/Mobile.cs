@@ -1083,6 +1083,10 @@ namespace ClassicUO.Game.GameObjects
             Client.Game.UO.Version >= ClientVersion.CV_7000
             && (Graphic == 666 || Graphic == 667 || Graphic == 0x02B7 || Graphic == 0x02B6);
 
+        protected override void OnAddedToTile(int x, int y) => World?.MobileGrid.Add(this, x, y);
+
+        protected override void OnRemovedFromTile() => World?.MobileGrid.Remove(this);
+
         public override void Destroy()
         {
             uint serial = Serial & 0x3FFFFFFF;
@@ -0,0 +1,108 @@
+using System.Collections.Generic;
+using ClassicUO.Game.GameObjects;
+
+namespace ClassicUO.Game
+{
+    /// <summary>
+    /// Secondary lookups for <see cref="World.Items"/> by graphic, parent container and hue.
+    /// Items are added when the world creates them and are moved between buckets as their graphic, container or hue change.
+    /// Main thread only.
+    /// </summary>
+    public sealed class ItemIndex
+    {
+        private static readonly HashSet<Item> _empty = new();
+
+        private readonly Dictionary<ushort, HashSet<Item>> _byGraphic = new();
+        private readonly Dictionary<uint, HashSet<Item>> _byContainer = new();
+        private readonly Dictionary<ushort, HashSet<Item>> _byHue = new();
+
+        public IReadOnlyCollection<Item> ByGraphic(ushort graphic) => _byGraphic.GetValueOrDefault(graphic, _empty);
+
+        public IReadOnlyCollection<Item> ByContainer(uint container) => _byContainer.GetValueOrDefault(container, _empty);
+
+        public IReadOnlyCollection<Item> ByHue(ushort hue) => _byHue.GetValueOrDefault(hue, _empty);
+
+        /// <summary>
+        /// Start tracking an item, called when it is added to <see cref="World.Items"/>.
+        /// </summary>
+        public void Add(Item item)
+        {
+            if (item.IndexState.Indexed)
+                return;
+
+            item.IndexState = new Item.IndexKeys(true, item.Graphic, item.Container, item.Hue);
+            AddTo(_byGraphic, item.Graphic, item);
+            AddTo(_byContainer, item.Container, item);
+            AddTo(_byHue, item.Hue, item);
+        }
+
+        /// <summary>
+        /// Move a tracked item to the buckets matching its current graphic, container and hue.
+        /// </summary>
+        public void Update(Item item)
+        {
+            Item.IndexKeys keys = item.IndexState;
+
+            if (!keys.Indexed)
+                return;
+
+            if (keys.Graphic != item.Graphic)
+            {
+                RemoveFrom(_byGraphic, keys.Graphic, item);
+                AddTo(_byGraphic, item.Graphic, item);
+            }
+
+            if (keys.Container != item.Container)
+            {
+                RemoveFrom(_byContainer, keys.Container, item);
+                AddTo(_byContainer, item.Container, item);
+            }
+
+            if (keys.Hue != item.Hue)
+            {
+                RemoveFrom(_byHue, keys.Hue, item);
+                AddTo(_byHue, item.Hue, item);
+            }
+
+            item.IndexState = new Item.IndexKeys(true, item.Graphic, item.Container, item.Hue);
+        }
+
+        public void Remove(Item item)
+        {
+            Item.IndexKeys keys = item.IndexState;
+
+            if (!keys.Indexed)
+                return;
+
+            RemoveFrom(_byGraphic, keys.Graphic, item);
+            RemoveFrom(_byContainer, keys.Container, item);
+            RemoveFrom(_byHue, keys.Hue, item);
+            item.IndexState = default;
+        }
+
+        public void Clear()
+        {
+            foreach (HashSet<Item> set in _byGraphic.Values)
+                foreach (Item item in set)
+                    item.IndexState = default;
+
+            _byGraphic.Clear();
+            _byContainer.Clear();
+            _byHue.Clear();
+        }
+
+        private static void AddTo<T>(Dictionary<T, HashSet<Item>> index, T key, Item item)
+        {
+            if (!index.TryGetValue(key, out HashSet<Item> set))
+                index[key] = set = new HashSet<Item>(ReferenceEqualityComparer.Instance);
+
+            set.Add(item);
+        }
+
+        private static void RemoveFrom<T>(Dictionary<T, HashSet<Item>> index, T key, Item item)
+        {
+            if (index.TryGetValue(key, out HashSet<Item> set) && set.Remove(item) && set.Count == 0)
+                index.Remove(key);
+        }
+    }
+}
@@ -1,11 +1,13 @@
 using System;
 using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.Threading;
 using System.Threading.Tasks;
 using ClassicUO.Game.Data;
 using ClassicUO.Game.GameObjects;
 using ClassicUO.Game.Managers;
+using ClassicUO.Utility;
 using ClassicUO.Utility.Logging;
 using Microsoft.Xna.Framework;
 
@@ -21,6 +23,9 @@ namespace ClassicUO.Game
         private const int INITIAL_CHUNK_SIZE = 10;
         private const int MAX_PATHFINDING_TIME_MS = 15000; // 15 seconds
         private const int MAX_PATH_LENGTH = 2500; // Maximum tiles in a path to prevent memory exhaustion
+        private const int ROUTE_CACHE_SIZE = 32;
+        private const int ROUTE_CACHE_START_SEARCH = 16; // How far into a cached route to look for the tile closest to the player
+        public const int MAX_TARGET_RANGE = 18; // Walking distance targets, every target adds (2 * range + 1)^2 goal tiles
 
         // Thread synchronization
         private static readonly object _stateLock = new();
@@ -46,8 +51,61 @@ namespace ClassicUO.Game
         private static long _nextAttempt; // Protected by Interlocked operations
         private static long _pathfindingStartTime; // Set before background thread starts, read during execution
 
+        // Recently solved routes keyed by map, the 8x8 block of the start and the exact target
+        private static readonly LruCache<(int Map, int StartBlockX, int StartBlockY, int TargetX, int TargetY), List<Point>> _routeCache = new(ROUTE_CACHE_SIZE);
+
+        private enum PathResult
+        {
+            Found,
+            Partial,
+            NotFound,
+            TimedOut,
+            Cancelled,
+            Pending // Finished later on the main thread
+        }
+
         public static bool IsPathfinding() => _pathfindingInProgress;
 
+        /// <summary>
+        /// Generate a path in the background without walking it.
+        /// Tiles can be taken from the request while the rest of the route is still being worked out.
+        /// Only generated walkable data is used, missing chunks are generated from the map files, so any number of these can run next to the game.
+        /// Problems are reported through <see cref="PathRequest.Message"/> instead of printed.
+        /// </summary>
+        /// <param name="cancellationToken">Also cancels the request, e.g. when the script that started it stops</param>
+        public static PathRequest FindPathAsync(int startX, int startY, int targetX, int targetY, CancellationToken cancellationToken = default)
+        {
+            int mapIndex = World.Instance?.MapIndex ?? -1;
+
+            var request = new PathRequest(targetX, targetY, new ConcurrentQueue<Point>(), cancellationToken)
+            {
+                CanWalk = (x, y) => WalkableManager.Instance.IsWalkableOrGenerate(mapIndex, x, y)
+            };
+
+            long startTicks = Time.Ticks;
+
+            Task.Run(() =>
+            {
+                try
+                {
+                    PathResult result = GenerateFullTilePath(startX, startY, targetX, targetY, request, startTicks, request.CancellationToken);
+
+                    if (result == PathResult.TimedOut)
+                        request.Report("Pathfinding timeout - path too complex");
+
+                    if (result != PathResult.Pending)
+                        request.Complete(result == PathResult.Found);
+                }
+                catch (Exception ex)
+                {
+                    Log.Error($"[LongDistancePathfinder] Error during path request: {ex.Message}");
+                    request.Complete(false);
+                }
+            });
+
+            return request;
+        }
+
         /// <summary>
         /// Initiates long-distance pathfinding to the specified target coordinates.
         /// Uses A* algorithm to generate a full tile-by-tile path asynchronously, then processes it in chunks.
@@ -142,11 +200,122 @@ namespace ClassicUO.Game
             return true;
         }
 
+        /// <summary>
+        /// Walking distance from the start to each target, found with a single breadth first search over the pathfinding cache.
+        /// Chunks missing from the cache are generated from the map files as the search reaches them.
+        /// </summary>
+        /// <param name="range">A target counts as reached from any tile within this many tiles of it, 0 to stand on it, at most <see cref="MAX_TARGET_RANGE"/></param>
+        /// <param name="maxDistance">Steps to search before giving up on the targets not reached yet</param>
+        /// <returns>Steps to each target in the same order, -1 if it wasn't reached</returns>
+        public static int[] GetWalkingDistances(int startX, int startY, IReadOnlyList<Point> targets, int range, int maxDistance, CancellationToken cancellationToken = default)
+        {
+            int mapIndex = World.Instance?.MapIndex ?? -1;
+
+            if (mapIndex < 0)
+            {
+                var none = new int[targets.Count];
+                Array.Fill(none, -1);
+
+                return none;
+            }
+
+            return GetWalkingDistances(startX, startY, targets, range, maxDistance, (x, y) => WalkableManager.Instance.IsWalkableOrGenerate(mapIndex, x, y), cancellationToken);
+        }
+
+        internal static int[] GetWalkingDistances(int startX, int startY, IReadOnlyList<Point> targets, int range, int maxDistance, Func<int, int, bool> canWalk, CancellationToken cancellationToken)
+        {
+            var result = new int[targets.Count];
+            Array.Fill(result, -1);
+            range = Math.Clamp(range, 0, MAX_TARGET_RANGE);
+
+            if (targets.Count == 0 || maxDistance < 0)
+                return result;
+
+            // Every tile that reaches a target, so each visited tile is a single lookup
+            var goals = new Dictionary<(int X, int Y), List<int>>();
+            int remaining = 0;
+
+            for (int i = 0; i < targets.Count; i++)
+            {
+                Point target = targets[i];
+
+                if (target.X < 0 || target.Y < 0 || GetDistance(startX, startY, target.X, target.Y) > maxDistance + range)
+                    continue;
+
+                remaining++;
+
+                for (int x = target.X - range; x <= target.X + range; x++)
+                for (int y = target.Y - range; y <= target.Y + range; y++)
+                {
+                    if (!goals.TryGetValue((x, y), out List<int> reachedBy))
+                        goals[(x, y)] = reachedBy = new List<int>(1);
+
+                    reachedBy.Add(i);
+                }
+            }
+
+            // Steps are all the same cost, so the first time a tile is reached is along a shortest path
+            int size = maxDistance * 2 + 1;
+            var visited = new bool[size * size];
+            var open = new Queue<(int X, int Y, int Distance)>();
+            open.Enqueue((startX, startY, 0));
+            visited[maxDistance * size + maxDistance] = true;
+
+            while (remaining > 0 && open.TryDequeue(out (int X, int Y, int Distance) node))
+            {
+                if (cancellationToken.IsCancellationRequested)
+                    break;
+
+                if (goals.Remove((node.X, node.Y), out List<int> reached))
+                    foreach (int i in reached)
+                        if (result[i] == -1)
+                        {
+                            result[i] = node.Distance;
+                            remaining--;
+                        }
+
+                if (node.Distance == maxDistance)
+                    continue;
+
+                for (int dir = 0; dir < 8; dir++)
+                {
+                    (int newX, int newY) = ApplyDirectionOffset(node.X, node.Y, dir, 1);
+                    int localX = newX - startX + maxDistance;
+                    int localY = newY - startY + maxDistance;
+
+                    if (newX < 0 || newY < 0 || localX < 0 || localY < 0 || localX >= size || localY >= size)
+                        continue;
+
+                    int index = localY * size + localX;
+
+                    if (visited[index])
+                        continue;
+
+                    visited[index] = true;
+
+                    if (canWalk(newX, newY))
+                        open.Enqueue((newX, newY, node.Distance + 1));
+                }
+            }
+
+            return result;
+        }
+
         private static async Task StartFullPathGeneration(int startX, int startY, int targetX, int targetY, CancellationToken cancellationToken)
         {
             try
             {
-                await Task.Run(() => GenerateFullTilePath(startX, startY, targetX, targetY, cancellationToken), cancellationToken);
+                // Set target position atomically by replacing the entire object
+                _target = new TargetPosition { X = targetX, Y = targetY };
+
+                var output = new PathRequest(targetX, targetY, _fullTilePath, cancellationToken);
+                PathResult result = await Task.Run(() => GenerateFullTilePath(startX, startY, targetX, targetY, output, _pathfindingStartTime, cancellationToken), cancellationToken);
+
+                if (result == PathResult.TimedOut)
+                {
+                    MainThreadQueue.EnqueueAction(() => GameActions.Print("Pathfinding timeout - path too complex"));
+                    StopPathfinding();
+                }
             }
             catch (OperationCanceledException)
             {
@@ -562,16 +731,21 @@ namespace ClassicUO.Game
             }
         }
 
-        private static void GenerateFullTilePath(int startX, int startY, int targetX, int targetY, CancellationToken cancellationToken)
+        /// <summary>
+        /// Find a path and add its tiles to <paramref name="output"/>, starting with the routing graph which adds tiles as it goes.
+        /// </summary>
+        private static PathResult GenerateFullTilePath(int startX, int startY, int targetX, int targetY, PathRequest output, long startTicks, CancellationToken cancellationToken)
         {
             Log.Info($"[LongDistancePathfinder] Starting full tile path generation from ({startX}, {startY}) to ({targetX}, {targetY})");
 
+            // Background requests bring their own check, the walker's can fall back to the world on cache misses
+            Func<int, int, bool> canWalk = output.CanWalk ?? IsGenerallyWalkable;
+
             // Test basic walkability
-            bool startWalkable = IsGenerallyWalkable(startX, startY);
+            bool startWalkable = canWalk(startX, startY);
             Log.Debug($"[LongDistancePathfinder] Start position walkable: {startWalkable}");
 
-            // Set target position atomically by replacing the entire object
-            _target = new TargetPosition { X = targetX, Y = targetY };
+            var target = new TargetPosition { X = targetX, Y = targetY };
 
             // Local collections for this pathfinding operation (thread-safe by design)
             var closedSet = new Dictionary<(int x, int y), LongPathNode>();
@@ -588,10 +762,50 @@ namespace ClassicUO.Game
                         List<Point> shortPath = ConvertToPointList(world.Player.Pathfinder.GetPathTo(targetX, targetY, world.Player.Z, 0));
                         if (shortPath != null)
                             foreach (Point point in shortPath)
-                                _fullTilePath.Enqueue(point);
+                                output.Add(point);
+
+                        output.Complete(shortPath != null);
+                        return;
                     }
+
+                    output.Complete(false);
                 });
-                return;
+                return PathResult.Pending;
+            }
+
+            // Repeat trips come from the route cache, otherwise try the precomputed routing graph before a full tile search
+            int mapIndex = World.Instance?.MapIndex ?? -1;
+            int streamed = 0;
+            Point lastStreamed = default;
+
+            void Stream(Point tile)
+            {
+                if (streamed++ < MAX_PATH_LENGTH)
+                    output.Add(tile);
+
+                lastStreamed = tile;
+            }
+
+            List<Point> quickPath = FindCachedOrRoutedPath(mapIndex, startX, startY, targetX, targetY, Stream, cancellationToken);
+
+            if (cancellationToken.IsCancellationRequested)
+                return PathResult.Cancelled;
+
+            if (quickPath != null)
+            {
+                EnqueueFullPath(output, quickPath, targetX, targetY, streamed);
+                return PathResult.Found;
+            }
+
+            // The routing graph gave up part way, carry on from the last tile it queued
+            int skipTiles = 0;
+
+            if (streamed > 0)
+            {
+                Log.Debug($"[LongDistancePathfinder] Routing graph stopped after {streamed} tiles, continuing from ({lastStreamed.X}, {lastStreamed.Y})");
+                startX = lastStreamed.X;
+                startY = lastStreamed.Y;
+                skipTiles = 1;
             }
 
             // Start long distance pathfinding with full tile path generation
@@ -615,12 +829,10 @@ namespace ClassicUO.Game
             while (openSet.Count > 0 && !cancellationToken.IsCancellationRequested)
             {
                 // Check for timeout
-                if (Time.Ticks - _pathfindingStartTime > MAX_PATHFINDING_TIME_MS)
+                if (Time.Ticks - startTicks > MAX_PATHFINDING_TIME_MS)
                 {
                     Log.Warn("[LongDistancePathfinder] Pathfinding timeout - exceeded maximum time or nodes");
-                    MainThreadQueue.EnqueueAction(() => GameActions.Print("Pathfinding timeout - path too complex"));
-                    StopPathfinding();
-                    return;
+                    return PathResult.TimedOut;
                 }
 
                 LongPathNode currentNode = openSet.Dequeue();
@@ -641,14 +853,14 @@ namespace ClassicUO.Game
                 }
 
                 // Generate neighboring nodes (now using single-tile steps for full path)
-                GenerateNeighborsForFullPath(currentNode, openSet, closedSet);
+                GenerateNeighborsForFullPath(currentNode, openSet, closedSet, target, canWalk);
 
                 // Yield periodically to prevent blocking
                 if (nodesProcessed % 100 == 0) Thread.Sleep(1); // Brief yield
             }
 
             if (cancellationToken.IsCancellationRequested)
-                return;
+                return PathResult.Cancelled;
 
             Log.Info($"[LongDistancePathfinder] A* search completed. Nodes processed: {nodesProcessed}, Goal found: {goalNode != null}, OpenSet remaining: {openSet.Count}");
 
@@ -657,14 +869,15 @@ namespace ClassicUO.Game
                 // Reconstruct the complete tile-by-tile path
                 List<Point> fullPath = ReconstructPath(goalNode);
                 Log.Debug($"[LongDistancePathfinder] Reconstructed full path with {fullPath.Count} tiles");
+                _routeCache.Set(RouteKey(mapIndex, startX, startY, targetX, targetY), fullPath);
 
                 if (cancellationToken.IsCancellationRequested)
-                    return;
+                    return PathResult.Cancelled;
 
                 // Only smooth the path for longer distances - keep every tile for short distances
                 if (distance > FULL_TILE_GENERATION_THRESHOLD)
                 {
-                    fullPath = SmoothPath(fullPath);
+                    fullPath = SmoothPath(fullPath, canWalk);
                     Log.Debug($"[LongDistancePathfinder] Path smoothed for long distance ({distance} tiles)");
                 }
                 else
@@ -672,46 +885,17 @@ namespace ClassicUO.Game
                     Log.Debug($"[LongDistancePathfinder] Keeping all tiles for short distance ({distance} tiles)");
                 }
 
-                // Check if path exceeds maximum length
-                if (fullPath.Count > MAX_PATH_LENGTH)
-                {
-                    Log.Warn($"[LongDistancePathfinder] Path too long ({fullPath.Count} tiles), truncating to {MAX_PATH_LENGTH} tiles");
-                    MainThreadQueue.EnqueueAction(() => GameActions.Print($"Path too long, using partial path ({MAX_PATH_LENGTH} tiles)"));
-                    fullPath = fullPath.GetRange(0, MAX_PATH_LENGTH);
-                }
-
-                // Add ALL tiles to the queue - this is the full tile-by-tile path
-                Point? previousPoint = null;
-                foreach (Point point in fullPath)
-                {
-                    if (previousPoint.HasValue)
-                    {
-                        int stepDistance = GetDistance(point.X, point.Y, previousPoint.Value.X, previousPoint.Value.Y);
-                        if (stepDistance > 2) Log.Warn($"[LongDistancePathfinder] Large step detected in path: from ({previousPoint.Value.X}, {previousPoint.Value.Y}) to ({point.X}, {point.Y}), distance: {stepDistance}");
-                    }
-                    _fullTilePath.Enqueue(point);
-                    previousPoint = point;
-                }
-
-                // Always add the exact target as final destination (even if not walkable, regular pathfinder will handle it)
-                Point lastPoint = fullPath[fullPath.Count - 1];
-                if (lastPoint.X != targetX || lastPoint.Y != targetY)
-                {
-                    _fullTilePath.Enqueue(new Point(targetX, targetY));
-                    Log.Debug($"[LongDistancePathfinder] Added exact target ({targetX}, {targetY}) as final tile");
-                }
-
-                Log.Debug($"[LongDistancePathfinder] Added {_fullTilePath.Count} tiles to full path queue");
+                EnqueueFullPath(output, fullPath, targetX, targetY, skipTiles);
+                return PathResult.Found;
             }
             else
             {
                 // No exact path found, try to find the closest reachable point
                 Log.Warn($"[LongDistancePathfinder] No exact path found, finding closest reachable point");
-                TargetPosition target = _target;
                 LongPathNode bestNode = FindClosestNodeToTarget(closedSet, target);
 
                 if (cancellationToken.IsCancellationRequested)
-                    return;
+                    return PathResult.Cancelled;
 
                 if (bestNode != null)
                 {
@@ -719,12 +903,12 @@ namespace ClassicUO.Game
                     Log.Debug($"[LongDistancePathfinder] Found partial path to closest point with {partialPath.Count} tiles");
 
                     if (cancellationToken.IsCancellationRequested)
-                        return;
+                        return PathResult.Cancelled;
 
                     // Only smooth the path for longer distances - keep every tile for short distances
                     if (distance > FULL_TILE_GENERATION_THRESHOLD)
                     {
-                        partialPath = SmoothPath(partialPath);
+                        partialPath = SmoothPath(partialPath, canWalk);
                         Log.Debug($"[LongDistancePathfinder] Partial path smoothed for long distance ({distance} tiles)");
                     }
                     else
@@ -736,47 +920,160 @@ namespace ClassicUO.Game
                     if (partialPath.Count > MAX_PATH_LENGTH)
                     {
                         Log.Warn($"[LongDistancePathfinder] Partial path too long ({partialPath.Count} tiles), truncating to {MAX_PATH_LENGTH} tiles");
-                        MainThreadQueue.EnqueueAction(() => GameActions.Print($"Path too long, using truncated path ({MAX_PATH_LENGTH} tiles)"));
+                        Report(output, $"Path too long, using truncated path ({MAX_PATH_LENGTH} tiles)");
                         partialPath = partialPath.GetRange(0, MAX_PATH_LENGTH);
                     }
 
                     // Add the partial path
-                    foreach (Point point in partialPath) _fullTilePath.Enqueue(point);
+                    for (int i = skipTiles; i < partialPath.Count; i++) output.Add(partialPath[i]);
 
                     // Still try to add the exact target at the end - regular pathfinder might be able to reach it
                     Point lastPoint = partialPath[partialPath.Count - 1];
                     if (lastPoint.X != targetX || lastPoint.Y != targetY)
                     {
-                        _fullTilePath.Enqueue(new Point(targetX, targetY));
+                        output.Add(new Point(targetX, targetY));
                         Log.Debug($"[LongDistancePathfinder] Added target ({targetX}, {targetY}) after closest reachable point");
                     }
 
-                    Log.Debug($"[LongDistancePathfinder] Added {_fullTilePath.Count} tiles to partial path queue");
+                    Log.Debug($"[LongDistancePathfinder] Added {output.Count} tiles to partial path queue");
+                    return PathResult.Partial;
                 }
                 else
                 {
                     // Last resort: try direct line approach
                     Log.Warn($"[LongDistancePathfinder] No reachable points found, trying direct path");
-                    List<Point> directPath = CreateDirectPathWithAvoidance(startX, startY, targetX, targetY);
+                    List<Point> directPath = CreateDirectPathWithAvoidance(startX, startY, targetX, targetY, canWalk);
                     if (directPath != null && directPath.Count > 1)
                     {
-                        foreach (Point point in directPath) _fullTilePath.Enqueue(point);
+                        for (int i = skipTiles; i < directPath.Count; i++) output.Add(directPath[i]);
                         Log.Debug($"[LongDistancePathfinder] Added direct path with {directPath.Count} tiles");
+                        return PathResult.Partial;
                     }
-                    else
-                        MainThreadQueue.EnqueueAction(() => GameActions.Print($"Could not find any viable path to target."));
+
+                    Report(output, "Could not find any viable path to target.");
+                    return PathResult.NotFound;
                 }
             }
         }
 
-        private static void GenerateNeighborsForFullPath(LongPathNode currentNode, PriorityQueue<LongPathNode, int> openSet, Dictionary<(int x, int y), LongPathNode> closedSet)
+        /// <summary>
+        /// Queue a complete path for walking, truncated to <see cref="MAX_PATH_LENGTH"/> and always ending at the exact target.
+        /// </summary>
+        /// <param name="alreadyQueued">Leading tiles of the path that were already added while it was being found</param>
+        private static void EnqueueFullPath(PathRequest output, List<Point> fullPath, int targetX, int targetY, int alreadyQueued = 0)
+        {
+            // Check if path exceeds maximum length
+            if (fullPath.Count > MAX_PATH_LENGTH)
+            {
+                Log.Warn($"[LongDistancePathfinder] Path too long ({fullPath.Count} tiles), truncating to {MAX_PATH_LENGTH} tiles");
+                Report(output, $"Path too long, using partial path ({MAX_PATH_LENGTH} tiles)");
+                fullPath = fullPath.GetRange(0, MAX_PATH_LENGTH);
+            }
+
+            // Add ALL tiles to the queue - this is the full tile-by-tile path
+            Point? previousPoint = null;
+            for (int i = alreadyQueued; i < fullPath.Count; i++)
+            {
+                Point point = fullPath[i];
+
+                if (previousPoint.HasValue)
+                {
+                    int stepDistance = GetDistance(point.X, point.Y, previousPoint.Value.X, previousPoint.Value.Y);
+                    if (stepDistance > 2) Log.Warn($"[LongDistancePathfinder] Large step detected in path: from ({previousPoint.Value.X}, {previousPoint.Value.Y}) to ({point.X}, {point.Y}), distance: {stepDistance}");
+                }
+                output.Add(point);
+                previousPoint = point;
+            }
+
+            // Always add the exact target as final destination (even if not walkable, regular pathfinder will handle it)
+            Point lastPoint = fullPath[fullPath.Count - 1];
+            if (lastPoint.X != targetX || lastPoint.Y != targetY)
+            {
+                output.Add(new Point(targetX, targetY));
+                Log.Debug($"[LongDistancePathfinder] Added exact target ({targetX}, {targetY}) as final tile");
+            }
+
+            Log.Debug($"[LongDistancePathfinder] Added {output.Count} tiles to full path queue");
+        }
+
+        private static (int, int, int, int, int) RouteKey(int mapIndex, int startX, int startY, int targetX, int targetY) => (mapIndex, startX >> 3, startY >> 3, targetX, targetY);
+
+        /// <summary>
+        /// Look for a recently solved route from near the start to the same target, then ask the map's routing graph.
+        /// Both only use generated walkable data so they never touch the world from this background thread.
+        /// </summary>
+        /// <param name="onTile">Called with each tile of a routed path as soon as it is known, cached routes are only returned</param>
+        /// <returns>A full tile path, or null to fall back to the tile by tile search</returns>
+        private static List<Point> FindCachedOrRoutedPath(int mapIndex, int startX, int startY, int targetX, int targetY, Action<Point> onTile, CancellationToken cancellationToken)
+        {
+            if (mapIndex < 0)
+                return null;
+
+            (int, int, int, int, int) key = RouteKey(mapIndex, startX, startY, targetX, targetY);
+            bool CanWalk(int x, int y) => WalkableManager.Instance.IsKnownWalkable(mapIndex, x, y);
+
+            if (_routeCache.TryGet(key, out List<Point> cached))
+            {
+                // Join the cached route at the tile closest to where the player is now
+                int best = 0;
+                int bestDistance = int.MaxValue;
+
+                for (int i = 0; i < cached.Count && i < ROUTE_CACHE_START_SEARCH; i++)
+                {
+                    int d = GetDistance(startX, startY, cached[i].X, cached[i].Y);
+
+                    if (d < bestDistance)
+                    {
+                        best = i;
+                        bestDistance = d;
+                    }
+                }
+
+                bool valid = bestDistance <= REGULAR_PATHFINDER_MAX_RANGE;
+
+                for (int i = best + 1; valid && i < cached.Count; i++)
+                    valid = CanWalk(cached[i].X, cached[i].Y);
+
+                if (valid)
+                {
+                    Log.Info($"[LongDistancePathfinder] Reusing cached route to ({targetX}, {targetY}), {cached.Count - best} tiles");
+                    return cached.GetRange(best, cached.Count - best);
+                }
+
+                _routeCache.Remove(key);
+            }
+
+            WalkableClusterGraph graph = WalkableManager.Instance.GetClusterGraph(mapIndex);
+
+            if (graph == null)
+                return null;
+
+            var stopwatch = Stopwatch.StartNew();
+            List<Point> path = graph.FindPath(startX, startY, targetX, targetY, CanWalk, cancellationToken, onTile);
+            Log.Info($"[LongDistancePathfinder] Routing graph search took {stopwatch.Elapsed.TotalMilliseconds:F1}ms, found: {path != null}, clusters built: {graph.ClusterCount}");
+
+            if (path != null)
+                _routeCache.Set(key, path);
+
+            return path;
+        }
+
+        /// <summary>
+        /// Print a message for the walker, background requests keep it on the request instead.
+        /// </summary>
+        private static void Report(PathRequest output, string message)
+        {
+            if (output.CanWalk != null)
+                output.Report(message);
+            else
+                MainThreadQueue.EnqueueAction(() => GameActions.Print(message));
+        }
+
+        private static void GenerateNeighborsForFullPath(LongPathNode currentNode, PriorityQueue<LongPathNode, int> openSet, Dictionary<(int x, int y), LongPathNode> closedSet, TargetPosition target, Func<int, int, bool> canWalk)
         {
             // Use single-tile steps for full path generation
             const int stepSize = 1;
 
-            // Capture target position atomically
-            TargetPosition target = _target;
-
             // Calculate direction to target for prioritization
             int deltaX = target.X - currentNode.X;
             int deltaY = target.Y - currentNode.Y;
@@ -819,7 +1116,7 @@ namespace ClassicUO.Game
             // Try preferred directions first
             foreach (int dir in directions)
             {
-                if (TryAddNeighbor(dir, stepSize, currentNode, openSet, closedSet, target))
+                if (TryAddNeighbor(dir, stepSize, currentNode, openSet, closedSet, target, canWalk))
                 {
                     foundGoodDirection = true;
                     neighborsGenerated++;
@@ -833,7 +1130,7 @@ namespace ClassicUO.Game
                 {
                     if (directions.Contains(dir)) continue; // Already tried
 
-                    if (TryAddNeighbor(dir, stepSize, currentNode, openSet, closedSet, target))
+                    if (TryAddNeighbor(dir, stepSize, currentNode, openSet, closedSet, target, canWalk))
                     {
                         neighborsGenerated++;
                     }
@@ -848,7 +1145,7 @@ namespace ClassicUO.Game
         /// </summary>
         /// <returns>True if the neighbor was added successfully, false otherwise.</returns>
         private static bool TryAddNeighbor(int dir, int stepSize, LongPathNode currentNode,
-            PriorityQueue<LongPathNode, int> openSet, Dictionary<(int x, int y), LongPathNode> closedSet, TargetPosition target)
+            PriorityQueue<LongPathNode, int> openSet, Dictionary<(int x, int y), LongPathNode> closedSet, TargetPosition target, Func<int, int, bool> canWalk)
         {
             // Calculate direction offsets (single tile moves)
             (int newX, int newY) = ApplyDirectionOffset(currentNode.X, currentNode.Y, dir, stepSize);
@@ -862,7 +1159,7 @@ namespace ClassicUO.Game
                 return false;
 
             // Check if the tile is walkable using our walkable manager
-            bool walkable = IsGenerallyWalkable(newX, newY);
+            bool walkable = canWalk(newX, newY);
             if (!walkable)
                 return false;
 
@@ -934,7 +1231,7 @@ namespace ClassicUO.Game
         /// then fills in all tiles along the straight line segments.
         /// This creates straighter paths when direct lines are walkable.
         /// </summary>
-        private static List<Point> SmoothPath(List<Point> path)
+        private static List<Point> SmoothPath(List<Point> path, Func<int, int, bool> canWalk)
         {
             return path; //Disabled for now, not sure it's helping
             if (path == null || path.Count <= 2)
@@ -952,7 +1249,7 @@ namespace ClassicUO.Game
                 // Try to find the furthest point we can reach in a straight line
                 for (int i = currentIndex + 2; i < path.Count; i++)
                 {
-                    if (HasLineOfSight(path[currentIndex], path[i]))
+                    if (HasLineOfSight(path[currentIndex], path[i], canWalk))
                     {
                         furthestIndex = i;
                     }
@@ -1023,7 +1320,7 @@ namespace ClassicUO.Game
         /// Checks if there's a clear walkable line of sight between two points.
         /// Uses the same diagonal movement approach as GenerateLineSegment to ensure consistency.
         /// </summary>
-        private static bool HasLineOfSight(Point start, Point end)
+        private static bool HasLineOfSight(Point start, Point end, Func<int, int, bool> canWalk)
         {
             int x = start.X;
             int y = start.Y;
@@ -1041,7 +1338,7 @@ namespace ClassicUO.Game
                 y += dy;
 
                 // Check if this tile is walkable
-                if (!IsGenerallyWalkable(x, y))
+                if (!canWalk(x, y))
                     return false;
             }
 
@@ -1066,7 +1363,7 @@ namespace ClassicUO.Game
             return bestNode;
         }
 
-        private static List<Point> CreateDirectPathWithAvoidance(int startX, int startY, int targetX, int targetY)
+        private static List<Point> CreateDirectPathWithAvoidance(int startX, int startY, int targetX, int targetY, Func<int, int, bool> canWalk)
         {
             var path = new List<Point>();
 
@@ -1092,7 +1389,7 @@ namespace ClassicUO.Game
                     nextY += dy;
 
                 // Check if the next position is walkable
-                if (IsGenerallyWalkable(nextX, nextY))
+                if (canWalk(nextX, nextY))
                 {
                     currentX = nextX;
                     currentY = nextY;
@@ -1103,12 +1400,12 @@ namespace ClassicUO.Game
                     bool moved = false;
 
                     // Try horizontal then vertical
-                    if (currentX != targetX && IsGenerallyWalkable(currentX + dx, currentY))
+                    if (currentX != targetX && canWalk(currentX + dx, currentY))
                     {
                         currentX += dx;
                         moved = true;
                     }
-                    else if (currentY != targetY && IsGenerallyWalkable(currentX, currentY + dy))
+                    else if (currentY != targetY && canWalk(currentX, currentY + dy))
                     {
                         currentY += dy;
                         moved = true;
@@ -84,6 +84,18 @@ namespace ClassicUO.Game.Managers
         internal static event EventHandler<OPLEventArgs> OPLOnReceive;
         internal static void InvokeOPLOnReceive(object sender, OPLEventArgs e) => OPLOnReceive?.Invoke(sender, e);
 
+        /// <summary>
+        /// Invoked when the target cursor is set or cleared, the argument is true while targeting
+        /// </summary>
+        internal static event EventHandler<bool> OnTargetCursorChanged;
+        internal static void InvokeOnTargetCursorChanged(object sender, bool isTargeting) => OnTargetCursorChanged?.Invoke(sender, isTargeting);
+
+        /// <summary>
+        /// Invoked when a gump is added to the UI, sender is the Gump
+        /// </summary>
+        internal static event EventHandler<EventArgs> OnGumpAdded;
+        internal static void InvokeOnGumpAdded(object sender) => OnGumpAdded?.Invoke(sender, EventArgs.Empty);
+
         /// <summary>
         /// Invoked when a buff is "added" to a player
         /// </summary>
@@ -1,44 +1,77 @@
 using System;
-using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.Globalization;
 using System.IO;
-using System.Linq;
-using System.Text;
+using System.Threading;
+using System.Threading.Channels;
 using System.Threading.Tasks;
-using System.Timers;
 using ClassicUO.Configuration;
 using ClassicUO.Game.Data;
 using ClassicUO.Game.GameObjects;
 using ClassicUO.Utility.Logging;
 using Microsoft.Data.Sqlite;
 using Lock = System.Threading.Lock;
-using Timer = System.Timers.Timer;
 
 namespace ClassicUO.Game.Managers
 {
     public sealed class ItemDatabaseManager : IDisposable
     {
-        private const int PENDING_ITEMS_FLUSH_INTERVAL_MS = 3000;
-        private const int MAX_BATCH_SIZE = 500;
+        private const int PENDING_ITEMS_CAPACITY = 50000;
+        private const int BATCH_COLLECT_DELAY_MS = 500;
+        private const int MAX_BATCH_SIZE = 2000;
         private const int MAX_SEARCH_LIMIT = 10000;
+        // The trigram index can't match shorter text, those searches only use LIKE
+        private const int MIN_FULL_TEXT_LENGTH = 3;
 
         private static readonly Lazy<ItemDatabaseManager> _instance = new(() => new ItemDatabaseManager());
 
         private readonly Lock _dbLock = new();
-        private readonly Lock _timerLock = new();
         private readonly string _databasePath;
         private string _connectionString;
         private bool _initialized;
         private bool _disposed;
-        private readonly ConcurrentQueue<ItemInfo> _pendingItems = new();
-        private Timer _pendingItemsTimer;
+        private bool _fullTextSearch;
+        private readonly Channel<ItemInfo> _pendingItems;
+        private Task _writerTask;
+        private long _rowsWritten;
+        private long _droppedItems;
+        private double _rowsPerSecond;
 
         public static ItemDatabaseManager Instance => _instance.Value;
 
+        /// <summary>
+        /// Items waiting to be written.
+        /// </summary>
+        public int QueueDepth => _pendingItems.Reader.Count;
+
+        /// <summary>
+        /// Rows written since the client started.
+        /// </summary>
+        public long RowsWritten => Interlocked.Read(ref _rowsWritten);
+
+        /// <summary>
+        /// Items dropped because the queue was full, oldest first.
+        /// </summary>
+        public long DroppedItems => Interlocked.Read(ref _droppedItems);
+
+        /// <summary>
+        /// How many rows a second the writer manages while writing, averaged over recent batches.
+        /// </summary>
+        public double RowsPerSecond => Volatile.Read(ref _rowsPerSecond);
+
         private ItemDatabaseManager()
         {
             _databasePath = Path.Combine(CUOEnviroment.ExecutablePath, "Data", "items.db");
+            _pendingItems = Channel.CreateBounded<ItemInfo>
+            (
+                new BoundedChannelOptions(PENDING_ITEMS_CAPACITY)
+                {
+                    FullMode = BoundedChannelFullMode.DropOldest,
+                    SingleReader = true
+                },
+                _ => Interlocked.Increment(ref _droppedItems)
+            );
         }
 
         public void Initialize()
@@ -52,6 +85,7 @@ namespace ClassicUO.Game.Managers
                 _connectionString = $"Data Source={_databasePath}";
                 CreateDatabaseIfNotExists();
                 _initialized = true;
+                _writerTask = Task.Run(WritePendingItemsAsync);
                 Log.Trace($"ItemDatabaseManager initialized with database at: {_databasePath}");
             }
             catch (Exception ex)
@@ -103,7 +137,8 @@ namespace ClassicUO.Game.Managers
             string characterName = null,
             string serverName = null,
             bool? onGround = null,
-            int limit = 1000)
+            int limit = 1000,
+            ItemInfo after = null)
         {
             Profile profile = ProfileManager.CurrentProfile;
             if (!_initialized || profile == null || !profile.ItemDatabaseEnabled)
@@ -150,16 +185,27 @@ namespace ClassicUO.Game.Managers
                             parameters.Add(("@Hue", hue.Value));
                         }
 
+                        var fullTextTerms = new List<string>();
+
                         if (!string.IsNullOrEmpty(name))
                         {
                             whereConditions.Add("Name LIKE @Name ESCAPE '\\' COLLATE NOCASE");
                             parameters.Add(("@Name", $"%{EscapeLikePattern(name)}%"));
+                            AddFullTextTerm(fullTextTerms, "Name", name);
                         }
 
                         if (!string.IsNullOrEmpty(properties))
                         {
                             whereConditions.Add("Properties LIKE @Properties ESCAPE '\\' COLLATE NOCASE");
                             parameters.Add(("@Properties", $"%{EscapeLikePattern(properties)}%"));
+                            AddFullTextTerm(fullTextTerms, "Properties", properties);
+                        }
+
+                        // The index narrows the rows down first, the LIKE conditions above keep the results exactly as before
+                        if (fullTextTerms.Count > 0)
+                        {
+                            whereConditions.Add("Serial IN (SELECT rowid FROM ItemsFts WHERE ItemsFts MATCH @FullText)");
+                            parameters.Add(("@FullText", string.Join(" AND ", fullTextTerms)));
                         }
 
                         if (container.HasValue)
@@ -210,11 +256,18 @@ namespace ClassicUO.Game.Managers
                             parameters.Add(("@OnGround", onGround.Value ? 1 : 0));
                         }
 
+                        if (after != null)
+                        {
+                            whereConditions.Add("(UpdatedTime < @AfterTime OR (UpdatedTime = @AfterTime AND Serial < @AfterSerial))");
+                            parameters.Add(("@AfterTime", after.UpdatedTime.ToString("yyyy-MM-dd HH:mm:ss", CultureInfo.InvariantCulture)));
+                            parameters.Add(("@AfterSerial", after.Serial));
+                        }
+
                         string selectQuery = @"SELECT * FROM Items";
 
                         if (whereConditions.Count > 0) selectQuery += " WHERE " + string.Join(" AND ", whereConditions);
 
-                        selectQuery += " ORDER BY UpdatedTime DESC";
+                        selectQuery += " ORDER BY UpdatedTime DESC, Serial DESC";
 
                         if (limit > 0) selectQuery += $" LIMIT {limit}";
 
@@ -329,18 +382,7 @@ namespace ClassicUO.Game.Managers
                 }
             }
 
-            _pendingItems.Enqueue(itemInfo);
-
-            lock (_timerLock)
-            {
-                if (_pendingItemsTimer != null)
-                    return;
-
-                _pendingItemsTimer = new Timer(PENDING_ITEMS_FLUSH_INTERVAL_MS);
-                _pendingItemsTimer.AutoReset = false;
-                _pendingItemsTimer.Elapsed += PendingItemsTimerOnElapsed;
-                _pendingItemsTimer.Start();
-            }
+            _pendingItems.Writer.TryWrite(itemInfo);
         }
 
         /// <summary>
@@ -352,6 +394,11 @@ namespace ClassicUO.Game.Managers
         {
             var connection = new SqliteConnection(_connectionString);
             connection.Open();
+
+            // WAL only needs a full sync at checkpoints, a crash can at most lose the last few batches
+            using var pragmaCommand = new SqliteCommand("PRAGMA synchronous = NORMAL", connection);
+            pragmaCommand.ExecuteNonQuery();
+
             return connection;
         }
 
@@ -361,6 +408,9 @@ namespace ClassicUO.Game.Managers
             {
                 using SqliteConnection connection = GetOpenConnection();
 
+                using (var walCommand = new SqliteCommand("PRAGMA journal_mode = WAL", connection))
+                    walCommand.ExecuteNonQuery();
+
                 string createTableQuery = """
                                               CREATE TABLE IF NOT EXISTS Items (
                                                   Serial INTEGER PRIMARY KEY,
@@ -434,101 +484,199 @@ namespace ClassicUO.Game.Managers
 
                 using var indexCommand = new SqliteCommand(createIndexQuery, connection);
                 indexCommand.ExecuteNonQuery();
+
+                CreateFullTextIndex(connection);
             }
         }
 
-        private async Task AddOrUpdateItemsAsync(IEnumerable<ItemInfo> items)
+        /// <summary>
+        /// Trigram full text index over Name and Properties, kept in sync with Items by triggers.
+        /// Trigrams match any substring, so searches find the same items the LIKE filters do.
+        /// </summary>
+        private void CreateFullTextIndex(SqliteConnection connection)
         {
-            Profile profile = ProfileManager.CurrentProfile;
-            if (!_initialized || profile == null || !profile.ItemDatabaseEnabled)
-                return;
-
-            await Task.Run(() =>
+            try
             {
-                try
+                bool exists;
+
+                using (var checkCommand = new SqliteCommand("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ItemsFts'", connection))
+                    exists = checkCommand.ExecuteScalar() != null;
+
+                string createFullTextQuery = """
+                                                 CREATE VIRTUAL TABLE IF NOT EXISTS ItemsFts USING fts5(
+                                                     Name, Properties, content = 'Items', content_rowid = 'Serial', tokenize = 'trigram'
+                                                 );
+                                                 CREATE TRIGGER IF NOT EXISTS items_fts_insert AFTER INSERT ON Items BEGIN
+                                                     INSERT INTO ItemsFts(rowid, Name, Properties) VALUES (new.Serial, new.Name, new.Properties);
+                                                 END;
+                                                 CREATE TRIGGER IF NOT EXISTS items_fts_delete AFTER DELETE ON Items BEGIN
+                                                     INSERT INTO ItemsFts(ItemsFts, rowid, Name, Properties) VALUES ('delete', old.Serial, old.Name, old.Properties);
+                                                 END;
+                                                 CREATE TRIGGER IF NOT EXISTS items_fts_update AFTER UPDATE OF Name, Properties ON Items
+                                                 WHEN old.Name IS NOT new.Name OR old.Properties IS NOT new.Properties BEGIN
+                                                     INSERT INTO ItemsFts(ItemsFts, rowid, Name, Properties) VALUES ('delete', old.Serial, old.Name, old.Properties);
+                                                     INSERT INTO ItemsFts(rowid, Name, Properties) VALUES (new.Serial, new.Name, new.Properties);
+                                                 END;
+                                             """;
+
+                using (var createCommand = new SqliteCommand(createFullTextQuery, connection))
+                    createCommand.ExecuteNonQuery();
+
+                // Index the items saved before the index existed
+                if (!exists)
                 {
-                    lock (_dbLock)
-                    {
-                        using SqliteConnection connection = GetOpenConnection();
+                    using var rebuildCommand = new SqliteCommand("INSERT INTO ItemsFts(ItemsFts) VALUES ('rebuild')", connection);
+                    rebuildCommand.ExecuteNonQuery();
+                    Log.Trace("Built item database full text index");
+                }
+
+                _fullTextSearch = true;
+            }
+            catch (SqliteException ex)
+            {
+                Log.Warn($"Item database full text index not available, name and property searches will be slower: {ex.Message}");
+            }
+        }
 
-                        using SqliteTransaction transaction = connection.BeginTransaction();
+        private void AddFullTextTerm(List<string> terms, string column, string text)
+        {
+            if (!_fullTextSearch || text.Length < MIN_FULL_TEXT_LENGTH)
+                return;
 
-                        List<ItemInfo> itemList = items as List<ItemInfo> ?? items.ToList();
-                        if (itemList.Count == 0)
-                        {
-                            transaction.Commit();
-                            return;
-                        }
+            terms.Add($"{column} : \"{text.Replace("\"", "\"\"")}\"");
+        }
 
-                        using var command = new SqliteCommand();
-                        command.Connection = connection;
-                        command.Transaction = transaction;
+        private async Task WritePendingItemsAsync()
+        {
+            ChannelReader<ItemInfo> reader = _pendingItems.Reader;
+            var batch = new Dictionary<uint, ItemInfo>();
 
-                        // Build batch INSERT using StringBuilder
-                        var sqlBuilder = new StringBuilder(itemList.Count * 200);
-                        sqlBuilder.AppendLine("INSERT INTO Items");
-                        sqlBuilder.AppendLine("(Serial, Graphic, Hue, Name, Properties, Container, Layer, UpdatedTime, Character, CharacterName, ServerName, X, Y, OnGround, CustomName)");
-                        sqlBuilder.Append("VALUES");
+            while (await reader.WaitToReadAsync())
+            {
+                // Let bursts like opening a bank arrive so they are written in one transaction
+                if (reader.Count < MAX_BATCH_SIZE && !_disposed)
+                    await Task.Delay(BATCH_COLLECT_DELAY_MS);
 
-                        for (int i = 0; i < itemList.Count; i++)
-                        {
-                            ItemInfo item = itemList[i];
-                            string suffix = i.ToString();
-
-                            if (i > 0)
-                                sqlBuilder.Append(',');
-
-                            sqlBuilder.AppendLine();
-                            sqlBuilder.Append($"(@Serial{suffix}, @Graphic{suffix}, @Hue{suffix}, @Name{suffix}, @Properties{suffix}, @Container{suffix}, @Layer{suffix}, @UpdatedTime{suffix}, @Character{suffix}, @CharacterName{suffix}, @ServerName{suffix}, @X{suffix}, @Y{suffix}, @OnGround{suffix}, @CustomName{suffix})");
-
-                            command.Parameters.AddWithValue($"@Serial{suffix}", item.Serial);
-                            command.Parameters.AddWithValue($"@Graphic{suffix}", item.Graphic);
-                            command.Parameters.AddWithValue($"@Hue{suffix}", item.Hue);
-                            command.Parameters.AddWithValue($"@Name{suffix}", item.Name ?? string.Empty);
-                            command.Parameters.AddWithValue($"@Properties{suffix}", item.Properties ?? string.Empty);
-                            command.Parameters.AddWithValue($"@Container{suffix}", item.Container);
-                            command.Parameters.AddWithValue($"@Layer{suffix}", (int)item.Layer);
-                            command.Parameters.AddWithValue($"@UpdatedTime{suffix}", item.UpdatedTime.ToString("yyyy-MM-dd HH:mm:ss", CultureInfo.InvariantCulture));
-                            command.Parameters.AddWithValue($"@Character{suffix}", item.Character);
-                            command.Parameters.AddWithValue($"@CharacterName{suffix}", item.CharacterName ?? string.Empty);
-                            command.Parameters.AddWithValue($"@ServerName{suffix}", item.ServerName ?? string.Empty);
-                            command.Parameters.AddWithValue($"@X{suffix}", item.X);
-                            command.Parameters.AddWithValue($"@Y{suffix}", item.Y);
-                            command.Parameters.AddWithValue($"@OnGround{suffix}", item.OnGround ? 1 : 0);
-                            command.Parameters.AddWithValue($"@CustomName{suffix}", item.CustomName ?? string.Empty);
-                        }
+                while (batch.Count < MAX_BATCH_SIZE && reader.TryRead(out ItemInfo item))
+                {
+                    if (batch.TryGetValue(item.Serial, out ItemInfo queued))
+                        KeepKnownText(item, queued);
 
-                        sqlBuilder.AppendLine();
-                        sqlBuilder.AppendLine("""
-                                              ON CONFLICT(Serial) DO UPDATE SET
-                                                                          Graphic = excluded.Graphic,
-                                                                          Hue = excluded.Hue,
-                                                                          Name = CASE WHEN excluded.Name = '' THEN Items.Name ELSE excluded.Name END,
-                                                                          Properties = CASE WHEN excluded.Properties = '' THEN Items.Properties ELSE excluded.Properties END,
-                                                                          Container = excluded.Container,
-                                                                          Layer = excluded.Layer,
-                                                                          UpdatedTime = excluded.UpdatedTime,
-                                                                          Character = excluded.Character,
-                                                                          CharacterName = CASE WHEN excluded.CharacterName = '' THEN Items.CharacterName ELSE excluded.CharacterName END,
-                                                                          ServerName = CASE WHEN excluded.ServerName = '' THEN Items.ServerName ELSE excluded.ServerName END,
-                                                                          X = excluded.X,
-                                                                          Y = excluded.Y,
-                                                                          OnGround = excluded.OnGround,
-                                                                          CustomName = CASE WHEN excluded.CustomName = '' THEN Items.CustomName ELSE excluded.CustomName END
-
-                                              """);
-
-                        command.CommandText = sqlBuilder.ToString();
-                        command.ExecuteNonQuery();
-
-                        transaction.Commit();
-                    }
+                    batch[item.Serial] = item;
+                }
+
+                try
+                {
+                    WriteItems(batch.Values);
                 }
                 catch (Exception ex)
                 {
                     Log.Error($"Failed to add/update items in database: {ex}");
                 }
-            });
+
+                batch.Clear();
+            }
+        }
+
+        /// <summary>
+        /// Same rule the upsert applies against the saved row, empty text doesn't replace known text.
+        /// </summary>
+        private static void KeepKnownText(ItemInfo item, ItemInfo previous)
+        {
+            if (string.IsNullOrEmpty(item.Name))
+                item.Name = previous.Name;
+            if (string.IsNullOrEmpty(item.Properties))
+                item.Properties = previous.Properties;
+            if (string.IsNullOrEmpty(item.CharacterName))
+                item.CharacterName = previous.CharacterName;
+            if (string.IsNullOrEmpty(item.ServerName))
+                item.ServerName = previous.ServerName;
+            if (string.IsNullOrEmpty(item.CustomName))
+                item.CustomName = previous.CustomName;
+        }
+
+        private void WriteItems(ICollection<ItemInfo> items)
+        {
+            if (!_initialized || items.Count == 0)
+                return;
+
+            lock (_dbLock)
+            {
+                long startTicks = Stopwatch.GetTimestamp();
+
+                using SqliteConnection connection = GetOpenConnection();
+                using SqliteTransaction transaction = connection.BeginTransaction();
+
+                string upsertQuery = """
+                                         INSERT INTO Items
+                                         (Serial, Graphic, Hue, Name, Properties, Container, Layer, UpdatedTime, Character, CharacterName, ServerName, X, Y, OnGround, CustomName)
+                                         VALUES (@Serial, @Graphic, @Hue, @Name, @Properties, @Container, @Layer, @UpdatedTime, @Character, @CharacterName, @ServerName, @X, @Y, @OnGround, @CustomName)
+                                         ON CONFLICT(Serial) DO UPDATE SET
+                                             Graphic = excluded.Graphic,
+                                             Hue = excluded.Hue,
+                                             Name = CASE WHEN excluded.Name = '' THEN Items.Name ELSE excluded.Name END,
+                                             Properties = CASE WHEN excluded.Properties = '' THEN Items.Properties ELSE excluded.Properties END,
+                                             Container = excluded.Container,
+                                             Layer = excluded.Layer,
+                                             UpdatedTime = excluded.UpdatedTime,
+                                             Character = excluded.Character,
+                                             CharacterName = CASE WHEN excluded.CharacterName = '' THEN Items.CharacterName ELSE excluded.CharacterName END,
+                                             ServerName = CASE WHEN excluded.ServerName = '' THEN Items.ServerName ELSE excluded.ServerName END,
+                                             X = excluded.X,
+                                             Y = excluded.Y,
+                                             OnGround = excluded.OnGround,
+                                             CustomName = CASE WHEN excluded.CustomName = '' THEN Items.CustomName ELSE excluded.CustomName END
+                                     """;
+
+                using var command = new SqliteCommand(upsertQuery, connection, transaction);
+                SqliteParameter serial = command.Parameters.Add("@Serial", SqliteType.Integer);
+                SqliteParameter graphic = command.Parameters.Add("@Graphic", SqliteType.Integer);
+                SqliteParameter hue = command.Parameters.Add("@Hue", SqliteType.Integer);
+                SqliteParameter name = command.Parameters.Add("@Name", SqliteType.Text);
+                SqliteParameter properties = command.Parameters.Add("@Properties", SqliteType.Text);
+                SqliteParameter container = command.Parameters.Add("@Container", SqliteType.Integer);
+                SqliteParameter layer = command.Parameters.Add("@Layer", SqliteType.Integer);
+                SqliteParameter updatedTime = command.Parameters.Add("@UpdatedTime", SqliteType.Text);
+                SqliteParameter character = command.Parameters.Add("@Character", SqliteType.Integer);
+                SqliteParameter characterName = command.Parameters.Add("@CharacterName", SqliteType.Text);
+                SqliteParameter serverName = command.Parameters.Add("@ServerName", SqliteType.Text);
+                SqliteParameter x = command.Parameters.Add("@X", SqliteType.Integer);
+                SqliteParameter y = command.Parameters.Add("@Y", SqliteType.Integer);
+                SqliteParameter onGround = command.Parameters.Add("@OnGround", SqliteType.Integer);
+                SqliteParameter customName = command.Parameters.Add("@CustomName", SqliteType.Text);
+                command.Prepare();
+
+                foreach (ItemInfo item in items)
+                {
+                    serial.Value = item.Serial;
+                    graphic.Value = item.Graphic;
+                    hue.Value = item.Hue;
+                    name.Value = item.Name ?? string.Empty;
+                    properties.Value = item.Properties ?? string.Empty;
+                    container.Value = item.Container;
+                    layer.Value = (int)item.Layer;
+                    updatedTime.Value = item.UpdatedTime.ToString("yyyy-MM-dd HH:mm:ss", CultureInfo.InvariantCulture);
+                    character.Value = item.Character;
+                    characterName.Value = item.CharacterName ?? string.Empty;
+                    serverName.Value = item.ServerName ?? string.Empty;
+                    x.Value = item.X;
+                    y.Value = item.Y;
+                    onGround.Value = item.OnGround ? 1 : 0;
+                    customName.Value = item.CustomName ?? string.Empty;
+
+                    command.ExecuteNonQuery();
+                }
+
+                transaction.Commit();
+
+                double seconds = Math.Max(Stopwatch.GetElapsedTime(startTicks).TotalSeconds, 0.001);
+                double rate = items.Count / seconds;
+                double average = Volatile.Read(ref _rowsPerSecond);
+                Volatile.Write(ref _rowsPerSecond, average == 0 ? rate : average * 0.8 + rate * 0.2);
+                Interlocked.Add(ref _rowsWritten, items.Count);
+
+                Log.TraceDebug($"Wrote {items.Count} items to the database in {seconds * 1000:0} ms.");
+            }
         }
 
         private static string EscapeLikePattern(string input)
@@ -560,56 +708,6 @@ namespace ClassicUO.Game.Managers
             CustomName = reader["CustomName"].ToString() ?? string.Empty
         };
 
-        private void PendingItemsTimerOnElapsed(object sender, ElapsedEventArgs e) => Task.Run(async () =>
-                                                                                               {
-                                                                                                   try
-                                                                                                   {
-                                                                                                       await BulkPendingAsync();
-                                                                                                   }
-                                                                                                   catch (Exception ex)
-                                                                                                   {
-                                                                                                       Log.Error($"Error in bulk pending items processing: {ex}");
-                                                                                                   }
-                                                                                               });
-
-        private async Task BulkPendingAsync()
-        {
-            try
-            {
-                List<ItemInfo> items = new();
-                int c = 0;
-                while (_pendingItems.TryDequeue(out ItemInfo itemInfo) && c < MAX_BATCH_SIZE)
-                {
-                    items.Add(itemInfo);
-                    c++;
-                }
-
-                Log.TraceDebug($"Bulking {c} items.");
-
-                lock (_timerLock)
-                {
-                    if (_pendingItems.IsEmpty && _pendingItemsTimer != null)
-                    {
-                        _pendingItemsTimer.Elapsed -= PendingItemsTimerOnElapsed;
-                        _pendingItemsTimer.Dispose();
-                        _pendingItemsTimer = null;
-                    }
-                    else if (_pendingItemsTimer != null)
-                    {
-                        _pendingItemsTimer.Start();
-                    }
-                }
-
-                if (items.Count > 0)
-                {
-                    await AddOrUpdateItemsAsync(items);
-                }
-            }
-            catch
-            {
-            }
-        }
-
         public void Dispose()
         {
             if (_disposed)
@@ -617,36 +715,17 @@ namespace ClassicUO.Game.Managers
 
             _disposed = true;
 
-            lock (_timerLock)
+            // Write what is still queued, the writer stops once the queue is empty
+            _pendingItems.Writer.TryComplete();
+
+            try
             {
-                if (_pendingItemsTimer != null)
-                {
-                    _pendingItemsTimer.Elapsed -= PendingItemsTimerOnElapsed;
-                    _pendingItemsTimer.Dispose();
-                    _pendingItemsTimer = null;
-                }
+                if (_writerTask != null && !_writerTask.Wait(TimeSpan.FromSeconds(5)))
+                    Log.Warn($"Item database writer did not finish, {QueueDepth} items were not saved");
             }
-
-            // Flush remaining items synchronously
-            if (!_pendingItems.IsEmpty)
+            catch (Exception ex)
             {
-                var remainingItems = new List<ItemInfo>();
-                while (_pendingItems.TryDequeue(out ItemInfo item))
-                {
-                    remainingItems.Add(item);
-                }
-
-                if (remainingItems.Count > 0)
-                {
-                    try
-                    {
-                        Task.Run(() => AddOrUpdateItemsAsync(remainingItems)).Wait(TimeSpan.FromSeconds(5));
-                    }
-                    catch (Exception ex)
-                    {
-                        Log.Error($"Failed to flush pending items during disposal: {ex}");
-                    }
-                }
+                Log.Error($"Failed to flush pending items during disposal: {ex}");
             }
         }
     }
@@ -0,0 +1,115 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Threading;
+
+namespace ClassicUO.Game.Managers;
+
+/// <summary>
+/// A short lease on the main thread for a single worker thread.
+/// While a batch is open, every <see cref="MainThreadQueue"/> dispatch made by the owning thread is routed
+/// to this batch and executed back to back within the same main thread hop, instead of one per frame.
+/// </summary>
+public sealed class MainThreadBatch : IDisposable
+{
+    /// <summary>
+    /// Default upper bound for how long a batch may hold the main thread.
+    /// </summary>
+    public const int DEFAULT_MAX_HOLD_MS = 50;
+
+    private readonly Queue<Action> _actions = new();
+    private readonly object _sync = new();
+    private readonly int _maxHoldMs;
+    private readonly bool _isNoop;
+    private bool _open = true, _ended;
+
+    internal MainThreadBatch(int maxHoldMs, bool isNoop = false)
+    {
+        _maxHoldMs = Math.Max(1, maxHoldMs);
+        _isNoop = isNoop;
+    }
+
+    /// <summary>
+    /// Try to hand an action to the main thread serving this batch.
+    /// Returns false if the main thread has already released this batch, the caller should fall back to the normal queue.
+    /// </summary>
+    internal bool TryPost(Action action)
+    {
+        lock (_sync)
+        {
+            if (!_open || _ended)
+                return false;
+
+            _actions.Enqueue(action);
+            Monitor.Pulse(_sync);
+
+            return true;
+        }
+    }
+
+    /// <summary>
+    /// Must only be called on the main thread.
+    /// Runs posted actions until the batch is disposed or the hold time has elapsed.
+    /// </summary>
+    internal void Serve()
+    {
+        var sw = Stopwatch.StartNew();
+
+        try
+        {
+            while (true)
+            {
+                Action next;
+
+                lock (_sync)
+                {
+                    while (_actions.Count == 0)
+                    {
+                        int remaining = (int)(_maxHoldMs - sw.ElapsedMilliseconds);
+
+                        if (_ended || remaining <= 0)
+                        {
+                            _open = false;
+
+                            return;
+                        }
+
+                        Monitor.Wait(_sync, remaining);
+                    }
+
+                    next = _actions.Dequeue();
+                }
+
+                next();
+            }
+        }
+        finally
+        {
+            lock (_sync)
+            {
+                _open = false;
+
+                //Anything that slipped in after an exception still needs to run, otherwise the caller would wait forever
+                while (_actions.Count > 0)
+                    MainThreadQueue.EnqueueAction(_actions.Dequeue());
+            }
+        }
+    }
+
+    public void Dispose()
+    {
+        if (_isNoop)
+            return;
+
+        lock (_sync)
+        {
+            if (_ended)
+                return;
+
+            _ended = true;
+            Monitor.Pulse(_sync);
+        }
+
+        MainThreadQueue.EndBatch(this);
+    }
+}
@@ -1,5 +1,6 @@
 using System;
 using System.Collections.Concurrent;
+using System.Runtime.CompilerServices;
 using System.Threading;
 
 namespace ClassicUO.Game.Managers;
@@ -10,6 +11,15 @@ public static class MainThreadQueue
     private static bool _isMainThread => Thread.CurrentThread.ManagedThreadId == _threadId;
     private static ConcurrentQueue<Action> _queuedActions { get; } = new();
 
+    [ThreadStatic]
+    private static MainThreadBatch _currentBatch;
+
+    /// <summary>
+    /// Optional hook used to instrument dispatched calls, receives the action and the name of the calling member and returns the action to queue.
+    /// Called on the dispatching thread.
+    /// </summary>
+    internal static Func<Action, string, Action> DispatchHook;
+
     /// <summary>
     /// Must be called from main thread
     /// </summary>
@@ -21,6 +31,47 @@ public static class MainThreadQueue
     /// <param name="action"></param>
     public static void EnqueueAction(Action action) => _queuedActions.Enqueue(action);
 
+    /// <summary>
+    /// Open a batch for the calling thread. Until the returned batch is disposed, all invokes made from this thread
+    /// run back to back in a single main thread hop (bounded by <paramref name="maxHoldMs"/>).
+    /// Nested calls, or calls from the main thread, return a batch that does nothing.
+    /// </summary>
+    /// <param name="maxHoldMs">Max time the main thread will wait on this batch for more work</param>
+    /// <returns>The batch, dispose it to release the main thread</returns>
+    public static MainThreadBatch BeginBatch(int maxHoldMs = MainThreadBatch.DEFAULT_MAX_HOLD_MS)
+    {
+        if (_isMainThread || _currentBatch != null)
+            return new MainThreadBatch(maxHoldMs, true);
+
+        var batch = new MainThreadBatch(maxHoldMs);
+        _currentBatch = batch;
+        _queuedActions.Enqueue(batch.Serve);
+
+        return batch;
+    }
+
+    internal static void EndBatch(MainThreadBatch batch)
+    {
+        if (_currentBatch == batch)
+            _currentBatch = null;
+    }
+
+    /// <summary>
+    /// Queue an action for the main thread, preferring the calling thread's open batch if there is one.
+    /// </summary>
+    private static void Dispatch(Action action, string caller)
+    {
+        Func<Action, string, Action> hook = DispatchHook;
+
+        if (hook != null)
+            action = hook(action, caller);
+
+        if (_currentBatch != null && _currentBatch.TryPost(action))
+            return;
+
+        _queuedActions.Enqueue(action);
+    }
+
     /// <summary>
     ///     Wraps the given function with a try/catch, returning any caught exception
     /// </summary>
@@ -45,10 +96,11 @@ public static class MainThreadQueue
     /// </summary>
     /// <param name="func">The function to invoke on the main thread</param>
     /// <param name="cancellationToken">An optional cancellation token to interrupt result wait</param>
+    /// <param name="caller">Name of the calling member, used by <see cref="DispatchHook"/></param>
     /// <typeparam name="T"></typeparam>
     /// <returns>The result of the function's invocation</returns>
     /// <exception cref="Exception">The exception, if any, raised by the function invocation</exception>
-    private static T BubblingDispatchToMainThread<T>(Func<T> func, CancellationToken? cancellationToken = null)
+    private static T BubblingDispatchToMainThread<T>(Func<T> func, CancellationToken? cancellationToken, string caller)
     {
         // The MT is so slow there's no real point in spinning; Just wastes CPU.
         var resultEvent = new ManualResetEventSlim(false, 0);
@@ -56,7 +108,7 @@ public static class MainThreadQueue
         T mtResult = default;
         Exception ex = null;
 
-        _queuedActions.Enqueue(MtAction);
+        Dispatch(MtAction, caller);
 
         // Wait for the main thread to complete the operation
         resultEvent.Wait(cancellationToken ?? CancellationToken.None);
@@ -83,10 +135,10 @@ public static class MainThreadQueue
     /// <typeparam name="T"></typeparam>
     /// <returns>The function's result</returns>
     /// <exception cref="Exception">On any exception thrown by the given function</exception>
-    public static T BubblingInvokeOnMainThread<T>(Func<T> func, CancellationToken? cancellationToken = null) =>
+    public static T BubblingInvokeOnMainThread<T>(Func<T> func, CancellationToken? cancellationToken = null, [CallerMemberName] string caller = null) =>
         _isMainThread
             ? func()
-            : BubblingDispatchToMainThread(func, cancellationToken);
+            : BubblingDispatchToMainThread(func, cancellationToken, caller);
 
     /// <summary>
     /// This will wait for the returned result.
@@ -94,7 +146,7 @@ public static class MainThreadQueue
     /// <param name="func"></param>
     /// <typeparam name="T"></typeparam>
     /// <returns></returns>
-    public static T InvokeOnMainThread<T>(Func<T> func)
+    public static T InvokeOnMainThread<T>(Func<T> func, [CallerMemberName] string caller = null)
     {
         if (_isMainThread) return func();
 
@@ -102,7 +154,7 @@ public static class MainThreadQueue
         var resultEvent = new ManualResetEvent(false);
         T result = default;
 
-        _queuedActions.Enqueue(Action);
+        Dispatch(Action, caller);
 
         // Wait for the main thread to complete the operation
         resultEvent.WaitOne();
@@ -120,7 +172,7 @@ public static class MainThreadQueue
     /// This will not wait for the returned result.
     /// </summary>
     /// <param name="action"></param>
-    public static void InvokeOnMainThread(Action action)
+    public static void InvokeOnMainThread(Action action, [CallerMemberName] string caller = null)
     {
         if (_isMainThread)
         {
@@ -128,7 +180,7 @@ public static class MainThreadQueue
             return;
         }
 
-        _queuedActions.Enqueue(action);
+        Dispatch(action, caller);
     }
 
     /// <summary>
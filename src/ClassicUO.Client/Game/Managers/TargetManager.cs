@@ -229,6 +229,7 @@ namespace ClassicUO.Game.Managers
             }
 
             IsTargeting = false;
+            EventSink.InvokeOnTargetCursorChanged(this, false);
         }
 
         public void Reset()
@@ -274,6 +275,8 @@ namespace ClassicUO.Game.Managers
             // to send the last active cursorID, so update cursor data later
 
             _targetCursorId = cursorID;
+
+            EventSink.InvokeOnTargetCursorChanged(this, IsTargeting);
         }
 
         public static void SetAutoTarget(uint serial, TargetType targetType) => NextAutoTarget.Set(serial, targetType);
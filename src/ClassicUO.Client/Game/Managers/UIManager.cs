@@ -505,6 +505,8 @@ namespace ClassicUO.Game.Managers
                 _needSort = Gumps.Count > 1;
 
                 RegisterGump(gump);
+
+                EventSink.InvokeOnGumpAdded(gump);
             }
         }
 
@@ -0,0 +1,497 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.IO;
+using System.Threading;
+using Microsoft.Xna.Framework;
+
+namespace ClassicUO.Game.Managers
+{
+    /// <summary>
+    /// Hierarchical routing graph (HPA*) over a facet's walkable bitmap.
+    /// The map is split into square clusters, walkable openings on cluster borders become graph nodes and the walking
+    /// distance between every pair of nodes inside a cluster is precomputed. Long paths are found on this small graph first
+    /// and then refined tile by tile one cluster at a time.
+    /// Clusters are built the first time a search touches them and can be saved to disk. Safe to use from any thread.
+    /// </summary>
+    internal sealed class WalkableClusterGraph
+    {
+        public const int CLUSTER_SIZE = 32;
+        private const int CLUSTER_SHIFT = 5;
+        private const int FILE_VERSION = 1;
+        private const int LONG_ENTRANCE = 8; // Openings at least this wide get a node at each end instead of one in the middle
+        private const int MAX_EXPANSIONS = 500_000;
+        private const ushort UNREACHABLE = ushort.MaxValue;
+
+        private static readonly (int X, int Y)[] _steps = [(0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1)];
+
+        private readonly int _mapIndex;
+        private readonly int _width, _height;
+        private readonly Func<int, int, bool> _isWalkable;
+        private readonly ConcurrentDictionary<int, Cluster> _clusters = new();
+        private volatile bool _dirty;
+
+        /// <param name="mapIndex">Facet this graph belongs to</param>
+        /// <param name="width">Facet width in tiles</param>
+        /// <param name="height">Facet height in tiles</param>
+        /// <param name="isWalkable">Walkability the graph is built from, unknown tiles must return false</param>
+        public WalkableClusterGraph(int mapIndex, int width, int height, Func<int, int, bool> isWalkable)
+        {
+            _mapIndex = mapIndex;
+            _width = width;
+            _height = height;
+            _isWalkable = isWalkable;
+        }
+
+        public string MapChecksum { get; set; } = string.Empty;
+
+        public int ClusterCount => _clusters.Count;
+
+        public bool IsDirty => _dirty;
+
+        private sealed class Cluster
+        {
+            public int[] Nodes;
+            public ushort[] Distances; // Nodes.Length * Nodes.Length
+            public Dictionary<int, int> Index;
+
+            public Cluster(int[] nodes, ushort[] distances)
+            {
+                Nodes = nodes;
+                Distances = distances;
+                Index = new Dictionary<int, int>(nodes.Length);
+
+                for (int i = 0; i < nodes.Length; i++)
+                    Index[nodes[i]] = i;
+            }
+        }
+
+        /// <summary>
+        /// Find a tile path from start to target, including both ends.
+        /// </summary>
+        /// <param name="canWalk">Walkability used to refine the path into tiles, usually the graph's data plus session changes</param>
+        /// <param name="onTile">Called with each tile in order as soon as its part of the route is refined, before the whole path is done</param>
+        /// <returns>The path, or null if the graph doesn't connect the two points</returns>
+        public List<Point> FindPath(int startX, int startY, int targetX, int targetY, Func<int, int, bool> canWalk, CancellationToken cancellationToken, Action<Point> onTile = null)
+        {
+            if (!InBounds(startX, startY) || !InBounds(targetX, targetY) || !_isWalkable(targetX, targetY))
+                return null;
+
+            int start = Pack(startX, startY);
+            int goal = Pack(targetX, targetY);
+            int startCluster = ClusterKeyOf(start);
+            int goalCluster = ClusterKeyOf(goal);
+
+            if (startCluster == goalCluster)
+            {
+                List<Point> local = RefineSegment(start, goal, canWalk);
+
+                if (local != null)
+                {
+                    if (onTile != null)
+                        foreach (Point tile in local)
+                            onTile(tile);
+
+                    return local;
+                }
+            }
+
+            // Virtual edges from the start to its cluster's nodes and from the goal cluster's nodes to the goal
+            Dictionary<int, int> fromStart = DistancesWithinCluster(start, GetCluster(startCluster), _isWalkable);
+            Dictionary<int, int> toGoal = DistancesWithinCluster(goal, GetCluster(goalCluster), _isWalkable);
+
+            if (fromStart.Count == 0 || toGoal.Count == 0)
+                return null;
+
+            var g = new Dictionary<int, int>();
+            var parent = new Dictionary<int, int>();
+            var open = new PriorityQueue<int, int>();
+
+            foreach (KeyValuePair<int, int> kv in fromStart)
+            {
+                g[kv.Key] = kv.Value;
+                parent[kv.Key] = start;
+                open.Enqueue(kv.Key, kv.Value + Heuristic(kv.Key, goal));
+            }
+
+            int bestGoal = int.MaxValue;
+            int bestLast = -1;
+            int expansions = 0;
+            var closed = new HashSet<int>();
+
+            while (open.TryDequeue(out int node, out int f))
+            {
+                if (f >= bestGoal)
+                    break;
+
+                if (!closed.Add(node))
+                    continue;
+
+                if (++expansions > MAX_EXPANSIONS || cancellationToken.IsCancellationRequested)
+                    return null;
+
+                int gNode = g[node];
+
+                if (toGoal.TryGetValue(node, out int last) && gNode + last < bestGoal)
+                {
+                    bestGoal = gNode + last;
+                    bestLast = node;
+                }
+
+                Cluster cluster = GetCluster(ClusterKeyOf(node));
+                int i = cluster.Index[node];
+                int n = cluster.Nodes.Length;
+
+                for (int j = 0; j < n; j++)
+                {
+                    ushort d = cluster.Distances[i * n + j];
+
+                    if (j != i && d != UNREACHABLE)
+                        Relax(cluster.Nodes[j], gNode + d);
+                }
+
+                UnpackInto(node, out int x, out int y);
+
+                foreach ((int dx, int dy) in _steps)
+                {
+                    int nx = x + dx, ny = y + dy;
+
+                    if (!InBounds(nx, ny))
+                        continue;
+
+                    int neighbour = Pack(nx, ny);
+                    int neighbourCluster = ClusterKeyOf(neighbour);
+
+                    if (neighbourCluster != ClusterKeyOf(node) && GetCluster(neighbourCluster).Index.ContainsKey(neighbour))
+                        Relax(neighbour, gNode + 1);
+                }
+
+                void Relax(int next, int cost)
+                {
+                    if (closed.Contains(next) || (g.TryGetValue(next, out int old) && old <= cost))
+                        return;
+
+                    g[next] = cost;
+                    parent[next] = node;
+                    open.Enqueue(next, cost + Heuristic(next, goal));
+                }
+            }
+
+            if (bestLast < 0)
+                return null;
+
+            var abstractPath = new List<int> { goal };
+
+            for (int node = bestLast; node != start; node = parent[node])
+                abstractPath.Add(node);
+
+            abstractPath.Add(start);
+            abstractPath.Reverse();
+
+            var path = new List<Point> { new(startX, startY) };
+            onTile?.Invoke(path[0]);
+
+            for (int i = 1; i < abstractPath.Count; i++)
+            {
+                if (cancellationToken.IsCancellationRequested)
+                    return null;
+
+                List<Point> segment = RefineSegment(abstractPath[i - 1], abstractPath[i], canWalk);
+
+                if (segment == null)
+                    return null;
+
+                for (int j = 1; j < segment.Count; j++)
+                {
+                    path.Add(segment[j]);
+                    onTile?.Invoke(segment[j]);
+                }
+            }
+
+            return path;
+        }
+
+        /// <summary>
+        /// Walk between two points in the same cluster, or one step across a cluster border.
+        /// </summary>
+        private List<Point> RefineSegment(int from, int to, Func<int, int, bool> canWalk)
+        {
+            UnpackInto(from, out int fx, out int fy);
+            UnpackInto(to, out int tx, out int ty);
+
+            if (from == to)
+                return [new Point(fx, fy)];
+
+            if (ClusterKeyOf(from) != ClusterKeyOf(to))
+                return Math.Max(Math.Abs(tx - fx), Math.Abs(ty - fy)) == 1 && canWalk(tx, ty) ? [new Point(fx, fy), new Point(tx, ty)] : null;
+
+            GetClusterBounds(ClusterKeyOf(from), out int x0, out int y0, out int w, out int h);
+            int[] prev = Search(from, x0, y0, w, h, canWalk, out _, to);
+            int target = (ty - y0) * w + (tx - x0);
+
+            if (prev[target] == -1)
+                return null;
+
+            var path = new List<Point>();
+
+            for (int i = target; i != -2; i = prev[i])
+                path.Add(new Point(x0 + i % w, y0 + i / w));
+
+            path.Reverse();
+
+            return path;
+        }
+
+        private Dictionary<int, int> DistancesWithinCluster(int from, Cluster cluster, Func<int, int, bool> canWalk)
+        {
+            var result = new Dictionary<int, int>();
+            GetClusterBounds(ClusterKeyOf(from), out int x0, out int y0, out int w, out int h);
+            Search(from, x0, y0, w, h, canWalk, out int[] dist);
+
+            foreach (int node in cluster.Nodes)
+            {
+                UnpackInto(node, out int x, out int y);
+                int d = dist[(y - y0) * w + (x - x0)];
+
+                if (d >= 0)
+                    result[node] = d;
+            }
+
+            return result;
+        }
+
+        /// <summary>
+        /// Breadth first search inside a cluster. 8 way moves all cost 1, the same as the tile A* in <see cref="LongDistancePathfinder"/>.
+        /// </summary>
+        /// <returns>Previous cell of every reached cell, -2 for the start and -1 for unreached cells</returns>
+        private static int[] Search(int from, int x0, int y0, int w, int h, Func<int, int, bool> canWalk, out int[] dist, int stopAt = -1)
+        {
+            var prev = new int[w * h];
+            dist = new int[w * h];
+            Array.Fill(prev, -1);
+            Array.Fill(dist, -1);
+
+            UnpackInto(from, out int sx, out int sy);
+            int startCell = (sy - y0) * w + (sx - x0);
+            prev[startCell] = -2;
+            dist[startCell] = 0;
+
+            int stopCell = -1;
+
+            if (stopAt >= 0)
+            {
+                UnpackInto(stopAt, out int tx, out int ty);
+                stopCell = (ty - y0) * w + (tx - x0);
+            }
+
+            var queue = new Queue<int>();
+            queue.Enqueue(startCell);
+
+            while (queue.TryDequeue(out int cell))
+            {
+                if (cell == stopCell)
+                    break;
+
+                int cx = cell % w, cy = cell / w;
+
+                foreach ((int dx, int dy) in _steps)
+                {
+                    int nx = cx + dx, ny = cy + dy;
+
+                    if (nx < 0 || ny < 0 || nx >= w || ny >= h)
+                        continue;
+
+                    int next = ny * w + nx;
+
+                    if (prev[next] != -1 || !canWalk(x0 + nx, y0 + ny))
+                        continue;
+
+                    prev[next] = cell;
+                    dist[next] = dist[cell] + 1;
+                    queue.Enqueue(next);
+                }
+            }
+
+            return prev;
+        }
+
+        private Cluster GetCluster(int key) => _clusters.GetOrAdd(key, BuildCluster);
+
+        private Cluster BuildCluster(int key)
+        {
+            GetClusterBounds(key, out int x0, out int y0, out int w, out int h);
+            var nodes = new List<int>();
+
+            // Each border is scanned the same way from both sides so neighbouring clusters agree on the openings
+            AddEntrances(nodes, x0, y0, 1, 0, w, 0, -1); // North
+            AddEntrances(nodes, x0, y0 + h - 1, 1, 0, w, 0, 1); // South
+            AddEntrances(nodes, x0, y0, 0, 1, h, -1, 0); // West
+            AddEntrances(nodes, x0 + w - 1, y0, 0, 1, h, 1, 0); // East
+
+            int[] nodeArray = nodes.ToArray();
+            int n = nodeArray.Length;
+            var distances = new ushort[n * n];
+            Array.Fill(distances, UNREACHABLE);
+
+            for (int i = 0; i < n; i++)
+            {
+                Search(nodeArray[i], x0, y0, w, h, _isWalkable, out int[] dist);
+
+                for (int j = 0; j < n; j++)
+                {
+                    UnpackInto(nodeArray[j], out int x, out int y);
+                    int d = dist[(y - y0) * w + (x - x0)];
+
+                    if (d >= 0)
+                        distances[i * n + j] = (ushort)d;
+                }
+            }
+
+            _dirty = true;
+
+            return new Cluster(nodeArray, distances);
+        }
+
+        private void AddEntrances(List<int> nodes, int x, int y, int stepX, int stepY, int length, int outX, int outY)
+        {
+            int runStart = -1;
+
+            for (int i = 0; i <= length; i++)
+            {
+                int ix = x + stepX * i, iy = y + stepY * i;
+                bool open = i < length && InBounds(ix + outX, iy + outY) && _isWalkable(ix, iy) && _isWalkable(ix + outX, iy + outY);
+
+                if (open)
+                {
+                    if (runStart < 0)
+                        runStart = i;
+
+                    continue;
+                }
+
+                if (runStart < 0)
+                    continue;
+
+                int runEnd = i - 1;
+
+                if (runEnd - runStart + 1 >= LONG_ENTRANCE)
+                {
+                    AddNode(x + stepX * runStart, y + stepY * runStart);
+                    AddNode(x + stepX * runEnd, y + stepY * runEnd);
+                }
+                else
+                {
+                    int mid = (runStart + runEnd) / 2;
+                    AddNode(x + stepX * mid, y + stepY * mid);
+                }
+
+                runStart = -1;
+            }
+
+            void AddNode(int nx, int ny)
+            {
+                int key = Pack(nx, ny);
+
+                if (!nodes.Contains(key))
+                    nodes.Add(key);
+            }
+        }
+
+        private void GetClusterBounds(int key, out int x0, out int y0, out int w, out int h)
+        {
+            x0 = (key >> 16) << CLUSTER_SHIFT;
+            y0 = (key & 0xFFFF) << CLUSTER_SHIFT;
+            w = Math.Min(CLUSTER_SIZE, _width - x0);
+            h = Math.Min(CLUSTER_SIZE, _height - y0);
+        }
+
+        private bool InBounds(int x, int y) => x >= 0 && y >= 0 && x < _width && y < _height;
+
+        private static int Heuristic(int node, int goal)
+        {
+            UnpackInto(node, out int x, out int y);
+            UnpackInto(goal, out int gx, out int gy);
+
+            return Math.Max(Math.Abs(gx - x), Math.Abs(gy - y));
+        }
+
+        private static int Pack(int x, int y) => (x << 16) | y;
+
+        private static void UnpackInto(int packed, out int x, out int y)
+        {
+            x = packed >> 16;
+            y = packed & 0xFFFF;
+        }
+
+        private static int ClusterKeyOf(int packed) => ((packed >> 16) >> CLUSTER_SHIFT << 16) | ((packed & 0xFFFF) >> CLUSTER_SHIFT);
+
+        public void SaveToFile(string filename)
+        {
+            string tempFilename = filename + ".tmp";
+
+            using (var stream = new FileStream(tempFilename, FileMode.Create, FileAccess.Write))
+            using (var writer = new BinaryWriter(stream))
+            {
+                writer.Write(FILE_VERSION);
+                writer.Write(_mapIndex);
+                writer.Write(CLUSTER_SIZE);
+                writer.Write(MapChecksum ?? string.Empty);
+
+                KeyValuePair<int, Cluster>[] clusters = _clusters.ToArray();
+                writer.Write(clusters.Length);
+
+                foreach (KeyValuePair<int, Cluster> kv in clusters)
+                {
+                    writer.Write(kv.Key);
+                    writer.Write(kv.Value.Nodes.Length);
+
+                    foreach (int node in kv.Value.Nodes)
+                        writer.Write(node);
+
+                    foreach (ushort d in kv.Value.Distances)
+                        writer.Write(d);
+                }
+            }
+
+            if (File.Exists(filename)) File.Delete(filename);
+            File.Move(tempFilename, filename);
+            _dirty = false;
+        }
+
+        /// <summary>
+        /// Load clusters saved by <see cref="SaveToFile"/>.
+        /// </summary>
+        /// <returns>False if the file was made for different map data and should be rebuilt</returns>
+        public bool LoadFromFile(string filename)
+        {
+            using var stream = new FileStream(filename, FileMode.Open, FileAccess.Read);
+            using var reader = new BinaryReader(stream);
+
+            if (reader.ReadInt32() != FILE_VERSION || reader.ReadInt32() != _mapIndex || reader.ReadInt32() != CLUSTER_SIZE)
+                return false;
+
+            if (reader.ReadString() != (MapChecksum ?? string.Empty))
+                return false;
+
+            int count = reader.ReadInt32();
+
+            for (int c = 0; c < count; c++)
+            {
+                int key = reader.ReadInt32();
+                int n = reader.ReadInt32();
+                var nodes = new int[n];
+                var distances = new ushort[n * n];
+
+                for (int i = 0; i < n; i++)
+                    nodes[i] = reader.ReadInt32();
+
+                for (int i = 0; i < distances.Length; i++)
+                    distances[i] = reader.ReadUInt16();
+
+                _clusters[key] = new Cluster(nodes, distances);
+            }
+
+            return true;
+        }
+    }
+}
@@ -1,12 +1,19 @@
 using System;
+using System.Buffers.Binary;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Diagnostics;
 using System.IO;
+using System.IO.MemoryMappedFiles;
+using System.Runtime.InteropServices;
+using System.Text;
+using System.Threading;
 using System.Threading.Tasks;
 using ClassicUO.Assets;
 using ClassicUO.Configuration;
 using ClassicUO.Game.Data;
 using ClassicUO.Game.GameObjects;
+using ClassicUO.Game.Map;
 using ClassicUO.Game.UI.Controls;
 using ClassicUO.Game.UI.Gumps;
 using ClassicUO.Utility;
@@ -25,20 +32,22 @@ namespace ClassicUO.Game.Managers
 
         private readonly Dictionary<int, WalkableMapData> _mapData = new();
         private readonly Dictionary<int, WalkableMapData> _sessionModifications = new();
-        private readonly Dictionary<int, bool> _mapGenerationComplete = new();
-        private readonly Dictionary<int, int> _mapChunkGenerationIndex = new();
+        private readonly Dictionary<int, WalkableClusterGraph> _clusterGraphs = new();
+        private readonly ConcurrentDictionary<int, bool> _mapGenerationComplete = new();
+        private readonly ConcurrentDictionary<int, int> _mapChunkGenerationIndex = new();
         private readonly Lock _mapDataLock = new();
         private readonly Lock _sessionModificationsLock = new();
         private int _lastMapIndex = -1;
-        private int _updateCounter = 0;
         private volatile bool _isGenerating = false;
         private readonly Lock _generationLock = new();
-        private int _chunksPerCycle = 1; // Start with 1 for performance measurement
-        public int TargetGenerationTimeMs = 2;
-        private const int MIN_CHUNKS_PER_CYCLE = 1;
-        private const int MAX_CHUNKS_PER_CYCLE = 500;
-        private readonly Queue<double> _recentGenerationTimes = new();
-        private const int PERFORMANCE_SAMPLE_SIZE = 5;
+        private CancellationTokenSource _generationCancellation;
+        private Task _generationTask;
+        private volatile int _generatingMapIndex = -1;
+        private int _generationBatchProgress; // Chunks finished in the batch currently being generated
+        public int GenerationThreads = DefaultGenerationThreads;
+        private const int GENERATION_BATCH_SIZE = 1024; // Chunks generated before the resume index is advanced
+
+        public static int DefaultGenerationThreads => Math.Max(1, Environment.ProcessorCount - 1);
 
         private WalkableManager()
         {
@@ -51,7 +60,7 @@ namespace ClassicUO.Game.Managers
             CreateCacheDirectory();
             // Maps are now loaded on-demand when first accessed rather than loading all maps at startup
 
-            Client.Settings?.GetAsyncOnMainThread(SettingsScope.Global, Constants.SqlSettings.LONG_DISTANCE_PATHING_SPEED, 2, (s) => TargetGenerationTimeMs = s);
+            Client.Settings?.GetAsyncOnMainThread(SettingsScope.Global, Constants.SqlSettings.LONG_DISTANCE_PATHING_THREADS, DefaultGenerationThreads, (s) => GenerationThreads = s);
 
 #if DEBUG
             World.Instance.CommandManager.Register("walkable", strings =>
@@ -101,6 +110,109 @@ namespace ClassicUO.Game.Managers
             return CalculateWalkabilityForTile(x, y);
         }
 
+        /// <summary>
+        /// Walkability from already generated data only, missing tiles are never calculated so this is safe to call off the main thread.
+        /// Tiles without data are treated as not walkable.
+        /// </summary>
+        internal bool IsKnownWalkable(int mapIndex, int x, int y)
+        {
+            bool walkable;
+
+            lock (_sessionModificationsLock)
+                if (_sessionModifications.TryGetValue(mapIndex, out WalkableMapData sessionData) && sessionData.TryGetWalkable(x, y, out walkable))
+                    return walkable;
+
+            lock (_mapDataLock)
+                if (_mapData.TryGetValue(mapIndex, out WalkableMapData mapData) && mapData.TryGetWalkable(x, y, out walkable))
+                    return walkable;
+
+            return false;
+        }
+
+        /// <summary>
+        /// Like <see cref="IsKnownWalkable"/>, but a chunk without data is generated from the map files on the spot and kept.
+        /// Safe to call off the main thread.
+        /// </summary>
+        internal bool IsWalkableOrGenerate(int mapIndex, int x, int y)
+        {
+            bool walkable;
+
+            lock (_sessionModificationsLock)
+                if (_sessionModifications.TryGetValue(mapIndex, out WalkableMapData sessionData) && sessionData.TryGetWalkable(x, y, out walkable))
+                    return walkable;
+
+            WalkableMapData mapData;
+            lock (_mapDataLock)
+                if (!_mapData.TryGetValue(mapIndex, out mapData))
+                    return false;
+
+            if (mapData.TryGetWalkable(x, y, out walkable))
+                return walkable;
+
+            if (x < 0 || y < 0)
+                return false;
+
+            GenerateChunkWalkability(mapIndex, x >> 3, y >> 3, mapData);
+
+            return mapData.TryGetWalkable(x, y, out walkable) && walkable;
+        }
+
+        /// <summary>
+        /// Routing graph for long distance paths, loaded from disk or built as it is used.
+        /// Only available once the map's walkable data is fully generated, returns null before that.
+        /// </summary>
+        internal WalkableClusterGraph GetClusterGraph(int mapIndex)
+        {
+            if (!IsMapGenerationComplete(mapIndex))
+                return null;
+
+            WalkableMapData mapData;
+
+            lock (_mapDataLock)
+            {
+                if (_clusterGraphs.TryGetValue(mapIndex, out WalkableClusterGraph existing))
+                    return existing;
+
+                if (!_mapData.TryGetValue(mapIndex, out mapData))
+                    return null;
+            }
+
+            int width = Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 0] * CHUNK_SIZE;
+            int height = Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 1] * CHUNK_SIZE;
+
+            WalkableClusterGraph CreateGraph() => new(mapIndex, width, height, (x, y) => mapData.TryGetWalkable(x, y, out bool walkable) && walkable)
+            {
+                MapChecksum = mapData.MapChecksum
+            };
+
+            WalkableClusterGraph graph = CreateGraph();
+            string filename = GetClusterGraphFileName(mapIndex);
+
+            try
+            {
+                if (File.Exists(filename) && !graph.LoadFromFile(filename))
+                {
+                    Log.Info($"[WalkableManager] Routing graph for map {mapIndex} is out of date, rebuilding");
+                    graph = CreateGraph();
+                }
+            }
+            catch (Exception ex)
+            {
+                Log.Warn($"[WalkableManager] Failed to load routing graph for map {mapIndex}: {ex.Message}");
+                graph = CreateGraph();
+            }
+
+            lock (_mapDataLock)
+            {
+                if (_clusterGraphs.TryGetValue(mapIndex, out WalkableClusterGraph existing))
+                    return existing;
+
+                _clusterGraphs[mapIndex] = graph;
+            }
+
+            return graph;
+        }
+
         public void SetSessionWalkable(int x, int y, bool walkable)
         {
             if (World.Instance == null || !World.Instance.InGame || World.Instance.Map == null)
@@ -144,19 +256,15 @@ namespace ClassicUO.Game.Managers
             {
                 _lastMapIndex = mapIndex;
                 ClearSessionModifications(); // Clear session mods when changing maps
+                StopGeneration();
 
                 // Ensure the new map is loaded
                 EnsureMapLoaded(mapIndex);
             }
 
             // Only generate chunks if the map isn't fully generated yet
-            if (!IsMapGenerationComplete(mapIndex))
-            {
-                _updateCounter++;
-
-                // Generate chunks every other update
-                if (_updateCounter % 2 == 0) GenerateNextChunks(_chunksPerCycle);
-            }
+            if (!IsMapGenerationComplete(mapIndex) && !_isGenerating)
+                StartGeneration(mapIndex);
         }
 
         private void EnsureMapLoaded(int mapIndex)
@@ -186,6 +294,10 @@ namespace ClassicUO.Game.Managers
             }
 
             int currentIndex = _mapChunkGenerationIndex.TryGetValue(mapIndex, out int index) ? index : 0;
+
+            if (_generatingMapIndex == mapIndex)
+                currentIndex += Volatile.Read(ref _generationBatchProgress);
+
             int totalChunksXCalc = Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 0];
             int totalChunksYCalc = Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 1];
             int totalChunksCalc = totalChunksXCalc * totalChunksYCalc;
@@ -201,11 +313,11 @@ namespace ClassicUO.Game.Managers
             return GetMapGenerationProgress(World.Instance.Map.Index);
         }
 
-        private void GenerateNextChunks(int numChunks)
+        /// <summary>
+        /// Start generating the rest of a map on worker threads, reading straight from the map files so no frame time is used.
+        /// </summary>
+        private void StartGeneration(int mapIndex)
         {
-            if (World.Instance == null || !World.Instance.InGame || World.Instance.Map == null || _isGenerating)
-                return;
-
             lock (_generationLock)
             {
                 if (_isGenerating)
@@ -214,136 +326,165 @@ namespace ClassicUO.Game.Managers
                 _isGenerating = true;
             }
 
-            var stopwatch = Stopwatch.StartNew();
+            WalkableMapData mapData;
+            lock (_mapDataLock)
+                if (!_mapData.TryGetValue(mapIndex, out mapData))
+                {
+                    mapData = CreateMapData(mapIndex);
+                    _mapData[mapIndex] = mapData;
+                }
 
-            try
-            {
-                int mapIndex = World.Instance.Map.Index;
+            var cancellation = new CancellationTokenSource();
+            Interlocked.Exchange(ref _generationCancellation, cancellation)?.Cancel();
+            int threads = Math.Clamp(GenerationThreads, 1, Environment.ProcessorCount);
 
-                WalkableMapData mapData;
-                lock (_mapDataLock)
-                    if (!_mapData.TryGetValue(mapIndex, out mapData))
-                    {
-                        mapData = new WalkableMapData(mapIndex);
+            _generationTask = Task.Run(() => GenerateMap(mapIndex, mapData, threads, cancellation.Token));
+        }
 
-                        // Set checksum for new map data
-                        try
-                        {
-                            string currentChecksum = MapChecksumCalculator.CalculateMapChecksum(
-                                mapIndex,
-                                Client.Game.UO.FileManager.Maps.MapBlocksSize,
-                                Client.Game.UO.FileManager.Maps.MapsDefaultSize,
-                                Client.Game.UO.FileManager.Version.ToString()
-                            );
-                            mapData.MapChecksum = currentChecksum;
-                        }
-                        catch (Exception checksumEx)
-                        {
-                            Log.Warn($"[WalkableManager] Failed to calculate checksum for new map {mapIndex}: {checksumEx.Message}");
-                        }
+        private void StopGeneration() => Interlocked.Exchange(ref _generationCancellation, null)?.Cancel();
 
-                        _mapData[mapIndex] = mapData;
-                    }
+        private void GenerateMap(int mapIndex, WalkableMapData mapData, int threads, CancellationToken cancellationToken)
+        {
+            var stopwatch = Stopwatch.StartNew();
+            _generatingMapIndex = mapIndex;
 
-                // Calculate chunks to generate
+            try
+            {
                 int totalChunksX = Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 0];
                 int totalChunksY = Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 1];
                 int totalChunks = totalChunksX * totalChunksY;
-
                 int currentIndex = _mapChunkGenerationIndex.TryGetValue(mapIndex, out int index) ? index : 0;
+                int startIndex = currentIndex;
 
-                // Generate multiple chunks up to the requested number
-                int chunksGenerated = 0;
-                while (chunksGenerated < numChunks && currentIndex < totalChunks)
-                {
-                    int chunkX = currentIndex / totalChunksY;
-                    int chunkY = currentIndex % totalChunksY;
+                var options = new ParallelOptions { MaxDegreeOfParallelism = threads, CancellationToken = cancellationToken };
 
-                    GenerateChunkWalkabilitySync(chunkX, chunkY, mapData);
+                Log.Info($"[WalkableManager] Generating map {mapIndex} from chunk {currentIndex}/{totalChunks} on {threads} threads");
 
-                    currentIndex++;
-                    chunksGenerated++;
-                }
+                // Batches are finished in order so the saved data stays resumable from the first missing chunk
+                while (currentIndex < totalChunks)
+                {
+                    int batchEnd = Math.Min(totalChunks, currentIndex + GENERATION_BATCH_SIZE);
+
+                    Parallel.For
+                    (
+                        currentIndex,
+                        batchEnd,
+                        options,
+                        i =>
+                        {
+                            GenerateChunkWalkability(mapIndex, i / totalChunksY, i % totalChunksY, mapData);
+                            Interlocked.Increment(ref _generationBatchProgress);
+                        }
+                    );
 
-                // Update the generation index
-                _mapChunkGenerationIndex[mapIndex] = currentIndex;
+                    cancellationToken.ThrowIfCancellationRequested();
 
-                // Check if generation is complete
-                if (currentIndex >= totalChunks)
-                {
-                    _mapGenerationComplete[mapIndex] = true;
-                    Log.Info($"[WalkableManager] Map {mapIndex} generation completed. Total chunks: {totalChunks}");
-                    GameActions.Print($"Pathfinding cache completed for map {mapIndex}!", 87);
+                    currentIndex = batchEnd;
+                    _mapChunkGenerationIndex[mapIndex] = currentIndex;
+                    Interlocked.Exchange(ref _generationBatchProgress, 0);
                 }
+
+                _mapGenerationComplete[mapIndex] = true;
+                Log.Info($"[WalkableManager] Map {mapIndex} generation completed. Total chunks: {totalChunks}, generated {totalChunks - startIndex} in {stopwatch.Elapsed.TotalSeconds:F1}s");
+                MainThreadQueue.EnqueueAction(() => GameActions.Print($"Pathfinding cache completed for map {mapIndex}!", 87));
+            }
+            catch (OperationCanceledException)
+            {
+                Log.Debug($"[WalkableManager] Map {mapIndex} generation stopped");
+            }
+            catch (Exception ex)
+            {
+                Log.Error($"[WalkableManager] Map {mapIndex} generation failed: {ex.Message}");
             }
             finally
             {
-                stopwatch.Stop();
-
-                // Record performance and adjust chunks per cycle
-                double elapsedMs = stopwatch.Elapsed.TotalMilliseconds;
-                AdjustChunksPerCycleBasedOnPerformance(elapsedMs, numChunks);
+                _generatingMapIndex = -1;
+                Interlocked.Exchange(ref _generationBatchProgress, 0);
 
                 lock (_generationLock) _isGenerating = false;
             }
         }
 
-        private void AdjustChunksPerCycleBasedOnPerformance(double elapsedMs, int chunksGenerated)
+        private static void GenerateChunkWalkability(int mapIndex, int chunkX, int chunkY, WalkableMapData mapData)
         {
-            // Only adjust if we actually generated chunks
-            if (chunksGenerated == 0)
-                return;
+            try
+            {
+                mapData.MergeChunk(chunkX, chunkY, CalculateChunkWalkabilityFromFiles(mapIndex, chunkX, chunkY));
+            }
+            catch (Exception ex)
+            {
+                Log.Error($"[WalkableManager] Error generating chunk ({chunkX}, {chunkY}): {ex.Message}");
+            }
+        }
 
-            // Add to recent generation times for smoothing
-            _recentGenerationTimes.Enqueue(elapsedMs);
-            if (_recentGenerationTimes.Count > PERFORMANCE_SAMPLE_SIZE) _recentGenerationTimes.Dequeue();
+        /// <summary>
+        /// Walkability of an 8x8 chunk from the map files alone, safe to call from any thread.
+        /// Uses the same land and static rules as <see cref="CheckTileWalkability"/>. Items and multis are not in the map files
+        /// and are left to the regular pathfinder when walking.
+        /// </summary>
+        private static ulong CalculateChunkWalkabilityFromFiles(int mapIndex, int chunkX, int chunkY)
+        {
+            ulong result = 0;
+            MapBlockData block = MapReader.GetBlock(mapIndex, chunkX, chunkY);
 
-            // Only adjust after we have enough samples
-            if (_recentGenerationTimes.Count < PERFORMANCE_SAMPLE_SIZE)
-                return;
+            for (int ty = 0; ty < CHUNK_SIZE; ty++)
+            for (int tx = 0; tx < CHUNK_SIZE; tx++)
+            {
+                bool walkable = false;
 
-            // Calculate average time from recent samples
-            double avgTime = 0;
-            foreach (double time in _recentGenerationTimes) avgTime += time;
-            avgTime /= _recentGenerationTimes.Count;
+                if (block != null)
+                {
+                    int i = (ty << 3) + tx;
+                    ushort landGraphic = block.LandGraphic[i];
+                    sbyte z = block.LandZ[i];
+
+                    if (landGraphic < 0x01AE && landGraphic != 2 || landGraphic > 0x01B5 && landGraphic != 0x01DB)
+                        if (!Client.Game.UO.FileManager.TileData.LandData[landGraphic].IsImpassable)
+                        {
+                            int landZ = CalculateLandAverageZ(mapIndex, (chunkX << 3) + tx, (chunkY << 3) + ty, landGraphic, z);
+                            walkable = Math.Abs(landZ - z) <= Constants.DEFAULT_BLOCK_HEIGHT;
+                        }
 
-            int oldChunksPerCycle = _chunksPerCycle;
+                    foreach (StaticsBlock sb in block.Statics)
+                    {
+                        if (sb.X != tx || sb.Y != ty)
+                            continue;
 
-            // Adjust chunks per cycle based on performance
-            if (avgTime < TargetGenerationTimeMs * 0.8) // If we're significantly under target
-                // Increase chunks per cycle
-                _chunksPerCycle = Math.Min(_chunksPerCycle + 1, MAX_CHUNKS_PER_CYCLE);
-            else if (avgTime > TargetGenerationTimeMs * 1.2) // If we're significantly over target
-                // Decrease chunks per cycle
-                _chunksPerCycle = Math.Max(_chunksPerCycle - 1, MIN_CHUNKS_PER_CYCLE);
+                        ref StaticTiles data = ref Client.Game.UO.FileManager.TileData.StaticData[sb.Color];
 
-            // Log performance adjustments
-            if (_chunksPerCycle != oldChunksPerCycle)
-            {
-                Log.Debug($"[WalkableManager] Performance adjustment: {oldChunksPerCycle} -> {_chunksPerCycle} chunks/cycle (avg: {avgTime:F1}ms, target: {TargetGenerationTimeMs}ms)");
+                        if (data.IsImpassable || data.IsWall)
+                        {
+                            walkable = false;
+                            break;
+                        }
+                    }
+                }
 
-                // Clear samples when we make an adjustment to get fresh data
-                _recentGenerationTimes.Clear();
+                if (walkable)
+                    result |= 1UL << ((ty << 3) + tx);
             }
+
+            return result;
         }
 
-        private void GenerateChunkWalkabilitySync(int chunkX, int chunkY, WalkableMapData mapData)
+        /// <summary>
+        /// Same as <see cref="Land.AverageZ"/> after <see cref="Land.ApplyStretch"/>, using the map files for the neighbouring tiles.
+        /// </summary>
+        private static int CalculateLandAverageZ(int mapIndex, int x, int y, ushort graphic, sbyte z)
         {
-            try
-            {
-                // Generate walkability data for an 8x8 chunk synchronously
-                for (int x = chunkX * CHUNK_SIZE; x < (chunkX + 1) * CHUNK_SIZE; x++)
-                for (int y = chunkY * CHUNK_SIZE; y < (chunkY + 1) * CHUNK_SIZE; y++)
-                    if (!mapData.HasDataForTile(x, y))
-                    {
-                        bool walkable = CalculateWalkabilityForTile(x, y);
-                        mapData.SetWalkable(x, y, walkable);
-                    }
-            }
-            catch (Exception ex)
-            {
-                Log.Error($"[WalkableManager] Error generating chunk ({chunkX}, {chunkY}): {ex.Message}");
-            }
+            ref LandTiles data = ref Client.Game.UO.FileManager.TileData.LandData[graphic];
+
+            if (data.TexID == 0 && data.IsWet || Client.Game.UO.FileManager.Texmaps.File.GetValidRefEntry(data.TexID).Length <= 0)
+                return z;
+
+            sbyte zRight = MapReader.TryGetLand(mapIndex, x + 1, y, out _, out sbyte r) ? r : (sbyte)-125;
+            sbyte zLeft = MapReader.TryGetLand(mapIndex, x, y + 1, out _, out sbyte l) ? l : (sbyte)-125;
+            sbyte zBottom = MapReader.TryGetLand(mapIndex, x + 1, y + 1, out _, out sbyte b) ? b : (sbyte)-125;
+
+            if (Math.Abs(z - zBottom) <= Math.Abs(zLeft - zRight))
+                return (sbyte)((z + zBottom) >> 1);
+
+            return (sbyte)((zLeft + zRight) >> 1);
         }
 
         private static Direction _irrelevantDirection = Direction.NONE;
@@ -724,18 +865,23 @@ namespace ClassicUO.Game.Managers
                 string filename = GetMapDataFileName(mapIndex);
                 if (File.Exists(filename))
                 {
-                    var mapData = new WalkableMapData(mapIndex);
+                    WalkableMapData mapData = null;
                     bool loadSuccess = false;
 
                     try
                     {
-                        mapData.LoadFromFile(filename);
+                        mapData = WalkableMapData.Open(
+                            mapIndex,
+                            Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 0],
+                            Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 1],
+                            filename
+                        );
                         loadSuccess = true;
                     }
-                    catch (IOException ex) when (ex.Message.Contains("Old file format detected"))
+                    catch (InvalidDataException)
                     {
                         // Delete old format file and start fresh
-                        Log.Info($"[WalkableManager] Map {mapIndex} has old format without checksum, deleting and regenerating...");
+                        Log.Info($"[WalkableManager] Map {mapIndex} has an old or mismatched format, deleting and regenerating...");
                         try
                         {
                             File.Delete(filename);
@@ -790,23 +936,22 @@ namespace ClassicUO.Game.Managers
                         checksumValid = false; // Force regeneration if checksum validation fails
                     }
 
-                    // If checksum is invalid, start fresh generation
+                    lock (_mapDataLock) _mapData[mapIndex] = mapData;
+
+                    // If checksum is invalid, start fresh generation, reusing the already mapped file
                     if (!checksumValid)
                     {
                         StartFreshGeneration(mapIndex);
                         return;
                     }
 
-                    // Checksum is valid, proceed with normal loading
-                    lock (_mapDataLock) _mapData[mapIndex] = mapData;
-
                     // Check if this map was fully generated
                     int totalChunksX = Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 0];
                     int totalChunksY = Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 1];
                     int totalChunks = totalChunksX * totalChunksY;
 
                     // Calculate how many generation chunks we have completed
-                    int completedChunks = mapData.CalculateGenerationProgress(mapIndex);
+                    int completedChunks = mapData.CalculateGenerationProgress();
 
                     if (completedChunks >= totalChunks)
                     {
@@ -832,31 +977,79 @@ namespace ClassicUO.Game.Managers
 
         internal void StartFreshGeneration(int mapIndex)
         {
-            var mapData = new WalkableMapData(mapIndex);
+            // Reset generation state to start from beginning
+            if (_generatingMapIndex == mapIndex)
+                StopGeneration();
+
+            WalkableMapData mapData;
+            lock (_mapDataLock)
+            {
+                _mapData.TryGetValue(mapIndex, out mapData);
+                _clusterGraphs.Remove(mapIndex);
+            }
+
+            // Existing data is cleared in place, pathfinding may still be reading it
+            if (mapData != null)
+                mapData.Reset(CalculateCurrentChecksum(mapIndex));
+            else
+            {
+                mapData = CreateMapData(mapIndex);
+                lock (_mapDataLock) _mapData[mapIndex] = mapData;
+            }
 
-            // Set checksum for new map data
             try
             {
-                string currentChecksum = MapChecksumCalculator.CalculateMapChecksum(
+                string graphFile = GetClusterGraphFileName(mapIndex);
+
+                if (File.Exists(graphFile)) File.Delete(graphFile);
+            }
+            catch (Exception ex)
+            {
+                Log.Warn($"[WalkableManager] Failed to delete routing graph for map {mapIndex}: {ex.Message}");
+            }
+
+            _mapChunkGenerationIndex[mapIndex] = 0;
+            _mapGenerationComplete[mapIndex] = false;
+
+            Log.Info($"[WalkableManager] Map {mapIndex} will be generated from scratch with new checksum format");
+        }
+
+        private static string CalculateCurrentChecksum(int mapIndex)
+        {
+            try
+            {
+                return MapChecksumCalculator.CalculateMapChecksum(
                     mapIndex,
                     Client.Game.UO.FileManager.Maps.MapBlocksSize,
                     Client.Game.UO.FileManager.Maps.MapsDefaultSize,
                     Client.Game.UO.FileManager.Version.ToString()
                 );
-                mapData.MapChecksum = currentChecksum;
             }
             catch (Exception checksumEx)
             {
                 Log.Warn($"[WalkableManager] Failed to calculate checksum for new map {mapIndex}: {checksumEx.Message}");
+                return string.Empty;
             }
+        }
 
-            lock (_mapDataLock) _mapData[mapIndex] = mapData;
-
-            // Reset generation state to start from beginning
-            _mapChunkGenerationIndex[mapIndex] = 0;
-            _mapGenerationComplete[mapIndex] = false;
+        /// <summary>
+        /// New, empty data for a map backed by its cache file. Falls back to memory only if the file can't be created.
+        /// </summary>
+        private WalkableMapData CreateMapData(int mapIndex)
+        {
+            string checksum = CalculateCurrentChecksum(mapIndex);
+            int blocksX = Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 0];
+            int blocksY = Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 1];
 
-            Log.Info($"[WalkableManager] Map {mapIndex} will be generated from scratch with new checksum format");
+            try
+            {
+                return WalkableMapData.Create(mapIndex, blocksX, blocksY, GetMapDataFileName(mapIndex), checksum);
+            }
+            catch (Exception ex)
+            {
+                Log.Warn($"[WalkableManager] Failed to create walkable data file for map {mapIndex}, it will not be saved: {ex.Message}");
+                return new WalkableMapData(mapIndex, blocksX, blocksY) { MapChecksum = checksum };
+            }
         }
 
         public void SaveMapData(int mapIndex)
@@ -885,8 +1078,15 @@ namespace ClassicUO.Game.Managers
                     // Continue with save even if checksum calculation fails
                 }
 
-                string filename = GetMapDataFileName(mapIndex);
-                mapData.SaveToFile(filename);
+                // Only the pages changed since the last save are written
+                mapData.Flush();
+
+                WalkableClusterGraph graph;
+                lock (_mapDataLock)
+                    _clusterGraphs.TryGetValue(mapIndex, out graph);
+
+                if (graph != null && graph.IsDirty)
+                    graph.SaveToFile(GetClusterGraphFileName(mapIndex));
             }
             catch (Exception ex)
             {
@@ -908,6 +1108,8 @@ namespace ClassicUO.Game.Managers
 
         private string GetMapDataFileName(int mapIndex) => Path.Combine(CUOEnviroment.ExecutablePath, "Data", FileSystemHelper.RemoveInvalidChars(World.Instance.ServerName), $"walkable_map_{mapIndex}.dat");
 
+        private string GetClusterGraphFileName(int mapIndex) => Path.ChangeExtension(GetMapDataFileName(mapIndex), ".hpa");
+
         public void ClearSessionModifications()
         {
             lock (_sessionModificationsLock) _sessionModifications.Clear();
@@ -915,264 +1117,438 @@ namespace ClassicUO.Game.Managers
 
         public void Shutdown()
         {
+            StopGeneration();
+
+            try
+            {
+                // Workers stop after the chunk they are on, wait for them before the data is saved and disposed
+                _generationTask?.Wait(TimeSpan.FromSeconds(10));
+            }
+            catch (AggregateException)
+            {
+                // Already logged by GenerateMap
+            }
+
             SaveAllMapData();
 
-            lock (_mapDataLock) _mapData.Clear();
+            lock (_mapDataLock)
+            {
+                foreach (WalkableMapData mapData in _mapData.Values)
+                    mapData.Dispose();
+
+                _mapData.Clear();
+                _clusterGraphs.Clear();
+            }
 
             lock (_sessionModificationsLock) _sessionModifications.Clear();
         }
     }
 
-    internal sealed class WalkableMapData
+    /// <summary>
+    /// Walkable bits of one map in a flat fixed layout, 16 bytes per 8x8 chunk (8 walkable rows then 8 "has data" rows)
+    /// in generation order, after a small header. Persistent data is a memory mapped file so loading needs no parsing and
+    /// only pages touched since the last flush are written back. Session data uses the same layout in memory.
+    /// Reads are plain bit reads without locking, writes are serialized.
+    /// Readers are counted so <see cref="Dispose"/> can wait for them before the view is unmapped, references to this object can outlive the manager's.
+    /// </summary>
+    internal sealed unsafe class WalkableMapData : IDisposable
     {
-        private const int FILE_VERSION = 2; // Version 1: original, Version 2: with checksum
+        private const uint FILE_MAGIC = 0x574B4C57; // "WLKW"
+        private const int FILE_VERSION = 3; // Version 1: original, Version 2: with checksum, Version 3: memory mapped bitmap
+        private const int HEADER_SIZE = 256;
+        private const int CHECKSUM_OFFSET = 24;
+        private const int MAX_CHECKSUM_BYTES = HEADER_SIZE - CHECKSUM_OFFSET;
+        private const int CHUNK_BYTES = 16;
 
         private readonly int _mapIndex;
-        private readonly Dictionary<long, BitArray8x8> _chunks = new();
+        private readonly int _blocksX, _blocksY;
         private readonly object _dataLock = new object();
+        private readonly byte[] _memory;
+        private readonly MemoryMappedFile _mmf;
+        private readonly MemoryMappedViewAccessor _accessor;
+        private byte* _header;
+        private byte* _chunks;
+        private volatile bool _dirty;
+        private int _readers;
         private string _mapChecksum = string.Empty;
 
-        public WalkableMapData(int mapIndex)
+        public WalkableMapData(int mapIndex) : this(mapIndex, Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 0], Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 1])
         {
-            _mapIndex = mapIndex;
         }
 
-        public string MapChecksum
+        public WalkableMapData(int mapIndex, int blocksX, int blocksY)
         {
-            get => _mapChecksum;
-            set => _mapChecksum = value ?? string.Empty;
+            _mapIndex = mapIndex;
+            _blocksX = blocksX;
+            _blocksY = blocksY;
+            _memory = GC.AllocateArray<byte>((int)GetFileLength(blocksX, blocksY), true);
+            _header = (byte*)Marshal.UnsafeAddrOfPinnedArrayElement(_memory, 0);
+            _chunks = _header + HEADER_SIZE;
         }
 
-        public bool HasDataForTile(int x, int y)
+        private WalkableMapData(int mapIndex, int blocksX, int blocksY, FileStream stream)
         {
-            lock (_dataLock) return HasDataForTileUnsafe(x, y);
-        }
+            _mapIndex = mapIndex;
+            _blocksX = blocksX;
+            _blocksY = blocksY;
 
-        private bool HasDataForTileUnsafe(int x, int y)
-        {
-            long chunkKey = GetChunkKey(x >> 3, y >> 3); // Changed from >> 5 to >> 3 for 8x8 chunks
-            if (_chunks.TryGetValue(chunkKey, out BitArray8x8 chunk))
-                // Check if this specific tile has been set (not just if the chunk exists)
-                return chunk.IsSet(x & 7, y & 7);
-            return false;
-        }
+            _mmf = MemoryMappedFile.CreateFromFile(stream, null, 0, MemoryMappedFileAccess.ReadWrite, HandleInheritability.None, false);
+            _accessor = _mmf.CreateViewAccessor(0, stream.Length, MemoryMappedFileAccess.ReadWrite);
 
-        public bool GetWalkable(int x, int y)
-        {
-            long chunkKey = GetChunkKey(x >> 3, y >> 3); // Changed from >> 5 to >> 3 for 8x8 chunks
-            lock (_dataLock)
-                if (_chunks.TryGetValue(chunkKey, out BitArray8x8 chunk))
-                    return chunk.Get(x & 7, y & 7); // Changed from & 31 to & 7 for 8x8 chunks
+            try
+            {
+                byte* ptr = null;
+                _accessor.SafeMemoryMappedViewHandle.AcquirePointer(ref ptr);
+                _header = ptr;
+                _chunks = ptr + HEADER_SIZE;
+            }
+            catch
+            {
+                _accessor.Dispose();
+                _mmf.Dispose();
 
-            return false;
+                throw;
+            }
         }
 
-        public void SetWalkable(int x, int y, bool walkable)
+        public bool IsFileBacked => _accessor != null;
+
+        public string MapChecksum
         {
-            long chunkKey = GetChunkKey(x >> 3, y >> 3); // Changed from >> 5 to >> 3 for 8x8 chunks
-            lock (_dataLock)
+            get => _mapChecksum;
+            set
             {
-                if (!_chunks.TryGetValue(chunkKey, out BitArray8x8 chunk))
+                value ??= string.Empty;
+
+                lock (_dataLock)
                 {
-                    chunk = new BitArray8x8(); // Changed from BitArray32x32 to BitArray8x8
-                    _chunks[chunkKey] = chunk;
+                    if (_header == null || string.Equals(_mapChecksum, value, StringComparison.Ordinal))
+                    {
+                        _mapChecksum = value;
+                        return;
+                    }
+
+                    _mapChecksum = value;
+                    var span = new Span<byte>(_header + CHECKSUM_OFFSET, MAX_CHECKSUM_BYTES);
+                    span.Clear();
+                    int count = Encoding.UTF8.GetBytes(value.AsSpan(0, Math.Min(value.Length, MAX_CHECKSUM_BYTES - 1)), span[1..]);
+                    span[0] = (byte)count;
+                    _dirty = true;
                 }
-                chunk.Set(x & 7, y & 7, walkable); // Changed from & 31 to & 7 for 8x8 chunks
             }
         }
 
-        public void ClearWalkable(int x, int y)
-        {
-            long chunkKey = GetChunkKey(x >> 3, y >> 3);
-            lock (_dataLock)
-                if (_chunks.TryGetValue(chunkKey, out BitArray8x8 chunk))
-                    chunk.Clear(x & 7, y & 7);
-        }
+        private static long GetFileLength(int blocksX, int blocksY) => HEADER_SIZE + (long)blocksX * blocksY * CHUNK_BYTES;
 
-        public int CalculateGenerationProgress(int mapIndex)
+        /// <summary>
+        /// Create a new, empty file for a map, replacing any existing one, and map it.
+        /// </summary>
+        public static WalkableMapData Create(int mapIndex, int blocksX, int blocksY, string filename, string checksum)
         {
-            // Calculate how many 8x8 map chunks we have data for
-            // by checking which generation chunks have any walkable data
-            int totalChunksX = Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 0];
-            int totalChunksY = Client.Game.UO.FileManager.Maps.MapBlocksSize[mapIndex, 1];
+            var stream = new FileStream(filename, FileMode.Create, FileAccess.ReadWrite, FileShare.Read);
 
-            int completedChunks = 0;
+            try
+            {
+                stream.SetLength(GetFileLength(blocksX, blocksY));
 
-            lock (_dataLock)
-                // Check each 8x8 map chunk to see if we have data for it
-                for (int chunkIndex = 0; chunkIndex < totalChunksX * totalChunksY; chunkIndex++)
-                {
-                    int chunkX = chunkIndex / totalChunksY;
-                    int chunkY = chunkIndex % totalChunksY;
-
-                    // Check if this 8x8 chunk has any data by sampling a few tiles
-                    bool hasData = false;
-                    for (int x = chunkX * 8; x < (chunkX + 1) * 8 && !hasData; x++)
-                    for (int y = chunkY * 8; y < (chunkY + 1) * 8 && !hasData; y++)
-                        if (HasDataForTileUnsafe(x, y))
-                            hasData = true;
-
-                    if (hasData)
-                        completedChunks = chunkIndex + 1; // +1 because we completed this chunk
-                    else
-                        break; // Sequential generation, so we can stop here
-                }
+                var data = new WalkableMapData(mapIndex, blocksX, blocksY, stream);
+                data.WriteHeader();
+                data.MapChecksum = checksum;
+                data.Flush();
 
-            return completedChunks;
-        }
+                return data;
+            }
+            catch
+            {
+                stream.Dispose();
 
-        private static long GetChunkKey(int chunkX, int chunkY) => ((long)chunkX << 32) | (uint)chunkY;
+                throw;
+            }
+        }
 
-        public void SaveToFile(string filename)
+        /// <summary>
+        /// Map an existing file. Throws <see cref="InvalidDataException"/> if it is an older format or was made for a different map.
+        /// </summary>
+        public static WalkableMapData Open(int mapIndex, int blocksX, int blocksY, string filename)
         {
-            string tempFilename = filename + ".tmp";
+            var stream = new FileStream(filename, FileMode.Open, FileAccess.ReadWrite, FileShare.Read);
 
             try
             {
-                using (var stream = new FileStream(tempFilename, FileMode.Create, FileAccess.Write))
-                using (var writer = new BinaryWriter(stream))
-                    lock (_dataLock)
-                    {
-                        // Write file version first for future compatibility
-                        writer.Write(FILE_VERSION);
+                if (stream.Length < HEADER_SIZE)
+                    throw new InvalidDataException("Old file format detected, file will be deleted and regenerated");
 
-                        // Write original data
-                        writer.Write(_mapIndex);
-                        writer.Write(_chunks.Count);
+                Span<byte> header = stackalloc byte[CHECKSUM_OFFSET];
+                stream.ReadExactly(header);
 
-                        foreach (KeyValuePair<long, BitArray8x8> kvp in _chunks)
-                        {
-                            writer.Write(kvp.Key);
-                            kvp.Value.WriteTo(writer);
-                        }
+                if (BinaryPrimitives.ReadUInt32LittleEndian(header) != FILE_MAGIC || BinaryPrimitives.ReadInt32LittleEndian(header[4..]) != FILE_VERSION)
+                    throw new InvalidDataException("Old file format detected, file will be deleted and regenerated");
 
-                        // Write checksum (new in version 2)
-                        writer.Write(_mapChecksum ?? string.Empty);
-                    }
+                int fileMapIndex = BinaryPrimitives.ReadInt32LittleEndian(header[8..]);
+
+                if (fileMapIndex != mapIndex)
+                    throw new InvalidDataException($"Map index mismatch: expected {mapIndex}, got {fileMapIndex}");
 
-                // Atomic replace
-                if (File.Exists(filename)) File.Delete(filename);
-                File.Move(tempFilename, filename);
+                if (BinaryPrimitives.ReadInt32LittleEndian(header[12..]) != blocksX || BinaryPrimitives.ReadInt32LittleEndian(header[16..]) != blocksY ||
+                    stream.Length != GetFileLength(blocksX, blocksY))
+                    throw new InvalidDataException("Map size mismatch");
+
+                var data = new WalkableMapData(mapIndex, blocksX, blocksY, stream);
+                var checksum = new ReadOnlySpan<byte>(data._header + CHECKSUM_OFFSET, MAX_CHECKSUM_BYTES);
+                data._mapChecksum = Encoding.UTF8.GetString(checksum.Slice(1, Math.Min((int)checksum[0], MAX_CHECKSUM_BYTES - 1)));
+
+                return data;
             }
             catch (Exception ex)
             {
-                try
-                {
-                    if (File.Exists(tempFilename)) File.Delete(tempFilename);
-                }
-                catch { }
+                stream.Dispose();
+
+                if (ex is InvalidDataException)
+                    throw;
 
-                throw new IOException($"Failed to save walkable data: {ex.Message}", ex);
+                throw new IOException($"Failed to load walkable data: {ex.Message}", ex);
             }
         }
 
-        public void LoadFromFile(string filename)
+        private void WriteHeader()
         {
-            try
-            {
-                using (var stream = new FileStream(filename, FileMode.Open, FileAccess.Read))
-                using (var reader = new BinaryReader(stream))
-                {
-                    // Read version - new format files start with version number
-                    int fileVersion = reader.ReadInt32();
+            var header = new Span<byte>(_header, CHECKSUM_OFFSET);
+            BinaryPrimitives.WriteUInt32LittleEndian(header, FILE_MAGIC);
+            BinaryPrimitives.WriteInt32LittleEndian(header[4..], FILE_VERSION);
+            BinaryPrimitives.WriteInt32LittleEndian(header[8..], _mapIndex);
+            BinaryPrimitives.WriteInt32LittleEndian(header[12..], _blocksX);
+            BinaryPrimitives.WriteInt32LittleEndian(header[16..], _blocksY);
+            _dirty = true;
+        }
 
-                    // Only accept version 2+ files (with checksums)
-                    if (fileVersion < 2) throw new InvalidDataException($"Old file format detected (version {fileVersion}), file will be deleted and regenerated");
+        /// <summary>
+        /// Start a lock free read, returns the chunk data or null once disposed. Every non null result must be paired with <see cref="ExitRead"/>.
+        /// </summary>
+        private byte* EnterRead()
+        {
+            // The increment is a full fence, so either Dispose sees this reader or this reader sees the cleared pointer
+            Interlocked.Increment(ref _readers);
+            byte* chunks = _chunks;
 
-                    int mapIndex = reader.ReadInt32();
+            if (chunks == null)
+                Interlocked.Decrement(ref _readers);
 
-                    if (mapIndex != _mapIndex) throw new InvalidDataException($"Map index mismatch: expected {_mapIndex}, got {mapIndex}");
+            return chunks;
+        }
 
-                    int chunkCount = reader.ReadInt32();
+        private void ExitRead() => Interlocked.Decrement(ref _readers);
 
-                    lock (_dataLock)
-                    {
-                        _chunks.Clear();
+        /// <summary>
+        /// Pointer to the walkable row of a tile, the "has data" row is 8 bytes after it. Null outside the map.
+        /// </summary>
+        private byte* GetRow(byte* chunks, int x, int y)
+        {
+            if (chunks == null || x < 0 || y < 0)
+                return null;
 
-                        for (int i = 0; i < chunkCount; i++)
-                        {
-                            long chunkKey = reader.ReadInt64();
-                            var chunk = new BitArray8x8();
-                            chunk.ReadFrom(reader);
-                            _chunks[chunkKey] = chunk;
-                        }
+            int chunkX = x >> 3;
+            int chunkY = y >> 3;
 
-                        // Read checksum (required in version 2+)
-                        if (stream.Position < stream.Length)
-                            _mapChecksum = reader.ReadString();
-                        else
-                            throw new InvalidDataException("Checksum missing from file");
-                    }
-                }
-            }
-            catch (Exception ex)
-            {
-                throw new IOException($"Failed to load walkable data: {ex.Message}", ex);
-            }
+            if (chunkX >= _blocksX || chunkY >= _blocksY)
+                return null;
+
+            return chunks + ((long)chunkX * _blocksY + chunkY) * CHUNK_BYTES + (y & 7);
         }
-    }
 
-    internal sealed class BitArray8x8
-    {
-        private readonly byte[] _data = new byte[8];
-        private readonly byte[] _isset = new byte[8]; // Track which bits have been explicitly set
+        public bool HasDataForTile(int x, int y)
+        {
+            byte* chunks = EnterRead();
+
+            if (chunks == null)
+                return false;
+
+            byte* row = GetRow(chunks, x, y);
+            bool result = row != null && (row[8] & (1 << (x & 7))) != 0;
+            ExitRead();
 
-        public bool Get(int x, int y)
+            return result;
+        }
+
+        public bool GetWalkable(int x, int y)
         {
-            if (x < 0 || x >= 8 || y < 0 || y >= 8)
+            byte* chunks = EnterRead();
+
+            if (chunks == null)
                 return false;
 
-            return (_data[y] & (1 << x)) != 0;
+            byte* row = GetRow(chunks, x, y);
+            bool result = row != null && (row[0] & (1 << (x & 7))) != 0;
+            ExitRead();
+
+            return result;
         }
 
-        public bool IsSet(int x, int y)
+        /// <summary>
+        /// Get a tile's walkability if it has been set.
+        /// </summary>
+        public bool TryGetWalkable(int x, int y, out bool walkable)
         {
-            if (x < 0 || x >= 8 || y < 0 || y >= 8)
+            walkable = false;
+            byte* chunks = EnterRead();
+
+            if (chunks == null)
                 return false;
 
-            return (_isset[y] & (1 << x)) != 0;
+            byte* row = GetRow(chunks, x, y);
+            int bit = 1 << (x & 7);
+            bool found = row != null && (row[8] & bit) != 0;
+
+            if (found)
+                walkable = (row[0] & bit) != 0;
+
+            ExitRead();
+
+            return found;
         }
 
-        public void Set(int x, int y, bool value)
+        public void SetWalkable(int x, int y, bool walkable)
         {
-            if (x < 0 || x >= 8 || y < 0 || y >= 8)
-                return;
+            lock (_dataLock)
+            {
+                byte* row = GetRow(_chunks, x, y);
 
-            // Mark this position as set
-            _isset[y] |= (byte)(1 << x);
+                if (row == null)
+                    return;
 
-            // Set the actual data value
-            if (value)
-                _data[y] |= (byte)(1 << x);
-            else
-                _data[y] &= (byte)~(1 << x);
+                byte bit = (byte)(1 << (x & 7));
+
+                if (walkable)
+                    row[0] |= bit;
+                else
+                    row[0] &= (byte)~bit;
+
+                row[8] |= bit;
+                _dirty = true;
+            }
         }
 
-        public void Clear(int x, int y)
+        /// <summary>
+        /// Copy a generated chunk in, tiles that already have data are kept.
+        /// Bit (y * 8 + x) of <paramref name="walkable"/> is the tile at x, y in the chunk.
+        /// </summary>
+        public void MergeChunk(int chunkX, int chunkY, ulong walkable)
         {
-            if (x < 0 || x >= 8 || y < 0 || y >= 8)
-                return;
+            lock (_dataLock)
+            {
+                byte* row = GetRow(_chunks, chunkX << 3, chunkY << 3);
+
+                if (row == null)
+                    return;
+
+                for (int y = 0; y < 8; y++)
+                {
+                    byte missing = (byte)~row[8 + y];
+                    row[y] = (byte)((row[y] & ~missing) | ((byte)(walkable >> (y << 3)) & missing));
+                    row[8 + y] = 0xFF;
+                }
 
-            // Clear the set bit
-            _isset[y] &= (byte)~(1 << x);
-            // Clear the data bit
-            _data[y] &= (byte)~(1 << x);
+                _dirty = true;
+            }
         }
 
-        public void WriteTo(BinaryWriter writer)
+        public void ClearWalkable(int x, int y)
         {
-            // Write data array
-            for (int i = 0; i < 8; i++) writer.Write(_data[i]);
-            // Write isset array
-            for (int i = 0; i < 8; i++) writer.Write(_isset[i]);
+            lock (_dataLock)
+            {
+                byte* row = GetRow(_chunks, x, y);
+
+                if (row == null)
+                    return;
+
+                byte bit = (byte)~(1 << (x & 7));
+                row[0] &= bit;
+                row[8] &= bit;
+                _dirty = true;
+            }
+        }
+
+        /// <summary>
+        /// Forget all tiles, keeping the file so generation can start over in place.
+        /// </summary>
+        public void Reset(string checksum)
+        {
+            lock (_dataLock)
+            {
+                if (_chunks == null)
+                    return;
+
+                new Span<byte>(_chunks, (int)((long)_blocksX * _blocksY * CHUNK_BYTES)).Clear();
+                _dirty = true;
+            }
+
+            MapChecksum = checksum;
         }
 
-        public void ReadFrom(BinaryReader reader)
+        /// <summary>
+        /// Number of chunks from the start, in generation order, that have any data.
+        /// </summary>
+        public int CalculateGenerationProgress()
         {
-            // Read data array
-            for (int i = 0; i < 8; i++) _data[i] = reader.ReadByte();
-            // Read isset array
-            for (int i = 0; i < 8; i++) _isset[i] = reader.ReadByte();
+            byte* chunks = EnterRead();
+
+            if (chunks == null)
+                return 0;
+
+            int totalChunks = _blocksX * _blocksY;
+            int progress = totalChunks;
+
+            for (int i = 0; i < totalChunks; i++)
+                if (*(ulong*)(chunks + (long)i * CHUNK_BYTES + 8) == 0)
+                {
+                    progress = i; // Sequential generation, so we can stop here
+                    break;
+                }
+
+            ExitRead();
+
+            return progress;
+        }
+
+        /// <summary>
+        /// Write changes since the last flush back to the file. The OS only writes the pages that were touched.
+        /// </summary>
+        public void Flush()
+        {
+            if (_accessor == null || !_dirty)
+                return;
+
+            lock (_dataLock)
+            {
+                if (_chunks == null)
+                    return;
+
+                _dirty = false;
+                _accessor.Flush();
+            }
+        }
+
+        public void Dispose()
+        {
+            lock (_dataLock)
+            {
+                if (_chunks == null)
+                    return;
+
+                _header = null;
+                _chunks = null;
+            }
+
+            // Readers don't take the lock, wait for any that got the pointer before it was cleared
+            Interlocked.MemoryBarrier();
+            SpinWait.SpinUntil(() => Volatile.Read(ref _readers) == 0);
+
+            if (_accessor != null)
+            {
+                _accessor.Flush();
+                _accessor.SafeMemoryMappedViewHandle.ReleasePointer();
+                _accessor.Dispose();
+                _mmf.Dispose();
+            }
         }
     }
 }
@@ -263,7 +263,8 @@ namespace ClassicUO.Game.Map
 
         public void AddGameObject(GameObject obj, int x, int y)
         {
-            obj.RemoveFromTile();
+            // Only unlink, the entity grid is updated by the caller once the new tile is known
+            obj.UnlinkFromTile();
 
             short priorityZ = obj.Z;
             sbyte state = -1;
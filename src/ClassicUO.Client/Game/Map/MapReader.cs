@@ -0,0 +1,222 @@
+using System;
+using System.Collections.Generic;
+using System.Runtime.InteropServices;
+using ClassicUO.Assets;
+using ClassicUO.Game.Data;
+using ClassicUO.IO;
+using ClassicUO.Utility;
+
+namespace ClassicUO.Game.Map
+{
+    /// <summary>
+    /// Read-only access to land and statics of any facet straight from the map files, without needing the area to be loaded as <see cref="Chunk"/>s.
+    /// A facet's block index is loaded on first use if the player hasn't been there yet.
+    /// Blocks are decoded once and kept in an LRU cache. Safe to use from any thread.
+    /// This only sees the map files, not world state like tile markers or seasonal graphics.
+    /// </summary>
+    public static class MapReader
+    {
+        public const int CACHE_BLOCKS = 4096;
+
+        private static readonly LruCache<long, MapBlockData> _cache = new(CACHE_BLOCKS);
+
+        /// <summary>
+        /// Get the decoded block containing tile x, y, or null if it is outside the map.
+        /// </summary>
+        public static MapBlockData GetBlockAt(int map, int x, int y) => x < 0 || y < 0 ? null : GetBlock(map, x >> 3, y >> 3);
+
+        /// <summary>
+        /// Get the decoded 8x8 block at block coordinates, or null if it is outside the map.
+        /// </summary>
+        public static unsafe MapBlockData GetBlock(int map, int blockX, int blockY)
+        {
+            MapLoader maps = Client.Game.UO.FileManager.Maps;
+            IndexMap[] blocks = GetBlockIndex(ref map);
+
+            if (blocks == null || blockX < 0 || blockY < 0)
+                return null;
+
+            int height = maps.MapBlocksSize[map, 1];
+            int index = blockX * height + blockY;
+
+            if (blockX >= maps.MapBlocksSize[map, 0] || blockY >= height || index >= blocks.Length)
+                return null;
+
+            // Read from the array taken above, LoadMap may swap in a new one for this facet at any time
+            ref IndexMap im = ref blocks[index];
+
+            if (!im.IsValid())
+                return null;
+
+            long key = ((long)map << 40) | ((long)blockX << 20) | (uint)blockY;
+
+            if (_cache.TryGet(key, out MapBlockData cached) && cached.Matches(ref im))
+                return cached;
+
+            var data = new MapBlockData(map, blockX, blockY, ref im);
+            MapBlock block;
+
+            lock (Map.MapFileIOLock)
+            {
+                im.MapFile.Seek((long)im.MapAddress, System.IO.SeekOrigin.Begin);
+                block = im.MapFile.Read<MapBlock>();
+            }
+
+            for (int i = 0; i < 64; i++)
+            {
+                data.LandGraphic[i] = (ushort)(block.Cells[i].TileID & 0x3FFF);
+                data.LandZ[i] = block.Cells[i].Z;
+            }
+
+            if (im.StaticCount > 0 && im.StaticFile != null && im.StaticFile.Length > 0)
+            {
+                var statics = new StaticsBlock[im.StaticCount];
+
+                lock (Map.MapFileIOLock)
+                {
+                    im.StaticFile.Seek((long)im.StaticAddress, System.IO.SeekOrigin.Begin);
+                    im.StaticFile.Read(MemoryMarshal.AsBytes(statics.AsSpan()));
+                }
+
+                int count = 0;
+
+                foreach (ref StaticsBlock sb in statics.AsSpan())
+                {
+                    if (sb.Color != 0 && sb.Color != 0xFFFF && (sb.Y << 3) + sb.X < 64)
+                        statics[count++] = sb;
+                }
+
+                Array.Resize(ref statics, count);
+                data.Statics = statics;
+            }
+
+            _cache.Set(key, data);
+
+            return data;
+        }
+
+        /// <summary>
+        /// Load a facet's block index if it isn't loaded yet.
+        /// </summary>
+        /// <returns>False if the facet isn't in the client files</returns>
+        public static bool EnsureLoaded(int map) => GetBlockIndex(ref map) != null;
+
+        /// <summary>
+        /// The block index of a facet, loading it first if needed. Sanitizes <paramref name="map"/> the same way the world does.
+        /// </summary>
+        private static IndexMap[] GetBlockIndex(ref int map)
+        {
+            MapLoader maps = Client.Game.UO.FileManager.Maps;
+
+            if (map < 0 || map >= maps.BlockData.Length)
+                return null;
+
+            maps.SanitizeMapIndex(ref map);
+
+            IndexMap[] blocks = maps.BlockData[map];
+
+            if (blocks == null)
+            {
+                // Same file set as the world uses, so this never makes the world's next LoadMap reload the facet
+                World world = Client.Game.UO.World;
+                maps.LoadMap(map, world != null && world.ClientFeatures.Flags.HasFlag(CharacterListFlags.CLF_UNLOCK_FELUCCA_AREAS));
+                blocks = maps.BlockData[map];
+            }
+
+            return blocks;
+        }
+
+        /// <summary>
+        /// Land graphic and z at a tile.
+        /// </summary>
+        public static bool TryGetLand(int map, int x, int y, out ushort graphic, out sbyte z)
+        {
+            MapBlockData block = GetBlockAt(map, x, y);
+
+            if (block == null)
+            {
+                graphic = 0;
+                z = 0;
+
+                return false;
+            }
+
+            int i = ((y & 7) << 3) + (x & 7);
+            graphic = block.LandGraphic[i];
+            z = block.LandZ[i];
+
+            return true;
+        }
+
+        /// <summary>
+        /// Add the statics at a tile to <paramref name="results"/>, returns how many were added.
+        /// </summary>
+        public static int GetStatics(int map, int x, int y, List<StaticsBlock> results)
+        {
+            MapBlockData block = GetBlockAt(map, x, y);
+
+            if (block == null)
+                return 0;
+
+            int added = 0;
+
+            foreach (StaticsBlock sb in block.Statics)
+            {
+                if (sb.X == (x & 7) && sb.Y == (y & 7))
+                {
+                    results.Add(sb);
+                    added++;
+                }
+            }
+
+            return added;
+        }
+
+        /// <summary>
+        /// Drop a cached block after the map files were written to, e.g. by UltimaLive.
+        /// </summary>
+        public static void Invalidate(int map, int block)
+        {
+            int height = Client.Game.UO.FileManager.Maps.MapBlocksSize[map, 1];
+            _cache.Remove(((long)map << 40) | ((long)(block / height) << 20) | (uint)(block % height));
+        }
+
+        public static void Clear() => _cache.Clear();
+    }
+
+    /// <summary>
+    /// One decoded 8x8 map block, never modified after it is read.
+    /// Land arrays are indexed by (y &amp; 7) * 8 + (x &amp; 7), statics keep their block relative X and Y.
+    /// </summary>
+    public sealed class MapBlockData
+    {
+        public readonly int Map;
+        public readonly int BlockX, BlockY;
+        public readonly ushort[] LandGraphic = new ushort[64];
+        public readonly sbyte[] LandZ = new sbyte[64];
+        public StaticsBlock[] Statics { get; internal set; } = [];
+
+        private readonly FileReader _mapFile, _staticFile;
+        private readonly ulong _mapAddress, _staticAddress;
+        private readonly uint _staticCount;
+
+        internal MapBlockData(int map, int blockX, int blockY, ref IndexMap im)
+        {
+            Map = map;
+            BlockX = blockX;
+            BlockY = blockY;
+            _mapFile = im.MapFile;
+            _staticFile = im.StaticFile;
+            _mapAddress = im.MapAddress;
+            _staticAddress = im.StaticAddress;
+            _staticCount = im.StaticCount;
+        }
+
+        /// <summary>
+        /// False once the index points somewhere else, e.g. after map patches were applied.
+        /// </summary>
+        internal bool Matches(ref IndexMap im) =>
+            im.MapAddress == _mapAddress && im.StaticAddress == _staticAddress && im.StaticCount == _staticCount &&
+            ReferenceEquals(im.MapFile, _mapFile) && ReferenceEquals(im.StaticFile, _staticFile);
+    }
+}
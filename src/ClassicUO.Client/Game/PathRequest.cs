@@ -0,0 +1,83 @@
+using System;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Xna.Framework;
+
+namespace ClassicUO.Game
+{
+    /// <summary>
+    /// A long distance path being generated in the background by <see cref="LongDistancePathfinder"/>.
+    /// Tiles are queued in walking order as soon as they are known, so they can be used before the whole route is done.
+    /// </summary>
+    public sealed class PathRequest
+    {
+        private readonly CancellationTokenSource _cancellation = new();
+        private readonly CancellationTokenRegistration _registration;
+        private readonly TaskCompletionSource<bool> _completion = new(TaskCreationOptions.RunContinuationsAsynchronously);
+        private int _count;
+
+        internal PathRequest(int targetX, int targetY, ConcurrentQueue<Point> tiles, CancellationToken cancellationToken)
+        {
+            TargetX = targetX;
+            TargetY = targetY;
+            Tiles = tiles;
+            _registration = cancellationToken.Register(Cancel);
+        }
+
+        public int TargetX { get; }
+        public int TargetY { get; }
+
+        /// <summary>
+        /// Tiles not taken yet, in walking order.
+        /// </summary>
+        public ConcurrentQueue<Point> Tiles { get; }
+
+        /// <summary>
+        /// How many tiles have been generated so far, including ones already taken from <see cref="Tiles"/>.
+        /// </summary>
+        public int Count => Volatile.Read(ref _count);
+
+        public bool IsComplete => _completion.Task.IsCompleted;
+
+        /// <summary>
+        /// True once a path to the exact target was found, false for partial paths, failures and cancellation.
+        /// </summary>
+        public bool Found => _completion.Task.IsCompletedSuccessfully && _completion.Task.Result;
+
+        public bool IsCancelled => _cancellation.IsCancellationRequested;
+
+        /// <summary>
+        /// Why the path is partial or missing, null if there is nothing to report. Set instead of printing to the game for requests with <see cref="CanWalk"/>.
+        /// </summary>
+        public string Message { get; private set; }
+
+        /// <summary>
+        /// Walkability check used by the search instead of the walker's, must be safe to call off the main thread.
+        /// </summary>
+        internal Func<int, int, bool> CanWalk { get; init; }
+
+        /// <summary>
+        /// Completes with <see cref="Found"/> when generation ends for any reason.
+        /// </summary>
+        public Task<bool> Completion => _completion.Task;
+
+        internal CancellationToken CancellationToken => _cancellation.Token;
+
+        public void Cancel() => _cancellation.Cancel();
+
+        internal void Add(Point tile)
+        {
+            Tiles.Enqueue(tile);
+            Interlocked.Increment(ref _count);
+        }
+
+        internal void Report(string message) => Message = message;
+
+        internal void Complete(bool found)
+        {
+            if (_completion.TrySetResult(found))
+                _registration.Dispose();
+        }
+    }
+}
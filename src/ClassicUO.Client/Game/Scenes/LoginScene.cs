@@ -245,7 +245,10 @@ namespace ClassicUO.Game.Scenes
             }
 
             _world.Mobiles.Clear();
+            _world.MobileGrid.Clear();
             _world.Items.Clear();
+            _world.ItemIndex.Clear();
+            _world.ItemGrid.Clear();
 
             switch (CurrentLoginStep)
             {
@@ -22,7 +22,7 @@ namespace ClassicUO.Game.UI.ImGuiControls
         private float _cameraSmoothingFactor;
         private int _currentThemeIndex, _minGumpMoveDist, _gameScale, _minScale, _maxScale;
         private string[] _themeNames;
-        private int _pathfindingGenerationTimeMs;
+        private int _pathfindingGenerationThreads;
         private string _quickHealSpell, _quickCureSpell;
 
         // Child tab contents
@@ -48,7 +48,7 @@ namespace ClassicUO.Game.UI.ImGuiControls
             _imguiWindowAlpha = _lastImguiWindowAlpha = Client.Settings.Get(SettingsScope.Global, Constants.SqlSettings.IMGUI_ALPHA, 1.0f);
             _cameraSmoothingFactor = _profile.CameraSmoothingFactor;
             _useLongDistancePathing = World.Instance?.Player?.Pathfinder.UseLongDistancePathfinding ?? false;
-            _pathfindingGenerationTimeMs = Client.Settings.Get(SettingsScope.Global, Constants.SqlSettings.LONG_DISTANCE_PATHING_SPEED, 2);
+            _pathfindingGenerationThreads = Client.Settings.Get(SettingsScope.Global, Constants.SqlSettings.LONG_DISTANCE_PATHING_THREADS, WalkableManager.DefaultGenerationThreads);
             _petScaling = _profile.EnablePetScaling;
             _minGumpMoveDist = _profile.MinGumpMoveDistance;
             _gameScale = (int)(100 * Client.Game.UIScale);
@@ -350,13 +350,13 @@ namespace ClassicUO.Game.UI.ImGuiControls
 
 
             ImGui.SetNextItemWidth(150);
-            if (ImGui.SliderInt("Pathfinding Gen Time", ref _pathfindingGenerationTimeMs, 1, 50, "%d ms"))
+            if (ImGui.SliderInt("Pathfinding Gen Threads", ref _pathfindingGenerationThreads, 1, Environment.ProcessorCount))
             {
-                _pathfindingGenerationTimeMs = Math.Clamp(_pathfindingGenerationTimeMs, 1, 50);
-                Client.Settings?.SetAsync(SettingsScope.Global, Constants.SqlSettings.LONG_DISTANCE_PATHING_SPEED,  _pathfindingGenerationTimeMs);
-                if (Managers.WalkableManager.Instance != null) Managers.WalkableManager.Instance.TargetGenerationTimeMs = _pathfindingGenerationTimeMs;
+                _pathfindingGenerationThreads = Math.Clamp(_pathfindingGenerationThreads, 1, Environment.ProcessorCount);
+                Client.Settings?.SetAsync(SettingsScope.Global, Constants.SqlSettings.LONG_DISTANCE_PATHING_THREADS,  _pathfindingGenerationThreads);
+                if (Managers.WalkableManager.Instance != null) Managers.WalkableManager.Instance.GenerationThreads = _pathfindingGenerationThreads;
             }
-            ImGuiComponents.Tooltip("Target time in milliseconds for pathfinding cache generation per cycle. Higher values generate cache faster but may cause performance issues.");
+            ImGuiComponents.Tooltip("Background threads used to generate the pathfinding cache. Generation runs off the game loop, more threads finish sooner. Takes effect on the next map generated.");
 
             // Display current map generation progress
             if (WalkableManager.Instance != null)
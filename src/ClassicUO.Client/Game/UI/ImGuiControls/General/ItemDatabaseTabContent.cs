@@ -500,6 +500,9 @@ namespace ClassicUO.Game.UI.ImGuiControls
         private void DrawDatabaseMaintenance()
         {
             ImGui.SeparatorText("Database Maintenance:");
+            ItemDatabaseManager db = ItemDatabaseManager.Instance;
+            ImGui.Text($"Queued: {db.QueueDepth}  Saved: {db.RowsWritten}  ({db.RowsPerSecond:0} rows/s)");
+            ImGuiComponents.Tooltip($"Items waiting to be saved, items saved this session and how fast they are written.\nDropped because the queue was full: {db.DroppedItems}");
             ImGui.AlignTextToFramePadding();
             ImGui.Text("Clear entries older than:");
             ImGui.SetNextItemWidth(100);
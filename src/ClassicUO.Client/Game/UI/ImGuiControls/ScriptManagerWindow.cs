@@ -246,6 +246,13 @@ public class ScriptManagerWindow : SingletonImGuiWindow<ScriptManagerWindow>
             {
                 LegionScripting.LegionScripting.LScriptSettings.DisableModuleCache = disableCache;
             }
+
+            bool lightweight = LegionScripting.LegionScripting.LScriptSettings.LightweightThreads;
+            if (ImGui.Checkbox("Lightweight Script Threads", ref lightweight))
+            {
+                LegionScripting.LegionScripting.LScriptSettings.LightweightThreads = lightweight;
+            }
+            SetTooltip("Run scripts on threads with a smaller stack, uses less memory when running many scripts.\nWhile enabled python recursion is limited to " + LegionScripting.LegionScripting.LIGHTWEIGHT_RECURSION_LIMIT + " calls deep, deeper recursion raises a RecursionError.\nApplies to scripts started after changing this.");
             ImGui.EndPopup();
         }
     }
@@ -219,6 +219,7 @@ namespace ClassicUO.Game
                         {
                             //update index lookup AND static size on disk (first 4 bytes lookup, next 4 is statics size)
                             _UL._filesIdxStatics[mapId].WriteArray(index, [0xFF, 0xFF, 0xFF, 0xFF, 0x00, 0x00, 0x00, 0x00]);
+                            MapReader.Invalidate(mapId, block);
 
                             Log.Trace($"writing zero length statics to index at 0x{index:X8}");
                         }
@@ -259,6 +260,7 @@ namespace ClassicUO.Game
 
                                 //update lookup AND index length on disk
                                 _UL._filesIdxStatics[mapId].WriteArray(block * 12, idxData);
+                                MapReader.Invalidate(mapId, block);
 
                             Chunk mapChunk = world.Map.GetChunk(block);
 
@@ -386,6 +388,7 @@ namespace ClassicUO.Game
                         mapLoader.Load();
 
                         _UL._ULMap = mapLoader;
+                        MapReader.Clear();
                         _UL._filesMap = new ULFileMul[MapLoader.MAPS_COUNT];
                         _UL._filesIdxStatics = new ULFileMul[MapLoader.MAPS_COUNT];
                         _UL._filesStatics = new ULFileMul[MapLoader.MAPS_COUNT];
@@ -468,6 +471,7 @@ namespace ClassicUO.Game
             if (block >= 0 && block < mapWidthInBlocks * mapHeightInBlocks)
             {
                 _UL._filesMap[mapId].WriteArray(block * 196 + 4, landData);
+                MapReader.Invalidate(mapId, block);
 
                 //instead of recalculating the CRC block 2 times, in case of terrain + statics update, we only set the actual block to ushort maxvalue, so it will be recalculated on next hash query
                 _UL.MapCRCs[mapId][block] = ushort.MaxValue;
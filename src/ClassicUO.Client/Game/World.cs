@@ -113,6 +113,21 @@ namespace ClassicUO.Game
 
         public Dictionary<uint, Item> Items { get; } = new Dictionary<uint, Item>();
 
+        /// <summary>
+        /// Lookups into <see cref="Items"/> by graphic, container and hue
+        /// </summary>
+        public ItemIndex ItemIndex { get; } = new ItemIndex();
+
+        /// <summary>
+        /// Items placed on the map, bucketed by location for range lookups
+        /// </summary>
+        public EntityGrid<Item> ItemGrid { get; } = new EntityGrid<Item>();
+
+        /// <summary>
+        /// Mobiles placed on the map, bucketed by location for range lookups
+        /// </summary>
+        public EntityGrid<Mobile> MobileGrid { get; } = new EntityGrid<Mobile>();
+
         public Dictionary<uint, Mobile> Mobiles { get; } = new Dictionary<uint, Mobile>();
 
         // Separate collection for corpses to optimize iteration in TryOpenCorpses
@@ -480,7 +495,8 @@ namespace ClassicUO.Game
                 {
                     for (int i = 0; i < _toRemove.Count; i++)
                     {
-                        Items.Remove(_toRemove[i]);
+                        if (Items.Remove(_toRemove[i], out Item removed))
+                            ItemIndex.Remove(removed);
                     }
 
                     _toRemove.Clear();
@@ -573,6 +589,7 @@ namespace ClassicUO.Game
             if (item != null && item.IsDestroyed)
             {
                 Items.Remove(serial);
+                ItemIndex.Remove(item);
                 item = null;
             }
 
@@ -580,6 +597,7 @@ namespace ClassicUO.Game
             {
                 item = Item.Create(this, serial);
                 Items.Add(item);
+                ItemIndex.Add(item);
             }
 
             return item;
@@ -679,6 +697,7 @@ namespace ClassicUO.Game
             if (forceRemove)
             {
                 Items.Remove(serial);
+                ItemIndex.Remove(item);
             }
 
             return true;
@@ -930,7 +949,10 @@ namespace ClassicUO.Game
             ObjectToRemove = 0;
             LastObject = 0;
             Items.Clear();
+            ItemIndex.Clear();
+            ItemGrid.Clear();
             Mobiles.Clear();
+            MobileGrid.Clear();
             lock (_corpsesLock)
             {
                 _corpses.Clear();
@@ -1,6 +1,7 @@
 ﻿using System;
 using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.Linq;
 using System.Text.RegularExpressions;
 using System.Threading;
@@ -17,6 +18,7 @@ using ClassicUO.Game.UI.Controls;
 using ClassicUO.Game.UI.Gumps;
 using ClassicUO.LegionScripting.PyClasses;
 using ClassicUO.Network;
+using ClassicUO.Network.PacketHandlers.Helpers;
 using ClassicUO.Utility;
 using IronPython.Runtime;
 using Microsoft.Scripting.Hosting;
@@ -118,8 +120,13 @@ namespace ClassicUO.LegionScripting
 
         #endregion
 
-        private ConcurrentBag<uint> ignoreList = new();
-        private ConcurrentQueue<PyJournalEntry> journalEntries = new();
+        /// <summary>
+        /// Ignored serials and when they expire (Environment.TickCount64), long.MaxValue for never
+        /// </summary>
+        private readonly ConcurrentDictionary<uint, long> ignoreList = new();
+        private readonly ScriptJournalCursor journal = new(LegionScripting.Journal);
+        private PyJournalEntries journalEntries;
+        private JournalMatcher anyMatcher;
         private ConcurrentQueue<PySoundEntry> soundEntries = new();
         internal World World = Client.UnitTestingActive ? new World() : Client.Game.UO.World;
         private Item backpack;
@@ -173,7 +180,10 @@ namespace ClassicUO.LegionScripting
             pressedKeys.Clear();
         }
 
-        public ConcurrentQueue<PyJournalEntry> JournalEntries => journalEntries;
+        /// <summary>
+        /// This script's journal entries, oldest first. Supports TryDequeue, TryPeek, Count, ToArray and Clear like the queue it used to be.
+        /// </summary>
+        public PyJournalEntries JournalEntries => journalEntries ??= new PyJournalEntries(journal);
         public ConcurrentQueue<PySoundEntry> SoundEntries => soundEntries;
 
         #region Properties
@@ -1255,7 +1265,7 @@ namespace ClassicUO.LegionScripting
 
                     foreach (Item i in result)
                     {
-                        if (i.Amount >= minamount && !ignoreList.Contains(i))
+                        if (i.Amount >= minamount && !OnIgnoreList(i))
                         {
                             Found = i.Serial;
                             return new PyItem(i);
@@ -1351,7 +1361,7 @@ namespace ClassicUO.LegionScripting
             {
                 var resultList = new List<PyItem>();
 
-                foreach (Item item in World.Items.Values)
+                foreach (Item item in Utility.GroundItemsInRange(distance))
                 {
                     if (item.IsDestroyed || !item.OnGround || OnIgnoreList(item))
                         continue;
@@ -1415,7 +1425,7 @@ namespace ClassicUO.LegionScripting
             {
                 uint current = containers.Pop();
 
-                foreach (Item item in Utility.FindItems(parentContainer: current))
+                foreach (Item item in World.ItemIndex.ByContainer(current))
                 {
                     results.Add(new PyItem(item));
                     containers.Push(item.Serial);
@@ -1445,7 +1455,7 @@ namespace ClassicUO.LegionScripting
 
                 foreach (Item i in result)
                 {
-                    if (!ignoreList.Contains(i))
+                    if (!OnIgnoreList(i))
                     {
                         if (skipQueue)
                             GameActions.DoubleClick(World, i);
@@ -1479,10 +1489,32 @@ namespace ClassicUO.LegionScripting
         /// for item in ItemsInContainer(API.Backpack):
         ///   if item.Name == "Dagger":
         ///   API.IgnoreObject(item)
+        /// # Ignore a tree for 10 minutes
+        /// API.IgnoreObject(tree, 10)
         /// ```
         /// </summary>
         /// <param name="serial">The item/mobile serial</param>
-        public void IgnoreObject(uint serial) => ignoreList.Add(serial);
+        /// <param name="minutes">Optional, stop ignoring it after this many minutes. 0 ignores it until removed</param>
+        public void IgnoreObject(uint serial, double minutes = 0) => ignoreList[serial] = IgnoreExpiry(minutes);
+
+        /// <summary>
+        /// Adds a list of items or mobiles to your ignore list.
+        /// Example:
+        /// ```py
+        /// API.IgnoreObjects([i.Serial for i in API.FindTypeAll(0x0EED, API.Backpack)])
+        /// ```
+        /// </summary>
+        /// <param name="serials">The item/mobile serials</param>
+        /// <param name="minutes">Optional, stop ignoring them after this many minutes. 0 ignores them until removed</param>
+        public void IgnoreObjects(IList<uint> serials, double minutes = 0)
+        {
+            long expiry = IgnoreExpiry(minutes);
+
+            foreach (uint serial in serials)
+                ignoreList[serial] = expiry;
+        }
+
+        private static long IgnoreExpiry(double minutes) => minutes > 0 ? Environment.TickCount64 + (long)(minutes * 60000) : long.MaxValue;
 
         /// <summary>
         /// Removes an item or mobile from your ignore list.
@@ -1492,7 +1524,21 @@ namespace ClassicUO.LegionScripting
         /// ```
         /// </summary>
         /// <param name="serial">The item/mobile serial</param>
-        public void UnIgnoreObject(uint serial) => ignoreList = new ConcurrentBag<uint>(ignoreList.Where(s => s != serial));
+        public void UnIgnoreObject(uint serial) => ignoreList.TryRemove(serial, out _);
+
+        /// <summary>
+        /// Removes a list of items or mobiles from your ignore list.
+        /// Example:
+        /// ```py
+        /// API.UnIgnoreObjects([i.Serial for i in API.FindTypeAll(0x0EED, API.Backpack)])
+        /// ```
+        /// </summary>
+        /// <param name="serials">The item/mobile serials</param>
+        public void UnIgnoreObjects(IList<uint> serials)
+        {
+            foreach (uint serial in serials)
+                ignoreList.TryRemove(serial, out _);
+        }
 
         /// <summary>
         /// Clears the ignore list. Allowing functions to see those items again.
@@ -1501,7 +1547,7 @@ namespace ClassicUO.LegionScripting
         /// API.ClearIgnoreList()
         /// ```
         /// </summary>
-        public void ClearIgnoreList() => ignoreList = new();
+        public void ClearIgnoreList() => ignoreList.Clear();
 
         /// <summary>
         /// Check if a serial is on the ignore list.
@@ -1513,7 +1559,18 @@ namespace ClassicUO.LegionScripting
         /// </summary>
         /// <param name="serial"></param>
         /// <returns>True if on the ignore list.</returns>
-        public bool OnIgnoreList(uint serial) => ignoreList.Contains(serial);
+        public bool OnIgnoreList(uint serial)
+        {
+            if (!ignoreList.TryGetValue(serial, out long expiry))
+                return false;
+
+            if (expiry > Environment.TickCount64)
+                return true;
+
+            ignoreList.TryRemove(new KeyValuePair<uint, long>(serial, expiry));
+
+            return false;
+        }
 
         /// <summary>
         /// Attempt to pathfind to a location.  This will fail with large distances.
@@ -1703,6 +1760,79 @@ namespace ClassicUO.LegionScripting
             return pythonList;
         });
 
+        /// <summary>
+        /// Start working out a path to a location in the background and return right away, this works with long distances.
+        /// This does not walk, read tiles from the returned request as they are generated and walk them yourself.
+        /// Example:
+        /// ```py
+        /// req = API.PathfindAsync(1414, 1515)
+        /// API.SysMsg("Doing other things while the path is found")
+        /// if req.Wait(15) and req.Found:
+        ///   API.SysMsg(f"Path has {req.Count} tiles")
+        /// ```
+        /// </summary>
+        /// <param name="x"></param>
+        /// <param name="y"></param>
+        /// <returns>A path request, see PyPathRequest. None if not in game.</returns>
+        public PyPathRequest PathfindAsync(int x, int y)
+        {
+            (bool inGame, int startX, int startY) = MainThreadQueue.InvokeOnMainThread(() => World?.Player == null ? (false, 0, 0) : (true, (int)World.Player.X, (int)World.Player.Y));
+
+            if (!inGame)
+                return null;
+
+            return new PyPathRequest(LongDistancePathfinder.FindPathAsync(startX, startY, x, y, CancellationToken.Token), this);
+        }
+
+        /// <summary>
+        /// Walking distance from you to each of several targets, found with one search instead of a path per target.
+        /// Uses the pathfinding cache, items and houses that block the way are not taken into account.
+        /// Example:
+        /// ```py
+        /// trees = [(1410, 1500), (1432, 1488), (1401, 1530)]
+        /// dists = API.PathDistances(trees)
+        /// reachable = [(d, t) for d, t in zip(dists, trees) if d >= 0]
+        /// if reachable:
+        ///   d, (x, y) = min(reachable)
+        ///   API.SysMsg(f"Closest tree is {d} steps away at {x}, {y}")
+        /// ```
+        /// </summary>
+        /// <param name="targets">A list of (x, y) positions or game objects</param>
+        /// <param name="distance">How close counts as reaching a target, 1 for next to it, 0-18</param>
+        /// <param name="maxDistance">Most steps to search, 1-1000</param>
+        /// <returns>A list of step counts in the same order as the targets, -1 for targets that can't be reached</returns>
+        public PythonList PathDistances(IList<object> targets, int distance = 1, int maxDistance = 300)
+        {
+            var results = new PythonList();
+
+            if (targets == null || targets.Count == 0)
+                return results;
+
+            var points = new List<Point>(targets.Count);
+
+            foreach (object target in targets)
+            {
+                points.Add
+                (
+                    target switch
+                    {
+                        PyGameObject obj => new Point(obj.X, obj.Y),
+                        IList<object> pos when pos.Count >= 2 => new Point(Convert.ToInt32(pos[0]), Convert.ToInt32(pos[1])),
+                        _ => new Point(-1, -1)
+                    }
+                );
+            }
+
+            (bool inGame, int startX, int startY) = MainThreadQueue.InvokeOnMainThread(() => World?.Player == null ? (false, 0, 0) : (true, (int)World.Player.X, (int)World.Player.Y));
+
+            int[] distances = inGame ? LongDistancePathfinder.GetWalkingDistances(startX, startY, points, Math.Clamp(distance, 0, LongDistancePathfinder.MAX_TARGET_RANGE), Math.Clamp(maxDistance, 1, 1000), CancellationToken.Token) : null;
+
+            for (int i = 0; i < points.Count; i++)
+                results.Add(distances?[i] ?? -1);
+
+            return results;
+        }
+
         /// <summary>
         /// Automatically follow a mobile. This is different than pathfinding. This will continune to follow the mobile.
         /// Example:
@@ -1855,11 +1985,8 @@ namespace ClassicUO.LegionScripting
         /// <returns>True if target was matching the type, or false if not/timed out</returns>
         public bool WaitForTarget(string targetType = "any", double timeout = 5)
         {
-            //Can't use Time.Ticks due to threading concerns
-            DateTime expire = DateTime.UtcNow.AddSeconds(timeout);
-
-
             TargetType targetT = TargetType.Neutral;
+            bool any = targetType.ToLower() == "any";
 
             switch (targetType.ToLower())
             {
@@ -1867,13 +1994,11 @@ namespace ClassicUO.LegionScripting
                 case "beneficial" or "ben": targetT = TargetType.Beneficial; break;
             }
 
-            while (!MainThreadQueue.InvokeOnMainThread(() => { return World.TargetManager.IsTargeting && (World.TargetManager.TargetingType == targetT || targetType.ToLower() == "any"); }))
-            {
-                if (DateTime.UtcNow > expire)
-                    return false;
-            }
-
-            return true;
+            return ScriptWaits.WaitUntil
+            (
+                () => World.TargetManager.IsTargeting && (World.TargetManager.TargetingType == targetT || any), timeout, CancellationToken.Token,
+                ScriptWaits.OnTargetCursorChanged
+            );
         }
 
         /// <summary>
@@ -1926,16 +2051,14 @@ namespace ClassicUO.LegionScripting
         /// <returns>The serial of the object targeted</returns>
         public uint RequestTarget(double timeout = 5)
         {
-            DateTime expire = DateTime.Now.AddSeconds(timeout);
             MainThreadQueue.InvokeOnMainThread(() =>
             {
                 World.TargetManager.LastTargetInfo.Clear();
                 World.TargetManager.SetTargeting(CursorTarget.Internal, CursorType.Target, TargetType.Neutral);
             });
 
-            while (DateTime.Now < expire)
-                if (!MainThreadQueue.InvokeOnMainThread(() => World.TargetManager.IsTargeting))
-                    return World.TargetManager.LastTargetInfo.Serial;
+            if (ScriptWaits.WaitUntil(() => !World.TargetManager.IsTargeting, timeout, CancellationToken.Token, ScriptWaits.OnTargetCursorChanged))
+                return World.TargetManager.LastTargetInfo.Serial;
 
             MainThreadQueue.InvokeOnMainThread(() => World.TargetManager.Reset());
 
@@ -1973,20 +2096,14 @@ namespace ClassicUO.LegionScripting
         /// </example>
         public PyGameObject RequestAnyTarget(double timeout = 5)
         {
-            DateTime expire = DateTime.Now.AddSeconds(timeout);
             MainThreadQueue.InvokeOnMainThread(() =>
             {
                 World.TargetManager.LastTargetInfo.Clear();
                 World.TargetManager.SetTargeting(CursorTarget.Internal, CursorType.Target, TargetType.Neutral);
             });
 
-            while (DateTime.Now < expire)
+            if (ScriptWaits.WaitUntil(() => !World.TargetManager.IsTargeting, timeout, CancellationToken.Token, ScriptWaits.OnTargetCursorChanged))
             {
-                if (MainThreadQueue.InvokeOnMainThread(() => World.TargetManager.IsTargeting))
-                {
-                    continue;
-                }
-
                 return MainThreadQueue.InvokeOnMainThread<PyGameObject>(() =>
                 {
                     LastTargetInfo info = World.TargetManager.LastTargetInfo;
@@ -2321,14 +2438,7 @@ namespace ClassicUO.LegionScripting
         public string ItemNameAndProps(uint serial, bool wait = false, int timeout = 10)
         {
             if (wait)
-            {
-                DateTime expire = DateTime.UtcNow.AddSeconds(timeout);
-
-                while (!MainThreadQueue.InvokeOnMainThread(() => World.OPL.Contains(serial)) && DateTime.UtcNow < expire)
-                {
-                    Thread.Sleep(100);
-                }
-            }
+                ScriptWaits.WaitUntil(() => World.OPL.Contains(serial), timeout, CancellationToken.Token, ScriptWaits.OnOPLReceived);
 
             return MainThreadQueue.InvokeOnMainThread
             (() =>
@@ -2355,6 +2465,87 @@ namespace ClassicUO.LegionScripting
                 World.OPL.Contains(s); //Check if it already exists, if not request it
         });
 
+        /// <summary>
+        /// Get the name and properties of many objects at once.
+        /// Missing properties, and ones the server reported as changed, are requested together and this waits for all of them in one go
+        /// instead of one object after another.
+        /// Example:
+        /// ```py
+        /// items = API.ItemsInContainer(API.Backpack)
+        /// props = API.GetPropertiesBulk([i.Serial for i in items], 3)
+        /// for item in items:
+        ///   p = props[item.Serial]
+        ///   if p and p.Get("Hit Lightning") >= 50:
+        ///     API.SysMsg(f"{p.Name} has {p.Get('Hit Lightning')} hit lightning")
+        /// ```
+        /// </summary>
+        /// <param name="serials">Serials of the objects</param>
+        /// <param name="timeout">Seconds to wait for properties that aren't known yet</param>
+        /// <returns>A dict of serial to PyItemProperties, None for objects whose properties didn't arrive in time</returns>
+        public PythonDictionary GetPropertiesBulk(IList<uint> serials, double timeout = 5)
+        {
+            var result = new PythonDictionary();
+
+            if (serials == null || serials.Count == 0)
+                return result;
+
+            // Only touched on the main thread
+            var waiting = new HashSet<uint>();
+            EventHandler<OPLEventArgs> received = (_, e) => waiting.Remove(e.Serial);
+
+            MainThreadQueue.InvokeOnMainThread(() =>
+            {
+                foreach (uint serial in serials)
+                {
+                    if (!World.OPL.TryGetRevision(serial, out _))
+                    {
+                        World.OPL.Contains(serial); //Requests it
+                        waiting.Add(serial);
+                    }
+                    else if (SharedStore.HasMegaCliLocRequest(serial))
+                    {
+                        waiting.Add(serial);
+                    }
+                }
+
+                // Subscribed before the requests go out so no answer is missed
+                EventSink.OPLOnReceive += received;
+            });
+
+            List<(uint serial, string name, string data)> found;
+
+            try
+            {
+                ScriptWaits.WaitUntil(() => waiting.Count == 0, timeout, CancellationToken.Token, ScriptWaits.OnOPLReceived);
+            }
+            finally
+            {
+                found = MainThreadQueue.InvokeOnMainThread(() =>
+                {
+                    EventSink.OPLOnReceive -= received;
+
+                    var list = new List<(uint serial, string name, string data)>(serials.Count);
+
+                    foreach (uint serial in serials)
+                    {
+                        if (World.OPL.TryGetNameAndData(serial, out string n, out string d))
+                            list.Add((serial, n, d));
+                    }
+
+                    return list;
+                });
+            }
+
+            foreach (uint serial in serials)
+                result[serial] = null;
+
+            // Parsed here instead of on the main thread
+            foreach ((uint serial, string name, string data) in found)
+                result[serial] = new PyItemProperties(serial, name, data);
+
+            return result;
+        }
+
         /// <summary>
         /// Check if a player has a server gump. Leave blank to check if they have any server gump.
         /// Example:
@@ -2644,20 +2835,142 @@ namespace ClassicUO.LegionScripting
             if (World.Player == null)
                 return false;
 
-            DateTime expire = DateTime.UtcNow.AddSeconds(delay);
-
             if (ID == uint.MaxValue)
                 ID = World.Player.LastGumpID;
 
-            while (!MainThreadQueue.InvokeOnMainThread(() => UIManager.GetGumpServer(ID) != null))
+            return ScriptWaits.WaitUntil(() => UIManager.GetGumpServer(ID) != null, delay, CancellationToken.Token, ScriptWaits.OnGumpAdded);
+        }
+
+        /// <summary>
+        /// Wait until any of the given conditions happens, or the timeout expires.
+        /// The script sleeps while waiting and wakes up in the same frame the condition happens.
+        /// Create conditions with `API.WhenJournal`, `API.WhenGump`, `API.WhenTarget`, `API.WhenBuff`, `API.WhenHitsBelow` and `API.WhenItemInContainer`.
+        /// Example:
+        /// ```py
+        /// conditions = [API.WhenJournal("You put the"), API.WhenJournal("You fail"), API.WhenHitsBelow(40)]
+        /// fired = API.WaitFor(conditions, 10)
+        /// if fired == 2:
+        ///   API.SysMsg("Low on health!")
+        /// elif fired == -1:
+        ///   API.SysMsg("Timed out")
+        /// ```
+        /// </summary>
+        /// <param name="conditions">A list of conditions</param>
+        /// <param name="timeout">Max duration in seconds to wait</param>
+        /// <returns>The index of the condition that happened, or -1 if timed out</returns>
+        public int WaitFor(IList<PyWaitCondition> conditions, double timeout = 5) => ScriptWaits.WaitAny(conditions, timeout, CancellationToken.Token);
+
+        /// <summary>
+        /// A condition for `API.WaitFor` that happens when your journal contains a message.
+        /// </summary>
+        /// <param name="msg">The message to check for. Can be regex, prepend your msg with $</param>
+        /// <param name="clearMatches">Clear the matching journal entry when it is found</param>
+        /// <returns>A wait condition</returns>
+        public PyWaitCondition WhenJournal(string msg, bool clearMatches = false) =>
+            new($"Journal '{msg}'", () => InJournal(msg, clearMatches), ScriptWaits.OnJournalEntryAdded);
+
+        /// <summary>
+        /// A condition for `API.WaitFor` that happens when a server gump is open.
+        /// </summary>
+        /// <param name="ID">The gump ID, leave blank for any new server gump</param>
+        /// <returns>A wait condition</returns>
+        public PyWaitCondition WhenGump(uint ID = uint.MaxValue)
+        {
+            if (ID != uint.MaxValue)
+                return new PyWaitCondition($"Gump {ID}", () => UIManager.GetGumpServer(ID) != null, ScriptWaits.OnGumpAdded);
+
+            bool opened = false;
+
+            return new PyWaitCondition
+            (
+                "Any gump", () => opened, callback =>
+                {
+                    // Only gumps opened during this wait count, the condition can be reused for later waits
+                    opened = false;
+
+                    EventHandler<EventArgs> handler = (sender, _) =>
+                    {
+                        if (sender is Gump { ServerSerial: > 0 })
+                        {
+                            opened = true;
+                            callback();
+                        }
+                    };
+
+                    EventSink.OnGumpAdded += handler;
+
+                    return () =>
+                    {
+                        EventSink.OnGumpAdded -= handler;
+                        opened = false;
+                    };
+                }
+            );
+        }
+
+        /// <summary>
+        /// A condition for `API.WaitFor` that happens when you have a target cursor.
+        /// </summary>
+        /// <param name="targetType">neutral/harmful/beneficial/any/harm/ben</param>
+        /// <returns>A wait condition</returns>
+        public PyWaitCondition WhenTarget(string targetType = "any")
+        {
+            TargetType targetT = TargetType.Neutral;
+            bool any = targetType.ToLower() == "any";
+
+            switch (targetType.ToLower())
             {
-                if (DateTime.UtcNow > expire)
-                    return false;
+                case "harmful" or "harm": targetT = TargetType.Harmful; break;
+                case "beneficial" or "ben": targetT = TargetType.Beneficial; break;
             }
 
-            return true;
+            return new PyWaitCondition
+            (
+                $"Target {targetType}", () => World.TargetManager.IsTargeting && (World.TargetManager.TargetingType == targetT || any),
+                ScriptWaits.OnTargetCursorChanged
+            );
         }
 
+        /// <summary>
+        /// A condition for `API.WaitFor` that happens when a buff is active.
+        /// </summary>
+        /// <param name="buffName">The name/title of the buff</param>
+        /// <returns>A wait condition</returns>
+        public PyWaitCondition WhenBuff(string buffName) => new
+        (
+            $"Buff '{buffName}'", () =>
+            {
+                if (string.IsNullOrEmpty(buffName) || World.Player == null)
+                    return false;
+
+                foreach (BuffIcon buff in World.Player.BuffIcons.Values)
+                    if (buff != null && buff.Title.Contains(buffName, StringComparison.OrdinalIgnoreCase))
+                        return true;
+
+                return false;
+            }, ScriptWaits.OnBuffAdded
+        );
+
+        /// <summary>
+        /// A condition for `API.WaitFor` that happens when your hits drop below a value.
+        /// </summary>
+        /// <param name="hits">Hit points</param>
+        /// <returns>A wait condition</returns>
+        public PyWaitCondition WhenHitsBelow(int hits) =>
+            new($"Hits below {hits}", () => World.Player != null && World.Player.Hits < hits, ScriptWaits.OnPlayerHitsChanged);
+
+        /// <summary>
+        /// A condition for `API.WaitFor` that happens when an item is inside a container (including sub containers).
+        /// </summary>
+        /// <param name="graphic">Graphic of the item</param>
+        /// <param name="container">Container serial</param>
+        /// <param name="hue">Hue of the item, leave blank for any hue</param>
+        /// <returns>A wait condition</returns>
+        public PyWaitCondition WhenItemInContainer(uint graphic, uint container, ushort hue = ushort.MaxValue) => new
+        (
+            $"Item 0x{graphic:X4} in 0x{container:X8}", () => Utility.ContainerHasItem(World.Items.Get(container), graphic, hue), ScriptWaits.OnItemCreatedOrUpdated
+        );
+
         /// <summary>
         /// Close all menu and context menus open.
         /// </summary>
@@ -2765,21 +3078,21 @@ namespace ClassicUO.LegionScripting
             if (string.IsNullOrEmpty(msg))
                 return false;
 
-            foreach (PyJournalEntry je in JournalEntries.ToArray())
-            {
-                if (je.Disposed) continue;
+            Regex rx = msg.StartsWith("$") ? RegexHelper.GetRegex(msg.Substring(1)) : null;
 
-                if (msg.StartsWith("$") && Regex.IsMatch(je.Text, msg.Substring(1)))
+            foreach (PyJournalEntry je in journal.Entries())
+            {
+                if (rx != null && rx.IsMatch(je.Text))
                 {
                     if (clearMatches)
-                        je.Disposed = true;
+                        journal.Clear(je);
                     return true;
                 }
 
                 if (je.Text.Contains(msg))
                 {
                     if (clearMatches)
-                        je.Disposed = true;
+                        journal.Clear(je);
                     return true;
                 }
             }
@@ -2868,31 +3181,42 @@ namespace ClassicUO.LegionScripting
             if (msgs == null || msgs.Count == 0)
                 return false;
 
-            foreach (PyJournalEntry je in JournalEntries.ToArray())
+            JournalMatcher matcher = anyMatcher;
+
+            if (matcher == null || !matcher.IsFor(msgs))
+                anyMatcher = matcher = new JournalMatcher(msgs);
+
+            foreach (PyJournalEntry je in journal.Entries())
             {
-                if (je.Disposed) continue;
+                if (matcher.Match(je.Text) < 0)
+                    continue;
 
-                foreach (string msg in msgs)
-                {
-                    if (msg.StartsWith("$") && Regex.IsMatch(je.Text, msg.Substring(1)))
-                    {
-                        if (clearMatches)
-                            je.Disposed = true;
-                        return true;
-                    }
+                if (clearMatches)
+                    journal.Clear(je);
 
-                    if (je.Text.Contains(msg))
-                    {
-                        if (clearMatches)
-                            je.Disposed = true;
-                        return true;
-                    }
-                }
+                return true;
             }
 
             return false;
         }
 
+        /// <summary>
+        /// Create a reusable journal matcher from a list of messages. Prepend a message with $ to use regex.
+        /// Much faster than InJournalAny when checking many messages often, each journal entry is only checked once.
+        /// See [PyJournalMatcher](PyJournalMatcher.md).
+        /// Example:
+        /// ```py
+        /// matcher = API.CompileJournalMatcher(["You have been slain", "$^You (fail|succeed)"])
+        /// while True:
+        ///   if matcher.InJournal(True):
+        ///     API.SysMsg(f"Found message {matcher.LastMatch}: {matcher.LastEntry.Text}")
+        ///   API.Pause(0.1)
+        /// ```
+        /// </summary>
+        /// <param name="msgs">List of messages</param>
+        /// <returns>A PyJournalMatcher</returns>
+        public PyJournalMatcher CompileJournalMatcher(IList<string> msgs) => new(new JournalMatcher(msgs ?? []), journal);
+
         /// <summary>
         /// Get all the journal entires in the last X seconds.
         /// matchingText supports regex with $ prepended.
@@ -2915,11 +3239,8 @@ namespace ClassicUO.LegionScripting
 
             bool checkMatches = !string.IsNullOrEmpty(matchingText);
 
-            foreach (PyJournalEntry je in JournalEntries)
+            foreach (PyJournalEntry je in journal.EntriesSince(cutoff))
             {
-                if (je.Time < cutoff || je.Disposed)
-                    continue;
-
                 if (!checkMatches)
                 {
                     entries.Add(je);
@@ -2958,32 +3279,21 @@ namespace ClassicUO.LegionScripting
         {
             if (string.IsNullOrEmpty(matchingEntries))
             {
-                while (JournalEntries.TryDequeue(out _))
-                {
-                }
+                journal.Clear();
             }
             else
             {
-                ConcurrentQueue<PyJournalEntry> newQueue = new();
-
-                foreach (PyJournalEntry je in JournalEntries.ToArray())
+                foreach (PyJournalEntry je in journal.Entries())
                 {
                     if (matchingEntries.StartsWith("$") && RegexHelper.GetRegex(matchingEntries.Substring(1)).IsMatch(je.Text))
                     {
-                        je.Disposed = true;
+                        journal.Clear(je);
                         continue;
                     }
 
                     if (je.Text.Contains(matchingEntries))
-                    {
-                        je.Disposed = true;
-                        continue;
-                    }
-
-                    newQueue.Enqueue(je);
+                        journal.Clear(je);
                 }
-
-                Interlocked.Exchange(ref journalEntries, newQueue);
             }
         }
 
@@ -2999,12 +3309,61 @@ namespace ClassicUO.LegionScripting
         {
             seconds = Math.Clamp(seconds, 0, 30);
 
-            Task.Delay(TimeSpan.FromSeconds(seconds), cancellationToken: CancellationToken.Token).Wait(cancellationToken: CancellationToken.Token);
+            long start = Stopwatch.GetTimestamp();
+
+            //Waiting on the token's handle directly avoids a timer task per pause, which adds up with many scripts running
+            bool cancelled = CancellationToken.Token.WaitHandle.WaitOne(TimeSpan.FromSeconds(seconds));
+
+            ScriptProfiler.RecordPause(Stopwatch.GetTimestamp() - start);
+
+            if (cancelled)
+                throw new OperationCanceledException(CancellationToken.Token);
 
             if (StopRequested)
                 throw new ThreadInterruptedException();
         }
 
+        /// <summary>
+        /// Run several API calls in a single game frame instead of waiting for a frame per call.
+        /// Use with `with`, every API call inside the block is run back to back on the game thread.
+        /// Keep the block short, the game will not draw while it is open (it is released automatically after maxMs).
+        /// Example:
+        /// ```py
+        /// with API.Batch():
+        ///   hits = [API.FindMobile(s) for s in API.GetPartyMemberSerials()]
+        ///   bandages = API.FindType(0x0E21, API.Backpack)
+        /// ```
+        /// </summary>
+        /// <param name="maxMs">Max time in milliseconds the game will wait on this batch</param>
+        /// <returns>A batch object, use it in a `with` statement</returns>
+        public MainThreadBatch Batch(int maxMs = MainThreadBatch.DEFAULT_MAX_HOLD_MS) => MainThreadQueue.BeginBatch(Math.Clamp(maxMs, 1, 250));
+
+        /// <summary>
+        /// Call each function in the list inside a single batch, see `API.Batch()`.
+        /// Example:
+        /// ```py
+        /// hits, mana, found = API.RunBatch([lambda: API.Player.Hits, lambda: API.Player.Mana, lambda: API.FindType(0x0E21)])
+        /// ```
+        /// </summary>
+        /// <param name="calls">A list of functions taking no arguments</param>
+        /// <param name="maxMs">Max time in milliseconds the game will wait on this batch</param>
+        /// <returns>A list of the results, in the same order as the functions</returns>
+        public PythonList RunBatch(IList<object> calls, int maxMs = MainThreadBatch.DEFAULT_MAX_HOLD_MS)
+        {
+            var results = new PythonList();
+
+            if (calls == null || calls.Count == 0)
+                return results;
+
+            using (Batch(maxMs))
+            {
+                foreach (object call in calls)
+                    results.Add(call != null && engine.Operations.IsCallable(call) ? engine.Operations.Invoke(call) : null);
+            }
+
+            return results;
+        }
+
         /// <summary>
         /// Stops the current script.
         /// Example:
@@ -3086,7 +3445,7 @@ namespace ClassicUO.LegionScripting
         (() =>
             {
                 Found = 0;
-                uint m = Utility.FindNearestCheckPythonIgnore((ScanTypeObject)scanType, this);
+                uint m = Utility.FindNearestCheckPythonIgnore((ScanTypeObject)scanType, this, maxDistance);
 
                 Entity e = World.Get(m);
 
@@ -3128,10 +3487,16 @@ namespace ClassicUO.LegionScripting
             return MainThreadQueue.BubblingInvokeOnMainThread
             (() =>
                 {
-                    Mobile mob = World.Mobiles.Values.Where
-                    (m => !m.IsDestroyed && !m.IsDead && m.Serial != World.Player.Serial && requestedNotoriety.Contains
-                            ((Notoriety)(byte)m.NotorietyFlag) && m.Distance <= maxDistance && !OnIgnoreList(m)
-                    ).OrderBy(m => m.Distance).FirstOrDefault();
+                    Mobile mob = null;
+
+                    foreach (Mobile m in Utility.MobilesInRange(maxDistance))
+                    {
+                        if (m.IsDestroyed || m.IsDead || m.Serial == World.Player.Serial || m.Distance > maxDistance || (mob != null && m.Distance >= mob.Distance))
+                            continue;
+
+                        if (requestedNotoriety.Contains((Notoriety)(byte)m.NotorietyFlag) && !OnIgnoreList(m))
+                            mob = m;
+                    }
 
                     if (mob != null)
                     {
@@ -3193,7 +3558,7 @@ namespace ClassicUO.LegionScripting
 
                 Notoriety[] requestedNotoriety = Utility.ConvertNotorietyOrThrow(notoriety);
 
-                Mobile[] list = World.Mobiles.Values.Where
+                Mobile[] list = Utility.MobilesInRange(maxDistance).Where
                 (m => !m.IsDestroyed && !m.IsDead && m.Serial != World.Player.Serial && requestedNotoriety.Contains
                      ((Notoriety)(byte)m.NotorietyFlag) && m.Distance <= maxDistance && !OnIgnoreList(m)
                 ).OrderBy(m => m.Distance).ToArray();
@@ -3250,7 +3615,7 @@ namespace ClassicUO.LegionScripting
         /// <returns></returns>
         public PyMobile[] GetAllMobiles(ushort? graphic = null, int? distance = null, IList<Notoriety> notoriety = null) => MainThreadQueue.BubblingInvokeOnMainThread(() =>
         {
-            IEnumerable<Mobile> mobiles = World.Mobiles.Values.AsEnumerable();
+            IEnumerable<Mobile> mobiles = distance.HasValue ? Utility.MobilesInRange(distance.Value) : World.Mobiles.Values;
 
             if (graphic.HasValue)
                 mobiles = mobiles.Where(m => m.Graphic == graphic.Value);
@@ -3267,6 +3632,23 @@ namespace ClassicUO.LegionScripting
             return mobiles.Select(m => new PyMobile(m)).ToArray();
         });
 
+        /// <summary>
+        /// Take a snapshot of the player, nearby mobiles and your backpack, all from the same game frame.
+        /// Reading from the snapshot is instant and does not wait on the game, but values will not update, call this again for fresh data.
+        /// See [PySnapshot](PySnapshot.md) for what is available.
+        /// Example:
+        /// ```py
+        /// snap = API.Snapshot(12)
+        /// for mob in snap.Mobiles:
+        ///   if mob.Serial in party and mob.Hits < mob.HitsMax * 0.7:
+        ///     API.SysMsg(f"Heal {mob.Name}")
+        /// ```
+        /// </summary>
+        /// <param name="distance">Max distance for mobiles to include</param>
+        /// <param name="includeBackpack">Include the backpack and everything in it</param>
+        /// <returns>A PySnapshot</returns>
+        public PySnapshot Snapshot(int distance = 18, bool includeBackpack = true) => MainThreadQueue.BubblingInvokeOnMainThread(() => new PySnapshot(World, distance, includeBackpack));
+
         /// <summary>
         /// Get the tile at a location.
         /// Example:
@@ -3458,6 +3840,237 @@ namespace ClassicUO.LegionScripting
             return multis;
         });
 
+        /// <summary>
+        /// Map chunks read per game frame by <see cref="ScanArea"/>.
+        /// </summary>
+        private const int SCAN_CHUNKS_PER_FRAME = 32;
+
+        /// <summary>
+        /// Gets statics, and optionally land and multis, in a rectangular area as column arrays instead of one object per tile.
+        /// Much faster than GetStaticsInArea for large areas. The map is read one 8x8 chunk at a time and large areas are spread over several frames so the client doesn't stall.
+        /// Only loaded map chunks are scanned, same as GetStaticsInArea.
+        /// Example:
+        /// ```py
+        /// trees = API.ScanArea(1000, 1000, 1200, 1200, [0x0CCA, 0x0CCB, 0x0CCC])
+        /// API.SysMsg(f"Found {trees.Count} trees")
+        /// for i in range(trees.Count):
+        ///   API.SysMsg(f"{trees.Graphic[i]} at {trees.X[i]}, {trees.Y[i]}, {trees.Z[i]}")
+        /// ```
+        /// </summary>
+        /// <param name="x1">Starting X coordinate</param>
+        /// <param name="y1">Starting Y coordinate</param>
+        /// <param name="x2">Ending X coordinate</param>
+        /// <param name="y2">Ending Y coordinate</param>
+        /// <param name="graphics">Optional list of graphics to keep, everything else is skipped</param>
+        /// <param name="statics">Include statics</param>
+        /// <param name="multis">Include multi (house) components</param>
+        /// <param name="land">Include land tiles</param>
+        /// <returns>A PyAreaScan with X, Y, Z, Graphic, Hue, Flags and Kind arrays</returns>
+        public PyAreaScan ScanArea(int x1, int y1, int x2, int y2, IList<uint> graphics = null, bool statics = true, bool multis = false, bool land = false)
+        {
+            var scan = new PyAreaScan();
+
+            int minX = Math.Max(0, Math.Min(x1, x2));
+            int maxX = Math.Max(x1, x2);
+            int minY = Math.Max(0, Math.Min(y1, y2));
+            int maxY = Math.Max(y1, y2);
+
+            if (maxX < minX || maxY < minY)
+                return scan;
+
+            HashSet<ushort> filter = null;
+
+            if (graphics != null && graphics.Count > 0)
+            {
+                filter = new HashSet<ushort>(graphics.Count);
+
+                foreach (uint g in graphics)
+                    filter.Add((ushort)g);
+            }
+
+            int minCX = minX >> 3, maxCX = maxX >> 3;
+            int minCY = minY >> 3, maxCY = maxY >> 3;
+            int rows = maxCY - minCY + 1;
+            int total = (maxCX - minCX + 1) * rows;
+
+            if (statics || land)
+            {
+                for (int next = 0; next < total;)
+                {
+                    if (StopRequested)
+                        throw new ThreadInterruptedException();
+
+                    int start = next;
+                    next = Math.Min(total, next + SCAN_CHUNKS_PER_FRAME);
+                    int end = next;
+
+                    bool loaded = MainThreadQueue.InvokeOnMainThread(() =>
+                    {
+                        if (World.Map is null)
+                            return false;
+
+                        for (int i = start; i < end; i++)
+                            ScanChunk(World.Map.GetChunk2(minCX + i / rows, minCY + i % rows, false), scan, minX, minY, maxX, maxY, filter, statics, land);
+
+                        return true;
+                    });
+
+                    if (!loaded)
+                        break;
+                }
+            }
+
+            if (multis)
+            {
+                MainThreadQueue.InvokeOnMainThread(() =>
+                {
+                    if (World.HouseManager == null)
+                        return;
+
+                    foreach (House house in World.HouseManager.Houses)
+                    {
+                        foreach (Multi m in house.Components)
+                        {
+                            if (m.IsDestroyed || m.X < minX || m.X > maxX || m.Y < minY || m.Y > maxY || (filter != null && !filter.Contains(m.Graphic)))
+                                continue;
+
+                            scan.Add(PyAreaScan.KIND_MULTI, m.X, m.Y, m.Z, m.Graphic, m.Hue, (ulong)m.ItemData.Flags);
+                        }
+                    }
+                });
+            }
+
+            scan.Finish();
+
+            return scan;
+        }
+
+        private static void ScanChunk(Game.Map.Chunk chunk, PyAreaScan scan, int minX, int minY, int maxX, int maxY, HashSet<ushort> filter, bool statics, bool land)
+        {
+            if (chunk == null)
+                return;
+
+            int baseX = chunk.X << 3, baseY = chunk.Y << 3;
+            int fromX = Math.Max(minX - baseX, 0), toX = Math.Min(maxX - baseX, 7);
+            int fromY = Math.Max(minY - baseY, 0), toY = Math.Min(maxY - baseY, 7);
+
+            for (int tx = fromX; tx <= toX; tx++)
+            {
+                for (int ty = fromY; ty <= toY; ty++)
+                {
+                    for (GameObject obj = chunk.GetHeadObject(tx, ty); obj != null; obj = obj.TNext)
+                    {
+                        if (filter != null && !filter.Contains(obj.Graphic))
+                            continue;
+
+                        if (statics && obj is Static st)
+                            scan.Add(PyAreaScan.KIND_STATIC, baseX + tx, baseY + ty, st.Z, st.Graphic, st.Hue, (ulong)st.ItemData.Flags);
+                        else if (land && obj is Land l)
+                            scan.Add(PyAreaScan.KIND_LAND, baseX + tx, baseY + ty, l.Z, l.Graphic, 0, (ulong)l.TileData.Flags);
+                    }
+                }
+            }
+        }
+
+        /// <summary>
+        /// Like ScanArea, but reads straight from the map files instead of the loaded world.
+        /// Works for any area on any facet, including facets you haven't visited, and never waits for the game thread.
+        /// The first scan of a facet you haven't visited loads that facet's map index, which can take a moment.
+        /// Only land and statics from the map files are included, no houses, tile markers or seasonal graphics.
+        /// Example:
+        /// ```py
+        /// floor = API.ScanMapArea(5300, 100, 5500, 300, 0, [0x053B])
+        /// API.SysMsg(f"Found {floor.Count} cave floor statics on Felucca")
+        /// ```
+        /// </summary>
+        /// <param name="x1">Starting X coordinate</param>
+        /// <param name="y1">Starting Y coordinate</param>
+        /// <param name="x2">Ending X coordinate</param>
+        /// <param name="y2">Ending Y coordinate</param>
+        /// <param name="map">Facet to read, -1 for the current one</param>
+        /// <param name="graphics">Optional list of graphics to keep, everything else is skipped</param>
+        /// <param name="statics">Include statics</param>
+        /// <param name="land">Include land tiles</param>
+        /// <returns>A PyAreaScan with X, Y, Z, Graphic, Hue, Flags and Kind arrays</returns>
+        /// <exception cref="ArgumentException">The facet isn't in the client files</exception>
+        public PyAreaScan ScanMapArea(int x1, int y1, int x2, int y2, int map = -1, IList<uint> graphics = null, bool statics = true, bool land = false)
+        {
+            var scan = new PyAreaScan();
+
+            if (map < 0)
+                map = World.MapIndex;
+
+            int minX = Math.Max(0, Math.Min(x1, x2));
+            int maxX = Math.Max(x1, x2);
+            int minY = Math.Max(0, Math.Min(y1, y2));
+            int maxY = Math.Max(y1, y2);
+
+            if (!Game.Map.MapReader.EnsureLoaded(map))
+                throw new ArgumentException($"[ScanMapArea] Map {map} isn't in the client files.");
+
+            if (maxX < minX || maxY < minY)
+                return scan;
+
+            HashSet<ushort> filter = null;
+
+            if (graphics != null && graphics.Count > 0)
+            {
+                filter = new HashSet<ushort>(graphics.Count);
+
+                foreach (uint g in graphics)
+                    filter.Add((ushort)g);
+            }
+
+            TileDataLoader tileData = Client.Game.UO.FileManager.TileData;
+
+            for (int bx = minX >> 3; bx <= maxX >> 3; bx++)
+            {
+                if (StopRequested)
+                    throw new ThreadInterruptedException();
+
+                for (int by = minY >> 3; by <= maxY >> 3; by++)
+                {
+                    Game.Map.MapBlockData block = Game.Map.MapReader.GetBlock(map, bx, by);
+
+                    if (block == null)
+                        continue;
+
+                    int baseX = bx << 3, baseY = by << 3;
+
+                    if (land)
+                    {
+                        for (int i = 0; i < 64; i++)
+                        {
+                            int x = baseX + (i & 7), y = baseY + (i >> 3);
+                            ushort g = block.LandGraphic[i];
+
+                            if (x < minX || x > maxX || y < minY || y > maxY || (filter != null && !filter.Contains(g)))
+                                continue;
+
+                            scan.Add(PyAreaScan.KIND_LAND, x, y, block.LandZ[i], g, 0, (ulong)tileData.LandData[g].Flags);
+                        }
+                    }
+
+                    if (statics)
+                    {
+                        foreach (StaticsBlock sb in block.Statics)
+                        {
+                            int x = baseX + sb.X, y = baseY + sb.Y;
+
+                            if (x < minX || x > maxX || y < minY || y > maxY || (filter != null && !filter.Contains(sb.Color)))
+                                continue;
+
+                            scan.Add(PyAreaScan.KIND_STATIC, x, y, sb.Z, sb.Color, sb.Hue, (ulong)tileData.StaticData[sb.Color].Flags);
+                        }
+                    }
+                }
+            }
+
+            scan.Finish();
+
+            return scan;
+        }
+
         #region Friends List
 
         /// <summary>
@@ -3838,15 +4451,17 @@ namespace ClassicUO.LegionScripting
 
         /// <summary>
         /// Save a variable that persists between sessions and scripts.
+        /// Besides text, numbers, bools, bytes, None and nested lists, tuples and dicts of them can be saved and are returned as they were saved, no json needed.
         /// Example:
         /// ```py
-        /// API.SavePersistentVar("TotalKills", "5", API.PersistentVar.Char)
+        /// API.SavePersistentVar("TotalKills", 5, API.PersistentVar.Char)
+        /// API.SavePersistentVar("KillsByMob", {"ettin": 12, "troll": 3}, API.PersistentVar.Char)
         /// ```
         /// </summary>
         /// <param name="name"></param>
         /// <param name="value"></param>
         /// <param name="scope"></param>
-        public void SavePersistentVar(string name, string value, PersistentVar scope)
+        public void SavePersistentVar(string name, object value, PersistentVar scope)
         {
             if (string.IsNullOrEmpty(name))
             {
@@ -3854,7 +4469,67 @@ namespace ClassicUO.LegionScripting
                 return;
             }
 
-            PersistentVars.SaveVar(scope, name, value);
+            if (!TryGetStoredVarValue(name, value, out object stored))
+                return;
+
+            PersistentVars.SaveVars(scope, [new(name, stored)]);
+        }
+
+        /// <summary>
+        /// Save many persistent variables at once, they are written together instead of one by one.
+        /// Values can be anything SavePersistentVar accepts.
+        /// Example:
+        /// ```py
+        /// kills = {"kills_ettin": 12, "kills_troll": 3, "last_hunt": "Despise"}
+        /// API.SavePersistentVars(kills, API.PersistentVar.Char)
+        /// ```
+        /// </summary>
+        /// <param name="values">A dict of var names and values</param>
+        /// <param name="scope"></param>
+        public void SavePersistentVars(IDictionary<object, object> values, PersistentVar scope)
+        {
+            if (values == null || values.Count == 0)
+                return;
+
+            var stored = new List<KeyValuePair<string, object>>(values.Count);
+
+            foreach (KeyValuePair<object, object> kv in values)
+            {
+                if (kv.Key is not string name || name.Length == 0)
+                {
+                    GameActions.Print(World, "Var's must have a name.", 32);
+                    return;
+                }
+
+                if (!TryGetStoredVarValue(name, kv.Value, out object value))
+                    return;
+
+                stored.Add(new(name, value));
+            }
+
+            PersistentVars.SaveVars(scope, stored);
+        }
+
+        private bool TryGetStoredVarValue(string name, object value, out object stored)
+        {
+            // Plain text stays text so older scripts and the vars window keep reading it as before
+            if (value is string text)
+            {
+                stored = text;
+                return true;
+            }
+
+            try
+            {
+                stored = PersistentVarEncoding.Encode(value);
+                return true;
+            }
+            catch (ArgumentException e)
+            {
+                GameActions.Print(World, $"Can't save var '{name}': {e.Message}", 32);
+                stored = null;
+                return false;
+            }
         }
 
         /// <summary>
@@ -3878,16 +4553,16 @@ namespace ClassicUO.LegionScripting
         }
 
         /// <summary>
-        /// Get a persistent variable.
+        /// Get a persistent variable, returned with the type it was saved with.
         /// Example:
         /// ```py
-        /// API.GetPersistentVar("TotalKills", "0", API.PersistentVar.Char)
+        /// kills = API.GetPersistentVar("TotalKills", 0, API.PersistentVar.Char)
         /// ```
         /// </summary>
         /// <param name="name"></param>
         /// <param name="defaultValue">The value returned if no value was saved</param>
         /// <param name="scope"></param>
-        public string GetPersistentVar(string name, string defaultValue, PersistentVar scope)
+        public object GetPersistentVar(string name, object defaultValue, PersistentVar scope)
         {
             if (string.IsNullOrEmpty(name))
             {
@@ -3895,7 +4570,90 @@ namespace ClassicUO.LegionScripting
                 return defaultValue;
             }
 
-            return PersistentVars.GetVar(scope, name, defaultValue);
+            object stored = PersistentVars.GetStoredVar(scope, name);
+
+            return stored == null ? defaultValue : ToPersistentVarValue(name, stored, defaultValue);
+        }
+
+        /// <summary>
+        /// Get every persistent variable whose name starts with a prefix.
+        /// Example:
+        /// ```py
+        /// for name, kills in API.GetPersistentVars("kills_", API.PersistentVar.Char).items():
+        ///   API.SysMsg(f"{name[6:]}: {kills}")
+        /// ```
+        /// </summary>
+        /// <param name="prefix">Start of the var names to get, empty for all vars in the scope</param>
+        /// <param name="scope"></param>
+        /// <returns>A dict of var names and values</returns>
+        public PythonDictionary GetPersistentVars(string prefix, PersistentVar scope)
+        {
+            var result = new PythonDictionary();
+
+            foreach (KeyValuePair<string, object> kv in PersistentVars.GetStoredVars(scope, prefix))
+                result[kv.Key] = ToPersistentVarValue(kv.Key, kv.Value, null);
+
+            return result;
+        }
+
+        private object ToPersistentVarValue(string name, object stored, object defaultValue)
+        {
+            if (stored is not byte[] data)
+                return stored;
+
+            try
+            {
+                return PersistentVarEncoding.Decode(data);
+            }
+            catch (System.IO.InvalidDataException)
+            {
+                GameActions.Print(World, $"Persistent var '{name}' could not be read.", 32);
+                return defaultValue;
+            }
+        }
+
+        /// <summary>
+        /// Search the item database, the items saved from every character (enable it in Legion Assistant > Item Database).
+        /// Results are read a page at a time, newest first. Name and property searches match any part of the text.
+        /// Example:
+        /// ```py
+        /// search = API.SearchItemDatabase(properties="Hit Lightning 50")
+        /// for page in search:
+        ///   for item in page:
+        ///     API.SysMsg(f"{item.Name} in {item.Container} on {item.CharacterName}")
+        /// ```
+        /// </summary>
+        /// <param name="name">Text the item name contains, empty for any</param>
+        /// <param name="properties">Text the item properties contain, empty for any</param>
+        /// <param name="graphic">Graphic to match, or leave out for any</param>
+        /// <param name="hue">Hue to match, or leave out for any</param>
+        /// <param name="container">Serial of the container the items are directly in, or leave out for any</param>
+        /// <param name="characterName">Text the name of the character that saw the item contains, empty for any</param>
+        /// <param name="pageSize">Results per page, 1-1000</param>
+        /// <returns>A PyItemDatabaseSearch to read the pages from</returns>
+        public PyItemDatabaseSearch SearchItemDatabase(string name = "", string properties = "", uint graphic = uint.MaxValue, uint hue = uint.MaxValue, uint container = uint.MaxValue, string characterName = "", int pageSize = 100)
+        {
+            pageSize = Math.Clamp(pageSize, 1, 1000);
+
+            ushort? graphicFilter = graphic == uint.MaxValue ? null : (ushort)graphic;
+            ushort? hueFilter = hue == uint.MaxValue ? null : (ushort)hue;
+            uint? containerFilter = container == uint.MaxValue ? null : container;
+
+            return new PyItemDatabaseSearch
+            (
+                after =>
+                {
+                    var page = new TaskCompletionSource<List<ItemInfo>>(TaskCreationOptions.RunContinuationsAsynchronously);
+
+                    ItemDatabaseManager.Instance.SearchItems
+                    (
+                        page.SetResult, graphic: graphicFilter, hue: hueFilter, name: name, properties: properties, container: containerFilter,
+                        characterName: characterName, limit: pageSize, after: after
+                    );
+
+                    return page.Task;
+                }, pageSize, this
+            );
         }
 
         /// <summary>
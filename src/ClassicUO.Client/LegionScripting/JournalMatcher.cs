@@ -0,0 +1,93 @@
+using System.Collections.Generic;
+using System.Text.RegularExpressions;
+using ClassicUO.Utility;
+
+namespace ClassicUO.LegionScripting;
+
+/// <summary>
+/// Matches journal text against many patterns at once.
+/// Plain patterns are matched together with an <see cref="AhoCorasick"/> automaton, patterns prefixed with $ are compiled regexes.
+/// </summary>
+internal sealed class JournalMatcher
+{
+    private readonly AhoCorasick _literals;
+    private readonly int[] _literalIndex;
+    private readonly Regex[] _regexes;
+    private readonly int[] _regexIndex;
+
+    public readonly string[] Patterns;
+
+    public JournalMatcher(IList<string> patterns)
+    {
+        Patterns = new string[patterns.Count];
+
+        var literals = new List<string>();
+        var literalIndex = new List<int>();
+        var regexes = new List<Regex>();
+        var regexIndex = new List<int>();
+
+        for (int i = 0; i < patterns.Count; i++)
+        {
+            string p = patterns[i];
+            Patterns[i] = p;
+
+            if (string.IsNullOrEmpty(p))
+                continue;
+
+            if (p.StartsWith("$"))
+            {
+                regexes.Add(RegexHelper.GetRegex(p.Substring(1)));
+                regexIndex.Add(i);
+            }
+            else
+            {
+                literals.Add(p);
+                literalIndex.Add(i);
+            }
+        }
+
+        _literals = new AhoCorasick(literals);
+        _literalIndex = literalIndex.ToArray();
+        _regexes = regexes.ToArray();
+        _regexIndex = regexIndex.ToArray();
+    }
+
+    /// <summary>
+    /// Check if this matcher was built from the same patterns, in the same order.
+    /// </summary>
+    public bool IsFor(IList<string> patterns)
+    {
+        if (patterns.Count != Patterns.Length)
+            return false;
+
+        for (int i = 0; i < Patterns.Length; i++)
+            if (patterns[i] != Patterns[i])
+                return false;
+
+        return true;
+    }
+
+    /// <summary>
+    /// Find the first pattern (in the order given) that matches the text.
+    /// </summary>
+    /// <returns>The pattern index, or -1 if nothing matched</returns>
+    public int Match(string text)
+    {
+        if (text == null)
+            return -1;
+
+        int literal = _literals.FirstMatch(text);
+        int best = literal >= 0 ? _literalIndex[literal] : int.MaxValue;
+
+        for (int i = 0; i < _regexes.Length && _regexIndex[i] < best; i++)
+        {
+            if (_regexes[i].IsMatch(text))
+            {
+                best = _regexIndex[i];
+                break;
+            }
+        }
+
+        return best == int.MaxValue ? -1 : best;
+    }
+}
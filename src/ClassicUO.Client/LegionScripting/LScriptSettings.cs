@@ -8,5 +8,6 @@ namespace ClassicUO.LegionScripting
         public Dictionary<string, List<string>> CharAutoStartScripts { get; set; } = new Dictionary<string, List<string>>();
         public Dictionary<string, bool> GroupCollapsed { get; set; } = new Dictionary<string, bool>();
         public bool DisableModuleCache { get; set; }
+        public bool LightweightThreads { get; set; }
     }
 }
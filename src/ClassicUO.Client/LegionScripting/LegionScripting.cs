@@ -18,7 +18,6 @@ using ClassicUO.Game.UI;
 using ClassicUO.Game.UI.ImGuiControls.Legion;
 using ClassicUO.LegionScripting.PyClasses;
 using ClassicUO.Utility;
-using Microsoft.Scripting;
 
 namespace ClassicUO.LegionScripting
 {
@@ -34,14 +33,26 @@ namespace ClassicUO.LegionScripting
         public static readonly List<ScriptFile> LoadedScripts = [];
         public static List<ScriptFile> RunningScripts { get; } = [];
         public static readonly Dictionary<int, ScriptFile> PyThreads = new();
+        internal static readonly ScriptJournal Journal = new();
 
         private static bool _enabled, _loaded;
         private static World _world;
+        private static FileSystemWatcher _watcher;
+
+        /// <summary>
+        /// Stack size for script threads when LightweightThreads is enabled, the default is 1MB on Windows and 8MB on Linux
+        /// </summary>
+        private const int LIGHTWEIGHT_STACK_SIZE = 512 * 1024;
+
+        /// <summary>
+        /// Python recursion limit while LightweightThreads is enabled, low enough that deep recursion raises an error before the smaller stack overflows
+        /// </summary>
+        internal const int LIGHTWEIGHT_RECURSION_LIMIT = 200;
 
         public static void Init(World world)
         {
             _world = world;
-            Task.Factory.StartNew(Python.CreateEngine); //This is to preload engine stuff, helps with faster script startup later
+            ScriptEnginePool.Init(); //Warm up a few engines in the background for faster script startup
             ScriptPath = Path.GetFullPath(Path.Combine(CUOEnviroment.ExecutablePath, "LegionScripts"));
 
             if (!_loaded)
@@ -52,6 +63,7 @@ namespace ClassicUO.LegionScripting
             }
 
             LoadScriptsFromFile();
+            WatchScripts();
             LoadLScriptSettings();
             AutoPlayGlobal();
             AutoPlayChar();
@@ -157,12 +169,7 @@ namespace ClassicUO.LegionScripting
             if (e is null)
                 return;
 
-            foreach (ScriptFile script in RunningScripts)
-            {
-                script?.ScopedApi?.JournalEntries.Enqueue(new PyJournalEntry(e));
-
-                while (script?.ScopedApi?.JournalEntries.Count > ProfileManager.CurrentProfile.MaxJournalEntries) script.ScopedApi?.JournalEntries.TryDequeue(out _);
-            }
+            Journal.Add(e);
         }
 
         private static void EventSink_SoundPlayed(object sender, SoundEventArgs e)
@@ -197,6 +204,44 @@ namespace ClassicUO.LegionScripting
                 HandleScriptsInDirectory(file); //No third level supported, ignore directories
         }
 
+        private static void WatchScripts()
+        {
+            if (_watcher != null)
+                return;
+
+            try
+            {
+                _watcher = new FileSystemWatcher(ScriptPath)
+                {
+                    IncludeSubdirectories = true,
+                    NotifyFilter = NotifyFilters.LastWrite | NotifyFilters.FileName | NotifyFilters.Size
+                };
+
+                _watcher.Changed += (_, e) => OnScriptFileChanged(e.FullPath);
+                _watcher.Created += (_, e) => OnScriptFileChanged(e.FullPath);
+                _watcher.Renamed += (_, e) => OnScriptFileChanged(e.FullPath);
+                _watcher.Error += (_, _) => OnScriptFileChanged(null);
+                _watcher.EnableRaisingEvents = true;
+            }
+            catch (Exception e)
+            {
+                Log.Warn($"Unable to watch script folder for changes, scripts will be re-read on every play: {e.Message}");
+                _watcher = null;
+            }
+        }
+
+        /// <summary>
+        /// Called from the file watcher thread, a null path means changes may have been missed and all scripts are marked changed.
+        /// </summary>
+        private static void OnScriptFileChanged(string path) => MainThreadQueue.EnqueueAction
+        (() =>
+            {
+                foreach (ScriptFile script in LoadedScripts)
+                    if (path == null || string.Equals(script.FullPath, path, StringComparison.OrdinalIgnoreCase))
+                        script.MarkChanged();
+            }
+        );
+
         private static void AddScriptFromFile(string path)
         {
             string p = Path.GetDirectoryName(path);
@@ -381,6 +426,7 @@ namespace ClassicUO.LegionScripting
                 StopScript(RunningScripts[0]);
 
             PyThreads.Clear();
+            ScriptEnginePool.Clear();
 
             SaveScriptSettings();
 
@@ -396,8 +442,11 @@ namespace ClassicUO.LegionScripting
 
             if (script.PythonThread == null || !script.PythonThread.IsAlive)
             {
-                script.ReadFromFile();
-                script.PythonThread = new Thread(() => ExecutePythonScript(script));
+                if (_watcher == null)
+                    script.MarkChanged();
+
+                script.ReadFromFileIfChanged();
+                script.PythonThread = new Thread(() => ExecutePythonScript(script), LScriptSettings.LightweightThreads ? LIGHTWEIGHT_STACK_SIZE : 0);
 
                 if(!PyThreads.TryAdd(script.PythonThread.ManagedThreadId, script))
                     PyThreads[script.PythonThread.ManagedThreadId] = script;
@@ -410,13 +459,14 @@ namespace ClassicUO.LegionScripting
 
         private static void ExecutePythonScript(ScriptFile script)
         {
+            ScriptProfiler.SetCurrentScript(script.FullPath);
             script.SetupPythonEngine();
             script.SetupPythonScope();
+            ScriptWaits.SetScriptToken(script.ScopedApi.CancellationToken.Token);
 
             try
             {
-                ScriptSource source = script.PythonEngine.CreateScriptSourceFromString(script.FileContentsJoined, script.FullPath, SourceCodeKind.File);
-                source?.Execute(script.PythonScope);
+                script.GetCompiledCode().Execute(script.PythonScope);
             }
             catch (ThreadInterruptedException) { }
             catch (ThreadAbortException) { }
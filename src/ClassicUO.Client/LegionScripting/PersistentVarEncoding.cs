@@ -0,0 +1,338 @@
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using System.IO;
+using System.Numerics;
+using System.Text;
+using IronPython.Runtime;
+
+namespace ClassicUO.LegionScripting;
+
+/// <summary>
+/// Compact binary encoding for typed persistent vars.
+/// Handles None, bool, int, float, str, bytes and nested list, tuple and dict values.
+/// </summary>
+internal static class PersistentVarEncoding
+{
+    private const byte FORMAT_VERSION = 1;
+    private const int MAX_DEPTH = 64;
+
+    private const byte TAG_NONE = 0;
+    private const byte TAG_FALSE = 1;
+    private const byte TAG_TRUE = 2;
+    private const byte TAG_INT = 3;
+    private const byte TAG_BIGINT = 4;
+    private const byte TAG_FLOAT = 5;
+    private const byte TAG_STR = 6;
+    private const byte TAG_BYTES = 7;
+    private const byte TAG_LIST = 8;
+    private const byte TAG_TUPLE = 9;
+    private const byte TAG_DICT = 10;
+
+    /// <exception cref="ArgumentException">The value, or something nested in it, can't be stored</exception>
+    public static byte[] Encode(object value)
+    {
+        using var stream = new MemoryStream();
+        using var writer = new BinaryWriter(stream, Encoding.UTF8);
+
+        writer.Write(FORMAT_VERSION);
+        Write(writer, value, 0);
+        writer.Flush();
+
+        return stream.ToArray();
+    }
+
+    /// <exception cref="InvalidDataException">The data is not a value written by <see cref="Encode"/></exception>
+    public static object Decode(byte[] data)
+    {
+        if (data == null || data.Length == 0 || data[0] != FORMAT_VERSION)
+            throw new InvalidDataException("Unknown persistent var format");
+
+        using var reader = new BinaryReader(new MemoryStream(data, 1, data.Length - 1), Encoding.UTF8);
+
+        try
+        {
+            return Read(reader);
+        }
+        catch (EndOfStreamException)
+        {
+            throw new InvalidDataException("Persistent var data is truncated");
+        }
+    }
+
+    /// <summary>
+    /// Python style text for an encoded value, used where vars are shown as text.
+    /// </summary>
+    public static string ToDisplayString(byte[] data)
+    {
+        try
+        {
+            var sb = new StringBuilder();
+            Format(sb, Decode(data));
+
+            return sb.ToString();
+        }
+        catch (InvalidDataException)
+        {
+            return $"<{data.Length} bytes>";
+        }
+    }
+
+    private static void Write(BinaryWriter writer, object value, int depth)
+    {
+        if (depth > MAX_DEPTH)
+            throw new ArgumentException("Value is nested too deeply");
+
+        switch (value)
+        {
+            case null:
+                writer.Write(TAG_NONE);
+
+                break;
+
+            case bool b:
+                writer.Write(b ? TAG_TRUE : TAG_FALSE);
+
+                break;
+
+            case int i:
+                WriteInt(writer, i);
+
+                break;
+
+            case long l:
+                WriteInt(writer, l);
+
+                break;
+
+            case BigInteger big when big >= long.MinValue && big <= long.MaxValue:
+                WriteInt(writer, (long)big);
+
+                break;
+
+            case BigInteger big:
+                byte[] bigBytes = big.ToByteArray();
+                writer.Write(TAG_BIGINT);
+                writer.Write7BitEncodedInt(bigBytes.Length);
+                writer.Write(bigBytes);
+
+                break;
+
+            case double d:
+                writer.Write(TAG_FLOAT);
+                writer.Write(d);
+
+                break;
+
+            case float f:
+                writer.Write(TAG_FLOAT);
+                writer.Write((double)f);
+
+                break;
+
+            case string s:
+                writer.Write(TAG_STR);
+                writer.Write(s);
+
+                break;
+
+            case IList<byte> bytes:
+                writer.Write(TAG_BYTES);
+                writer.Write7BitEncodedInt(bytes.Count);
+
+                foreach (byte v in bytes)
+                    writer.Write(v);
+
+                break;
+
+            case PythonTuple tuple:
+                writer.Write(TAG_TUPLE);
+                writer.Write7BitEncodedInt(tuple.Count);
+
+                foreach (object item in tuple)
+                    Write(writer, item, depth + 1);
+
+                break;
+
+            case IDictionary<object, object> dict:
+                writer.Write(TAG_DICT);
+                writer.Write7BitEncodedInt(dict.Count);
+
+                foreach (KeyValuePair<object, object> kv in dict)
+                {
+                    Write(writer, kv.Key, depth + 1);
+                    Write(writer, kv.Value, depth + 1);
+                }
+
+                break;
+
+            case IList<object> list:
+                writer.Write(TAG_LIST);
+                writer.Write7BitEncodedInt(list.Count);
+
+                foreach (object item in list)
+                    Write(writer, item, depth + 1);
+
+                break;
+
+            default:
+                throw new ArgumentException($"Values of type {value.GetType().Name} can't be saved");
+        }
+    }
+
+    private static void WriteInt(BinaryWriter writer, long value)
+    {
+        writer.Write(TAG_INT);
+        writer.Write7BitEncodedInt64((value << 1) ^ (value >> 63));
+    }
+
+    private static object Read(BinaryReader reader)
+    {
+        byte tag = reader.ReadByte();
+
+        switch (tag)
+        {
+            case TAG_NONE: return null;
+            case TAG_FALSE: return false;
+            case TAG_TRUE: return true;
+
+            case TAG_INT:
+                ulong zigzag = (ulong)reader.Read7BitEncodedInt64();
+                long l = (long)(zigzag >> 1) ^ -(long)(zigzag & 1);
+
+                return l >= int.MinValue && l <= int.MaxValue ? (object)(int)l : new BigInteger(l);
+
+            case TAG_BIGINT: return new BigInteger(ReadBytes(reader));
+            case TAG_FLOAT: return reader.ReadDouble();
+            case TAG_STR: return reader.ReadString();
+            case TAG_BYTES: return new Bytes((IList<byte>)ReadBytes(reader));
+
+            case TAG_LIST:
+                int listCount = ReadCount(reader);
+                var list = new PythonList();
+
+                for (int i = 0; i < listCount; i++)
+                    list.Add(Read(reader));
+
+                return list;
+
+            case TAG_TUPLE:
+                var items = new object[ReadCount(reader)];
+
+                for (int i = 0; i < items.Length; i++)
+                    items[i] = Read(reader);
+
+                return new PythonTuple(items);
+
+            case TAG_DICT:
+                int dictCount = ReadCount(reader);
+                var dict = new PythonDictionary();
+
+                for (int i = 0; i < dictCount; i++)
+                {
+                    object key = Read(reader);
+                    dict[key] = Read(reader);
+                }
+
+                return dict;
+
+            default: throw new InvalidDataException($"Unknown persistent var tag {tag}");
+        }
+    }
+
+    private static int ReadCount(BinaryReader reader)
+    {
+        int count = reader.Read7BitEncodedInt();
+
+        // Every item takes at least one byte, anything larger can only come from corrupt data
+        if (count < 0 || count > reader.BaseStream.Length - reader.BaseStream.Position)
+            throw new InvalidDataException("Invalid persistent var length");
+
+        return count;
+    }
+
+    private static byte[] ReadBytes(BinaryReader reader) => reader.ReadBytes(ReadCount(reader));
+
+    private static void Format(StringBuilder sb, object value)
+    {
+        switch (value)
+        {
+            case null:
+                sb.Append("None");
+
+                break;
+
+            case bool b:
+                sb.Append(b ? "True" : "False");
+
+                break;
+
+            case double d:
+                sb.Append(d.ToString("R", CultureInfo.InvariantCulture));
+
+                break;
+
+            case string s:
+                sb.Append('\'').Append(s.Replace("\\", "\\\\").Replace("'", "\\'")).Append('\'');
+
+                break;
+
+            case IList<byte> bytes:
+                sb.Append('<').Append(bytes.Count).Append(" bytes>");
+
+                break;
+
+            case PythonTuple tuple:
+                sb.Append('(');
+                FormatItems(sb, tuple);
+                sb.Append(tuple.Count == 1 ? ",)" : ")");
+
+                break;
+
+            case PythonDictionary dict:
+                sb.Append('{');
+                bool first = true;
+
+                foreach (KeyValuePair<object, object> kv in dict)
+                {
+                    if (!first)
+                        sb.Append(", ");
+
+                    first = false;
+                    Format(sb, kv.Key);
+                    sb.Append(": ");
+                    Format(sb, kv.Value);
+                }
+
+                sb.Append('}');
+
+                break;
+
+            case PythonList list:
+                sb.Append('[');
+                FormatItems(sb, list);
+                sb.Append(']');
+
+                break;
+
+            default:
+                sb.Append(Convert.ToString(value, CultureInfo.InvariantCulture));
+
+                break;
+        }
+    }
+
+    private static void FormatItems(StringBuilder sb, IEnumerable<object> items)
+    {
+        bool first = true;
+
+        foreach (object item in items)
+        {
+            if (!first)
+                sb.Append(", ");
+
+            first = false;
+            Format(sb, item);
+        }
+    }
+}
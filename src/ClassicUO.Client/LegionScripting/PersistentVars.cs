@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.IO;
 using System.Threading;
@@ -8,18 +9,40 @@ using Microsoft.Data.Sqlite;
 
 namespace ClassicUO.LegionScripting
 {
+    /// <summary>
+    /// Variables saved between sessions and scripts.
+    /// The vars for the current char, account, server and global scopes are kept in memory from <see cref="Load"/>,
+    /// changes are written to the database in batches on a timer and when unloading.
+    /// Values are either text or typed values encoded with <see cref="PersistentVarEncoding"/>, stored as a blob.
+    /// </summary>
     public static class PersistentVars
     {
         private const string DB_FILE = "legionvars.db";
         private const string OLD_DATA_FILE = "legionvars.dat";
         private const string GlobalScopeKey = "GLOBAL";
         private const char SEPARATOR = '\t';
+        private const int FLUSH_INTERVAL_MS = 2000;
 
         private static string _charScopeKey = "";
         private static string _accountScopeKey = "";
         private static string _serverScopeKey = "";
 
         private static readonly SemaphoreSlim _dbLock = new SemaphoreSlim(1, 1);
+        private static SqliteConnection _connection;
+        private static Timer _flushTimer;
+
+        // Indexed by API.PersistentVar, swapped as a whole when the scope keys change
+        private static readonly ConcurrentDictionary<string, object>[] _cache =
+        [
+            new ConcurrentDictionary<string, object>(), new ConcurrentDictionary<string, object>(),
+            new ConcurrentDictionary<string, object>(), new ConcurrentDictionary<string, object>()
+        ];
+
+        // Latest change per var since the last flush, a null value is a delete
+        private static readonly ConcurrentDictionary<(string scope, string scopeKey, string key), object> _pendingWrites = new();
+        private static readonly List<Action> _pendingCallbacks = new();
+        private static readonly Lock _cacheLock = new();
+
         private static string DataPath => Path.Combine(CUOEnviroment.ExecutablePath, "Data", DB_FILE);
         private static string OldDataPath => Path.Combine(CUOEnviroment.ExecutablePath, "Data", OLD_DATA_FILE);
 
@@ -32,16 +55,31 @@ namespace ClassicUO.LegionScripting
 
         public static void Load()
         {
-            _charScopeKey = ProfileManager.CurrentProfile.ServerName + ProfileManager.CurrentProfile.Username + ProfileManager.CurrentProfile.CharacterName;
-            _accountScopeKey = ProfileManager.CurrentProfile.ServerName + ProfileManager.CurrentProfile.Username;
-            _serverScopeKey = ProfileManager.CurrentProfile.ServerName;
+            _dbLock.Wait();
+            try
+            {
+                // Anything still pending belongs to the previous scope keys, write it before they change
+                FlushPending();
 
-            InitializeDatabaseAsync().Wait();
+                _charScopeKey = ProfileManager.CurrentProfile.ServerName + ProfileManager.CurrentProfile.Username + ProfileManager.CurrentProfile.CharacterName;
+                _accountScopeKey = ProfileManager.CurrentProfile.ServerName + ProfileManager.CurrentProfile.Username;
+                _serverScopeKey = ProfileManager.CurrentProfile.ServerName;
+
+                if (_connection == null)
+                    InitializeDatabase();
+
+                LoadCache();
+            }
+            finally
+            {
+                _dbLock.Release();
+            }
+
+            _flushTimer ??= new Timer(_ => Flush(), null, FLUSH_INTERVAL_MS, FLUSH_INTERVAL_MS);
         }
 
-        private static async Task InitializeDatabaseAsync()
+        private static void InitializeDatabase()
         {
-            await _dbLock.WaitAsync();
             try
             {
                 // Ensure the Data directory exists
@@ -51,89 +89,80 @@ namespace ClassicUO.LegionScripting
                     Directory.CreateDirectory(dataDir);
                 }
 
-                using (var connection = new SqliteConnection(ConnectionString))
-                {
-                    await connection.OpenAsync();
-
-                    SqliteCommand createTableCmd = connection.CreateCommand();
-                    createTableCmd.CommandText = @"
-                        CREATE TABLE IF NOT EXISTS persistent_vars (
-                            scope TEXT NOT NULL,
-                            scope_key TEXT NOT NULL,
-                            key TEXT NOT NULL,
-                            value TEXT NOT NULL,
-                            PRIMARY KEY (scope, scope_key, key)
-                        )";
-                    await createTableCmd.ExecuteNonQueryAsync();
-
-                    // Create index for faster lookups
-                    SqliteCommand createIndexCmd = connection.CreateCommand();
-                    createIndexCmd.CommandText = @"
-                        CREATE INDEX IF NOT EXISTS idx_scope_scopekey
-                        ON persistent_vars(scope, scope_key)";
-                    await createIndexCmd.ExecuteNonQueryAsync();
-                }
+                var connection = new SqliteConnection(ConnectionString);
+                connection.Open();
+
+                SqliteCommand createTableCmd = connection.CreateCommand();
+                createTableCmd.CommandText = @"
+                    CREATE TABLE IF NOT EXISTS persistent_vars (
+                        scope TEXT NOT NULL,
+                        scope_key TEXT NOT NULL,
+                        key TEXT NOT NULL,
+                        value TEXT NOT NULL,
+                        PRIMARY KEY (scope, scope_key, key)
+                    )";
+                createTableCmd.ExecuteNonQuery();
+
+                // Create index for faster lookups
+                SqliteCommand createIndexCmd = connection.CreateCommand();
+                createIndexCmd.CommandText = @"
+                    CREATE INDEX IF NOT EXISTS idx_scope_scopekey
+                    ON persistent_vars(scope, scope_key)";
+                createIndexCmd.ExecuteNonQuery();
+
+                _connection = connection;
 
                 // Migrate old data if exists
                 if (File.Exists(OldDataPath))
                 {
-                    await MigrateOldDataAsync();
+                    MigrateOldData();
                 }
             }
             catch (Exception ex)
             {
                 Console.WriteLine($"Warning: Failed to initialize persistent vars database: {ex.Message}");
             }
-            finally
-            {
-                _dbLock.Release();
-            }
         }
 
-        private static async Task MigrateOldDataAsync()
+        private static void MigrateOldData()
         {
             try
             {
-                string[] lines = await File.ReadAllLinesAsync(OldDataPath);
+                string[] lines = File.ReadAllLines(OldDataPath);
                 int migratedCount = 0;
 
-                using (var connection = new SqliteConnection(ConnectionString))
+                using (SqliteTransaction transaction = _connection.BeginTransaction())
                 {
-                    await connection.OpenAsync();
+                    SqliteCommand insertCmd = _connection.CreateCommand();
+                    insertCmd.Transaction = transaction;
+                    insertCmd.CommandText = @"
+                        INSERT OR REPLACE INTO persistent_vars (scope, scope_key, key, value)
+                        VALUES ($scope, $scope_key, $key, $value)";
 
-                    using (SqliteTransaction transaction = connection.BeginTransaction())
-                    {
-                        SqliteCommand insertCmd = connection.CreateCommand();
-                        insertCmd.Transaction = transaction;
-                        insertCmd.CommandText = @"
-                            INSERT OR REPLACE INTO persistent_vars (scope, scope_key, key, value)
-                            VALUES ($scope, $scope_key, $key, $value)";
+                    SqliteParameter scopeParam = insertCmd.Parameters.Add("$scope", SqliteType.Text);
+                    SqliteParameter scopeKeyParam = insertCmd.Parameters.Add("$scope_key", SqliteType.Text);
+                    SqliteParameter keyParam = insertCmd.Parameters.Add("$key", SqliteType.Text);
+                    SqliteParameter valueParam = insertCmd.Parameters.Add("$value", SqliteType.Text);
 
-                        SqliteParameter scopeParam = insertCmd.Parameters.Add("$scope", SqliteType.Text);
-                        SqliteParameter scopeKeyParam = insertCmd.Parameters.Add("$scope_key", SqliteType.Text);
-                        SqliteParameter keyParam = insertCmd.Parameters.Add("$key", SqliteType.Text);
-                        SqliteParameter valueParam = insertCmd.Parameters.Add("$value", SqliteType.Text);
+                    foreach (string line in lines)
+                    {
+                        if (string.IsNullOrEmpty(line)) continue;
 
-                        foreach (string line in lines)
+                        string[] parts = line.Split(SEPARATOR);
+                        if (parts.Length >= 4)
                         {
-                            if (string.IsNullOrEmpty(line)) continue;
-
-                            string[] parts = line.Split(SEPARATOR);
-                            if (parts.Length >= 4)
-                            {
-                                scopeParam.Value = parts[0];
-                                scopeKeyParam.Value = parts[1];
-                                keyParam.Value = parts[2];
-                                string value = parts.Length > 4 ? string.Join(SEPARATOR.ToString(), parts, 3, parts.Length - 3) : parts[3];
-                                valueParam.Value = UnescapeValue(value);
-
-                                await insertCmd.ExecuteNonQueryAsync();
-                                migratedCount++;
-                            }
+                            scopeParam.Value = parts[0];
+                            scopeKeyParam.Value = parts[1];
+                            keyParam.Value = parts[2];
+                            string value = parts.Length > 4 ? string.Join(SEPARATOR.ToString(), parts, 3, parts.Length - 3) : parts[3];
+                            valueParam.Value = UnescapeValue(value);
+
+                            insertCmd.ExecuteNonQuery();
+                            migratedCount++;
                         }
-
-                        transaction.Commit();
                     }
+
+                    transaction.Commit();
                 }
 
                 // Backup old file and delete
@@ -162,53 +191,78 @@ namespace ClassicUO.LegionScripting
                        .Replace("\\\\", "\\");
         }
 
-        private static (API.PersistentVar scope, string scopeKey) GetScopeKeyPair(API.PersistentVar scope)
+        /// <summary>
+        /// Reads every var of the current scope keys into memory. Caller must hold _dbLock.
+        /// </summary>
+        private static void LoadCache()
         {
-            switch (scope)
+            var loaded = new ConcurrentDictionary<string, object>[_cache.Length];
+
+            for (int i = 0; i < loaded.Length; i++)
+                loaded[i] = new ConcurrentDictionary<string, object>();
+
+            if (_connection != null)
             {
-                case API.PersistentVar.Char:
-                    return (scope, _charScopeKey);
-                case API.PersistentVar.Account:
-                    return (scope, _accountScopeKey);
-                case API.PersistentVar.Server:
-                    return (scope, _serverScopeKey);
-                case API.PersistentVar.Global:
-                    return (scope, GlobalScopeKey);
-                default:
-                    throw new ArgumentOutOfRangeException(nameof(scope), scope, null);
-            }
-        }
+                try
+                {
+                    SqliteCommand cmd = _connection.CreateCommand();
+                    cmd.CommandText = @"
+                        SELECT key, value FROM persistent_vars
+                        WHERE scope = $scope AND scope_key = $scope_key";
+                    SqliteParameter scopeParam = cmd.Parameters.Add("$scope", SqliteType.Text);
+                    SqliteParameter scopeKeyParam = cmd.Parameters.Add("$scope_key", SqliteType.Text);
 
-        public static string GetVar(API.PersistentVar scope, string key, string defaultValue = "") => GetVarAsync(scope, key, defaultValue).Result;
+                    for (int i = 0; i < loaded.Length; i++)
+                    {
+                        (API.PersistentVar s, string scopeKey) = GetScopeKeyPair((API.PersistentVar)i);
+                        scopeParam.Value = s.ToString();
+                        scopeKeyParam.Value = scopeKey;
 
-        public static async Task<string> GetVarAsync(API.PersistentVar scope, string key, string defaultValue = "")
-        {
-            (API.PersistentVar s, string scopeKey) = GetScopeKeyPair(scope);
-            string scopeStr = s.ToString();
+                        using (SqliteDataReader reader = cmd.ExecuteReader())
+                        {
+                            while (reader.Read())
+                            {
+                                loaded[i][reader.GetString(0)] = reader.GetValue(1);
+                            }
+                        }
+                    }
+                }
+                catch (Exception ex)
+                {
+                    Console.WriteLine($"Error loading persistent vars: {ex.Message}");
+                }
+            }
 
-            await _dbLock.WaitAsync();
-            try
+            lock (_cacheLock)
             {
-                using (var connection = new SqliteConnection(ConnectionString))
+                // Changes made while reading are still pending, apply them on top
+                foreach (KeyValuePair<(string scope, string scopeKey, string key), object> pending in _pendingWrites)
                 {
-                    await connection.OpenAsync();
+                    for (int i = 0; i < loaded.Length; i++)
+                    {
+                        (API.PersistentVar s, string scopeKey) = GetScopeKeyPair((API.PersistentVar)i);
 
-                    SqliteCommand cmd = connection.CreateCommand();
-                    cmd.CommandText = @"
-                        SELECT value FROM persistent_vars
-                        WHERE scope = $scope AND scope_key = $scope_key AND key = $key";
-                    cmd.Parameters.AddWithValue("$scope", scopeStr);
-                    cmd.Parameters.AddWithValue("$scope_key", scopeKey);
-                    cmd.Parameters.AddWithValue("$key", key);
-
-                    object result = await cmd.ExecuteScalarAsync();
-                    return result?.ToString() ?? defaultValue;
+                        if (pending.Key.scope != s.ToString() || pending.Key.scopeKey != scopeKey)
+                            continue;
+
+                        if (pending.Value == null)
+                            loaded[i].TryRemove(pending.Key.key, out _);
+                        else
+                            loaded[i][pending.Key.key] = pending.Value;
+                    }
                 }
+
+                for (int i = 0; i < loaded.Length; i++)
+                    Volatile.Write(ref _cache[i], loaded[i]);
             }
-            catch (Exception ex)
+        }
+
+        private static void Flush()
+        {
+            _dbLock.Wait();
+            try
             {
-                Console.WriteLine($"Error getting var '{key}': {ex.Message}");
-                return defaultValue;
+                FlushPending();
             }
             finally
             {
@@ -216,129 +270,238 @@ namespace ClassicUO.LegionScripting
             }
         }
 
-        public static void SaveVar(API.PersistentVar scope, string key, string value) => SaveVarAsync(scope, key, value, null).ConfigureAwait(false);
+        /// <summary>
+        /// Writes all pending changes in a single transaction. Caller must hold _dbLock.
+        /// </summary>
+        private static void FlushPending()
+        {
+            if (_connection == null)
+                return;
 
-        public static void SaveVar(API.PersistentVar scope, string key, string value, Action onComplete) => SaveVarAsync(scope, key, value, onComplete).ConfigureAwait(false);
+            var batch = new List<KeyValuePair<(string scope, string scopeKey, string key), object>>();
+            Action[] callbacks;
 
-        public static async Task SaveVarAsync(API.PersistentVar scope, string key, string value, Action onComplete = null)
-        {
-            (API.PersistentVar s, string scopeKey) = GetScopeKeyPair(scope);
-            string scopeStr = s.ToString();
+            // Taken under the cache lock so a SaveVars batch always ends up in the same transaction,
+            // and a callback is only taken together with the changes it waits for
+            lock (_cacheLock)
+            {
+                batch.AddRange(_pendingWrites);
+                _pendingWrites.Clear();
 
-            await _dbLock.WaitAsync();
-            try
+                callbacks = _pendingCallbacks.ToArray();
+                _pendingCallbacks.Clear();
+            }
+
+            if (batch.Count > 0)
             {
-                using (var connection = new SqliteConnection(ConnectionString))
+                try
+                {
+                    using (SqliteTransaction transaction = _connection.BeginTransaction())
+                    {
+                        SqliteCommand saveCmd = _connection.CreateCommand();
+                        saveCmd.Transaction = transaction;
+                        saveCmd.CommandText = @"
+                            INSERT OR REPLACE INTO persistent_vars (scope, scope_key, key, value)
+                            VALUES ($scope, $scope_key, $key, $value)";
+                        SqliteParameter saveScope = saveCmd.Parameters.Add("$scope", SqliteType.Text);
+                        SqliteParameter saveScopeKey = saveCmd.Parameters.Add("$scope_key", SqliteType.Text);
+                        SqliteParameter saveKey = saveCmd.Parameters.Add("$key", SqliteType.Text);
+                        SqliteParameter saveValue = saveCmd.Parameters.Add("$value", SqliteType.Text);
+
+                        SqliteCommand deleteCmd = _connection.CreateCommand();
+                        deleteCmd.Transaction = transaction;
+                        deleteCmd.CommandText = @"
+                            DELETE FROM persistent_vars
+                            WHERE scope = $scope AND scope_key = $scope_key AND key = $key";
+                        SqliteParameter deleteScope = deleteCmd.Parameters.Add("$scope", SqliteType.Text);
+                        SqliteParameter deleteScopeKey = deleteCmd.Parameters.Add("$scope_key", SqliteType.Text);
+                        SqliteParameter deleteKey = deleteCmd.Parameters.Add("$key", SqliteType.Text);
+
+                        foreach (KeyValuePair<(string scope, string scopeKey, string key), object> change in batch)
+                        {
+                            if (change.Value == null)
+                            {
+                                deleteScope.Value = change.Key.scope;
+                                deleteScopeKey.Value = change.Key.scopeKey;
+                                deleteKey.Value = change.Key.key;
+                                deleteCmd.ExecuteNonQuery();
+                            }
+                            else
+                            {
+                                saveScope.Value = change.Key.scope;
+                                saveScopeKey.Value = change.Key.scopeKey;
+                                saveKey.Value = change.Key.key;
+                                saveValue.SqliteType = change.Value is byte[] ? SqliteType.Blob : SqliteType.Text;
+                                saveValue.Value = change.Value;
+                                saveCmd.ExecuteNonQuery();
+                            }
+                        }
+
+                        transaction.Commit();
+                    }
+                }
+                catch (Exception ex)
                 {
-                    await connection.OpenAsync();
+                    Console.WriteLine($"Error saving persistent vars: {ex.Message}");
 
-                    SqliteCommand cmd = connection.CreateCommand();
-                    cmd.CommandText = @"
-                        INSERT OR REPLACE INTO persistent_vars (scope, scope_key, key, value)
-                        VALUES ($scope, $scope_key, $key, $value)";
-                    cmd.Parameters.AddWithValue("$scope", scopeStr);
-                    cmd.Parameters.AddWithValue("$scope_key", scopeKey);
-                    cmd.Parameters.AddWithValue("$key", key);
-                    cmd.Parameters.AddWithValue("$value", value);
+                    // Try again next flush, unless the var was changed again in the meantime.
+                    // The callbacks wait for that flush too, they must not run before their changes are saved.
+                    lock (_cacheLock)
+                    {
+                        foreach (KeyValuePair<(string scope, string scopeKey, string key), object> change in batch)
+                            _pendingWrites.TryAdd(change.Key, change.Value);
+
+                        _pendingCallbacks.InsertRange(0, callbacks);
+                    }
 
-                    await cmd.ExecuteNonQueryAsync();
+                    return;
                 }
             }
-            catch (Exception ex)
+
+            foreach (Action callback in callbacks)
             {
-                Console.WriteLine($"Error saving var '{key}': {ex.Message}");
+                try
+                {
+                    callback();
+                }
+                catch (Exception ex)
+                {
+                    Console.WriteLine($"Error in persistent var callback: {ex.Message}");
+                }
             }
-            finally
+        }
+
+        private static (API.PersistentVar scope, string scopeKey) GetScopeKeyPair(API.PersistentVar scope)
+        {
+            switch (scope)
             {
-                _dbLock.Release();
-                onComplete?.Invoke();
+                case API.PersistentVar.Char:
+                    return (scope, _charScopeKey);
+                case API.PersistentVar.Account:
+                    return (scope, _accountScopeKey);
+                case API.PersistentVar.Server:
+                    return (scope, _serverScopeKey);
+                case API.PersistentVar.Global:
+                    return (scope, GlobalScopeKey);
+                default:
+                    throw new ArgumentOutOfRangeException(nameof(scope), scope, null);
             }
         }
 
-        public static void DeleteVar(API.PersistentVar scope, string key) => DeleteVarAsync(scope, key, null).ConfigureAwait(false);
-
-        public static void DeleteVar(API.PersistentVar scope, string key, Action onComplete) => DeleteVarAsync(scope, key, onComplete).ConfigureAwait(false);
+        private static ConcurrentDictionary<string, object> GetScopeCache(API.PersistentVar scope)
+        {
+            GetScopeKeyPair(scope);
+            return Volatile.Read(ref _cache[(int)scope]);
+        }
 
-        public static async Task DeleteVarAsync(API.PersistentVar scope, string key, Action onComplete = null)
+        private static void QueueChanges(API.PersistentVar scope, IEnumerable<KeyValuePair<string, object>> changes, Action onComplete)
         {
             (API.PersistentVar s, string scopeKey) = GetScopeKeyPair(scope);
             string scopeStr = s.ToString();
 
-            await _dbLock.WaitAsync();
-            try
+            lock (_cacheLock)
             {
-                using (var connection = new SqliteConnection(ConnectionString))
-                {
-                    await connection.OpenAsync();
+                ConcurrentDictionary<string, object> cache = _cache[(int)scope];
 
-                    SqliteCommand cmd = connection.CreateCommand();
-                    cmd.CommandText = @"
-                        DELETE FROM persistent_vars
-                        WHERE scope = $scope AND scope_key = $scope_key AND key = $key";
-                    cmd.Parameters.AddWithValue("$scope", scopeStr);
-                    cmd.Parameters.AddWithValue("$scope_key", scopeKey);
-                    cmd.Parameters.AddWithValue("$key", key);
+                foreach (KeyValuePair<string, object> change in changes)
+                {
+                    if (change.Value == null)
+                        cache.TryRemove(change.Key, out _);
+                    else
+                        cache[change.Key] = change.Value;
 
-                    await cmd.ExecuteNonQueryAsync();
+                    _pendingWrites[(scopeStr, scopeKey, change.Key)] = change.Value;
                 }
 
+                if (onComplete != null)
+                    _pendingCallbacks.Add(onComplete);
             }
-            catch (Exception ex)
-            {
-                Console.WriteLine($"Error deleting var '{key}': {ex.Message}");
-            }
-            finally
+        }
+
+        private static string ToText(object value) => value as string ?? PersistentVarEncoding.ToDisplayString((byte[])value);
+
+        /// <summary>
+        /// Typed values are returned as text, use <see cref="GetStoredVar"/> to get them back as they were saved.
+        /// </summary>
+        public static string GetVar(API.PersistentVar scope, string key, string defaultValue = "") =>
+            GetScopeCache(scope).TryGetValue(key, out object value) ? ToText(value) : defaultValue;
+
+        /// <summary>
+        /// The stored value, a string or the bytes of an encoded typed value. Null if the var does not exist.
+        /// </summary>
+        public static object GetStoredVar(API.PersistentVar scope, string key) => GetScopeCache(scope).TryGetValue(key, out object value) ? value : null;
+
+        /// <summary>
+        /// Stored values of every var whose name starts with <paramref name="prefix"/>.
+        /// </summary>
+        public static List<KeyValuePair<string, object>> GetStoredVars(API.PersistentVar scope, string prefix)
+        {
+            var result = new List<KeyValuePair<string, object>>();
+
+            foreach (KeyValuePair<string, object> kv in GetScopeCache(scope))
             {
-                _dbLock.Release();
-                onComplete?.Invoke();
+                if (string.IsNullOrEmpty(prefix) || kv.Key.StartsWith(prefix, StringComparison.Ordinal))
+                    result.Add(kv);
             }
+
+            return result;
         }
 
-        public static Dictionary<string, string> GetAllVars(API.PersistentVar scope) => GetAllVarsAsync(scope).Result;
+        /// <summary>
+        /// Save many vars at once, they are written to the database in the same transaction.
+        /// Values must be strings or the bytes of an encoded typed value, null deletes the var.
+        /// </summary>
+        public static void SaveVars(API.PersistentVar scope, IEnumerable<KeyValuePair<string, object>> values, Action onComplete = null) => QueueChanges(scope, values, onComplete);
 
-        public static void Unload()
+        public static Task<string> GetVarAsync(API.PersistentVar scope, string key, string defaultValue = "") => Task.FromResult(GetVar(scope, key, defaultValue));
+
+        public static void SaveVar(API.PersistentVar scope, string key, string value) => SaveVar(scope, key, value, null);
+
+        /// <summary>
+        /// The new value can be read right away, <paramref name="onComplete"/> runs once it has been written to the database.
+        /// </summary>
+        public static void SaveVar(API.PersistentVar scope, string key, string value, Action onComplete) => QueueChanges(scope, [new(key, value ?? "")], onComplete);
+
+        public static Task SaveVarAsync(API.PersistentVar scope, string key, string value, Action onComplete = null)
         {
-            // SQLite handles this automatically - no need to flush
-            // Just ensure any pending operations complete
-            _dbLock.Wait();
-            _dbLock.Release();
+            SaveVar(scope, key, value, onComplete);
+            return Task.CompletedTask;
         }
 
-        public static async Task<Dictionary<string, string>> GetAllVarsAsync(API.PersistentVar scope)
+        public static void DeleteVar(API.PersistentVar scope, string key) => DeleteVar(scope, key, null);
+
+        public static void DeleteVar(API.PersistentVar scope, string key, Action onComplete) => QueueChanges(scope, [new(key, null)], onComplete);
+
+        public static Task DeleteVarAsync(API.PersistentVar scope, string key, Action onComplete = null)
+        {
+            DeleteVar(scope, key, onComplete);
+            return Task.CompletedTask;
+        }
+
+        public static Dictionary<string, string> GetAllVars(API.PersistentVar scope)
         {
-            (API.PersistentVar s, string scopeKey) = GetScopeKeyPair(scope);
-            string scopeStr = s.ToString();
             var result = new Dictionary<string, string>();
 
-            await _dbLock.WaitAsync();
-            try
-            {
-                using (var connection = new SqliteConnection(ConnectionString))
-                {
-                    await connection.OpenAsync();
+            foreach (KeyValuePair<string, object> kv in GetScopeCache(scope))
+                result[kv.Key] = ToText(kv.Value);
 
-                    SqliteCommand cmd = connection.CreateCommand();
-                    cmd.CommandText = @"
-                        SELECT key, value FROM persistent_vars
-                        WHERE scope = $scope AND scope_key = $scope_key";
-                    cmd.Parameters.AddWithValue("$scope", scopeStr);
-                    cmd.Parameters.AddWithValue("$scope_key", scopeKey);
+            return result;
+        }
 
-                    using (SqliteDataReader reader = await cmd.ExecuteReaderAsync())
-                    {
-                        while (await reader.ReadAsync())
-                        {
-                            result[reader.GetString(0)] = reader.GetString(1);
-                        }
-                    }
-                }
+        public static Task<Dictionary<string, string>> GetAllVarsAsync(API.PersistentVar scope) => Task.FromResult(GetAllVars(scope));
 
-                return result;
-            }
-            catch (Exception ex)
+        public static void Unload()
+        {
+            _flushTimer?.Dispose();
+            _flushTimer = null;
+
+            _dbLock.Wait();
+            try
             {
-                Console.WriteLine($"Error getting all vars: {ex.Message}");
-                return result;
+                FlushPending();
+
+                _connection?.Dispose();
+                _connection = null;
             }
             finally
             {
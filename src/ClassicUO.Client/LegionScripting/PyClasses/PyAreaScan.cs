@@ -0,0 +1,83 @@
+using System;
+
+namespace ClassicUO.LegionScripting.PyClasses;
+
+/// <summary>
+/// Tiles found by API.ScanArea, stored as one array per column instead of one object per tile.
+/// Row i is X[i], Y[i], Z[i], Graphic[i], Hue[i], Flags[i], Kind[i].
+/// Example:
+/// ```py
+/// scan = API.ScanArea(1000, 1000, 1100, 1100, [0x0CCA, 0x0CCB])
+/// for i in range(scan.Count):
+///   API.SysMsg(f"Tree {scan.Graphic[i]} at {scan.X[i]}, {scan.Y[i]}, {scan.Z[i]}")
+/// ```
+/// </summary>
+public class PyAreaScan
+{
+    public const byte KIND_LAND = 0;
+    public const byte KIND_STATIC = 1;
+    public const byte KIND_MULTI = 2;
+
+    public int Count { get; private set; }
+
+    public ushort[] X { get; private set; } = [];
+    public ushort[] Y { get; private set; } = [];
+    public sbyte[] Z { get; private set; } = [];
+    public ushort[] Graphic { get; private set; } = [];
+    public ushort[] Hue { get; private set; } = [];
+
+    /// <summary>
+    /// Tiledata flags of each tile, for example `scan.Flags[i] & 0x40` is set for impassable tiles.
+    /// </summary>
+    public ulong[] Flags { get; private set; } = [];
+
+    /// <summary>
+    /// What each tile is: 0 for land, 1 for a static, 2 for a multi (house) component.
+    /// </summary>
+    public byte[] Kind { get; private set; } = [];
+
+    internal void Add(byte kind, int x, int y, sbyte z, ushort graphic, ushort hue, ulong flags)
+    {
+        if (Count == X.Length)
+            Grow();
+
+        X[Count] = (ushort)x;
+        Y[Count] = (ushort)y;
+        Z[Count] = z;
+        Graphic[Count] = graphic;
+        Hue[Count] = hue;
+        Flags[Count] = flags;
+        Kind[Count] = kind;
+        Count++;
+    }
+
+    /// <summary>
+    /// Trim the columns to <see cref="Count"/>, called once the scan is done.
+    /// </summary>
+    internal void Finish() => Resize(Count);
+
+    private void Grow() => Resize(Math.Max(256, X.Length * 2));
+
+    private void Resize(int size)
+    {
+        if (size == X.Length)
+            return;
+
+        X = Resized(X, size);
+        Y = Resized(Y, size);
+        Z = Resized(Z, size);
+        Graphic = Resized(Graphic, size);
+        Hue = Resized(Hue, size);
+        Flags = Resized(Flags, size);
+        Kind = Resized(Kind, size);
+    }
+
+    private static T[] Resized<T>(T[] array, int size)
+    {
+        Array.Resize(ref array, size);
+
+        return array;
+    }
+
+    public override string ToString() => $"<PyAreaScan Count={Count}>";
+}
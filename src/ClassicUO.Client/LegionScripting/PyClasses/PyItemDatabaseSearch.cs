@@ -0,0 +1,101 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+using ClassicUO.Game.Data;
+using IronPython.Runtime;
+
+namespace ClassicUO.LegionScripting.PyClasses;
+
+/// <summary>
+/// An item database search returned by API.SearchItemDatabase, read one page at a time, newest items first.
+/// The next page is loaded in the background while the current one is being used.
+/// Each result has Serial, Graphic, Hue, Name, Properties, Container, Layer, UpdatedTime, Character, CharacterName, ServerName, X, Y, OnGround and CustomName.
+/// Example:
+/// ```py
+/// search = API.SearchItemDatabase(properties="Hit Lightning 50")
+/// for page in search:
+///   for item in page:
+///     API.SysMsg(f"{item.Name} on {item.CharacterName}")
+/// ```
+/// </summary>
+public class PyItemDatabaseSearch : IEnumerable<PythonList>
+{
+    private readonly Func<ItemInfo, Task<List<ItemInfo>>> _fetchPage;
+    private readonly API _api;
+    private Task<List<ItemInfo>> _nextPage;
+
+    internal PyItemDatabaseSearch(Func<ItemInfo, Task<List<ItemInfo>>> fetchPage, int pageSize, API api)
+    {
+        _fetchPage = fetchPage;
+        _api = api;
+        PageSize = pageSize;
+        _nextPage = fetchPage(null);
+    }
+
+    public int PageSize { get; }
+
+    /// <summary>
+    /// Number of results returned so far.
+    /// </summary>
+    public int Count { get; private set; }
+
+    /// <summary>
+    /// True once the last page has been returned.
+    /// </summary>
+    public bool Done { get; private set; }
+
+    /// <summary>
+    /// Get the next page of results, waiting for it if it hasn't loaded yet.
+    /// </summary>
+    /// <returns>A list of up to PageSize results, empty once the search is done</returns>
+    public PythonList Next()
+    {
+        var list = new PythonList();
+
+        if (Done)
+            return list;
+
+        _nextPage.Wait(_api.CancellationToken.Token);
+
+        if (_api.StopRequested)
+            throw new ThreadInterruptedException();
+
+        List<ItemInfo> page = _nextPage.Result;
+
+        if (page.Count < PageSize)
+        {
+            Done = true;
+            _nextPage = null;
+        }
+        else
+        {
+            _nextPage = _fetchPage(page[^1]);
+        }
+
+        Count += page.Count;
+
+        foreach (ItemInfo item in page)
+            list.Add(item);
+
+        return list;
+    }
+
+    public IEnumerator<PythonList> GetEnumerator()
+    {
+        while (!Done)
+        {
+            PythonList page = Next();
+
+            if (page.Count > 0)
+                yield return page;
+        }
+    }
+
+    IEnumerator IEnumerable.GetEnumerator() => GetEnumerator();
+
+    public override string ToString() => $"<PyItemDatabaseSearch {Count} results{(Done ? ", done" : "")}>";
+
+    public string __repr__() => ToString();
+}
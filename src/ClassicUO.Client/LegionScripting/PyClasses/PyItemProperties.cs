@@ -0,0 +1,96 @@
+using System;
+using System.Text.RegularExpressions;
+using ClassicUO.Game.Managers;
+using ClassicUO.Utility;
+using IronPython.Runtime;
+
+namespace ClassicUO.LegionScripting.PyClasses;
+
+/// <summary>
+/// Name and properties (tooltip) of an object, split into lines and numbers. Returned by API.GetPropertiesBulk.
+/// Example:
+/// ```py
+/// props = API.GetPropertiesBulk(serials)
+/// for serial, p in props.items():
+///   if p and p.Get("Hit Lightning") >= 50:
+///     API.SysMsg(f"{p.Name}: {p.Lines}")
+/// ```
+/// </summary>
+public class PyItemProperties
+{
+    internal PyItemProperties(uint serial, string name, string data)
+    {
+        Serial = serial;
+        Name = name?.Trim() ?? string.Empty;
+        Text = string.IsNullOrEmpty(data) ? Name : Name + "\n" + data;
+
+        var parsed = new ItemPropertiesData(Text);
+
+        if (string.IsNullOrEmpty(data))
+            return;
+
+        Regex colorTags = RegexHelper.GetRegex(@"/c\[[#a-zA-Z0-9]+\]", RegexOptions.IgnoreCase);
+
+        foreach (ItemPropertiesData.SinglePropertyData property in parsed.singlePropertyData)
+        {
+            string line = colorTags.Replace(property.OriginalString, "").Replace("/cd", "").Trim();
+
+            if (line.Length == 0)
+                continue;
+
+            Lines.Add(line);
+
+            if (!Values.ContainsKey(property.Name))
+                Values[property.Name] = property.FirstValue == double.MinValue ? null : (object)property.FirstValue;
+        }
+    }
+
+    public uint Serial { get; }
+    public string Name { get; }
+
+    /// <summary>
+    /// Name and properties as one string, the same text API.ItemNameAndProps returns.
+    /// </summary>
+    public string Text { get; }
+
+    /// <summary>
+    /// Property lines without the name, for example "Hit Lightning 50%".
+    /// </summary>
+    public PythonList Lines { get; } = new();
+
+    /// <summary>
+    /// Property name to its first number, for example "Hit Lightning" to 50.0. None for lines without a number.
+    /// </summary>
+    public PythonDictionary Values { get; } = new();
+
+    /// <summary>
+    /// True if a property line has this name, not case sensitive.
+    /// </summary>
+    public bool Has(string property) => FindValue(property, out _);
+
+    /// <summary>
+    /// First number of a property, not case sensitive.
+    /// </summary>
+    /// <param name="property">Property name without the number, like "Hit Lightning"</param>
+    /// <param name="defaultValue">Returned if the property isn't there or has no number</param>
+    public double Get(string property, double defaultValue = 0) => FindValue(property, out object value) && value is double d ? d : defaultValue;
+
+    private bool FindValue(string property, out object value)
+    {
+        foreach (object key in Values.Keys)
+        {
+            if (string.Equals((string)key, property, StringComparison.OrdinalIgnoreCase))
+            {
+                value = Values[key];
+                return true;
+            }
+        }
+
+        value = null;
+        return false;
+    }
+
+    public override string ToString() => $"<PyItemProperties {Serial:X8} {Name}, {Lines.Count} properties>";
+
+    public string __repr__() => ToString();
+}
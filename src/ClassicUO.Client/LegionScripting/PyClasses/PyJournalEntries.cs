@@ -0,0 +1,53 @@
+using System.Collections;
+using System.Collections.Generic;
+
+namespace ClassicUO.LegionScripting.PyClasses;
+
+/// <summary>
+/// The journal entries this script can see, oldest first. Returned by API.JournalEntries.
+/// Works like the queue API.JournalEntries used to be, dequeuing or clearing only hides entries from this script.
+/// Example:
+/// ```py
+/// ok, entry = API.JournalEntries.TryDequeue()
+/// while ok:
+///   API.SysMsg(entry.Text)
+///   ok, entry = API.JournalEntries.TryDequeue()
+/// ```
+/// </summary>
+public class PyJournalEntries : IEnumerable<PyJournalEntry>
+{
+    private readonly ScriptJournalCursor _cursor;
+
+    internal PyJournalEntries(ScriptJournalCursor cursor) => _cursor = cursor;
+
+    public int Count => _cursor.Count;
+
+    public bool IsEmpty => Count == 0;
+
+    /// <summary>
+    /// Get the oldest entry and hide it from this script.
+    /// </summary>
+    public bool TryDequeue(out PyJournalEntry entry) => _cursor.TryDequeue(out entry);
+
+    /// <summary>
+    /// Get the oldest entry without hiding it.
+    /// </summary>
+    public bool TryPeek(out PyJournalEntry entry) => _cursor.TryPeek(out entry);
+
+    public PyJournalEntry[] ToArray() => _cursor.Entries().ToArray();
+
+    /// <summary>
+    /// Hide all current entries from this script, same as API.ClearJournal().
+    /// </summary>
+    public void Clear() => _cursor.Clear();
+
+    public IEnumerator<PyJournalEntry> GetEnumerator() => _cursor.Entries().GetEnumerator();
+
+    IEnumerator IEnumerable.GetEnumerator() => GetEnumerator();
+
+    public int __len__() => Count;
+
+    public override string ToString() => $"<PyJournalEntries {Count} entries>";
+
+    public string __repr__() => ToString();
+}
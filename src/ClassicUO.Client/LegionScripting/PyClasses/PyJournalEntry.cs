@@ -14,5 +14,18 @@ public class PyJournalEntry(JournalEntry entry)
     public DateTime Time = entry.Time;
     public MessageType MessageType = entry.MessageType;
 
-    public bool Disposed;
+    /// <summary>
+    /// Increases by one for every journal entry, newer entries have higher numbers.
+    /// </summary>
+    public long Sequence { get; init; }
+
+    /// <summary>
+    /// Kept for older scripts, entries are shared between scripts and are never disposed so this is always False.
+    /// Setting it does nothing.
+    /// </summary>
+    public bool Disposed
+    {
+        get => false;
+        set { }
+    }
 }
@@ -0,0 +1,97 @@
+using System.Collections.Generic;
+
+namespace ClassicUO.LegionScripting.PyClasses;
+
+/// <summary>
+/// A reusable set of journal patterns, create one with API.CompileJournalMatcher().
+/// Each journal entry is only checked once, when it first shows up, so checking often is cheap even with many patterns.
+/// Example:
+/// ```py
+/// matcher = API.CompileJournalMatcher(["You put", "$^You (fail|succeed)", "You have been slain"])
+/// while True:
+///   if matcher.InJournal(True):
+///     API.SysMsg(f"Matched: {matcher.LastEntry.Text}")
+///   API.Pause(0.1)
+/// ```
+/// </summary>
+public class PyJournalMatcher
+{
+    private readonly JournalMatcher _matcher;
+    private readonly ScriptJournalCursor _journal;
+    private readonly List<(PyJournalEntry entry, int pattern)> _hits = new();
+    private long _scannedUpTo;
+
+    /// <summary>
+    /// The patterns this matcher was created with.
+    /// </summary>
+    public string[] Patterns => _matcher.Patterns;
+
+    /// <summary>
+    /// Index of the pattern that matched in the last successful InJournal() call, -1 if none.
+    /// </summary>
+    public int LastMatch { get; private set; } = -1;
+
+    /// <summary>
+    /// The journal entry found by the last successful InJournal() call.
+    /// </summary>
+    public PyJournalEntry LastEntry { get; private set; }
+
+    internal PyJournalMatcher(JournalMatcher matcher, ScriptJournalCursor journal)
+    {
+        _matcher = matcher;
+        _journal = journal;
+    }
+
+    /// <summary>
+    /// Check a single piece of text against these patterns.
+    /// </summary>
+    /// <param name="text"></param>
+    /// <returns>The index of the first matching pattern, or -1</returns>
+    public int Match(string text) => _matcher.Match(text);
+
+    /// <summary>
+    /// Check if your journal contains any of these patterns.
+    /// Sets LastMatch and LastEntry when found.
+    /// </summary>
+    /// <param name="clearMatches">Clear the matching journal entry</param>
+    /// <returns>True if a match was found</returns>
+    public bool InJournal(bool clearMatches = false)
+    {
+        lock (_hits)
+        {
+            List<PyJournalEntry> entries = _journal.EntriesFrom(_scannedUpTo);
+
+            foreach (PyJournalEntry je in entries)
+            {
+                int idx = _matcher.Match(je.Text);
+
+                if (idx >= 0)
+                    _hits.Add((je, idx));
+            }
+
+            if (entries.Count > 0)
+                _scannedUpTo = entries[^1].Sequence + 1;
+
+            _hits.RemoveAll(h => !_journal.IsVisible(h.entry));
+
+            if (_hits.Count == 0)
+                return false;
+
+            (PyJournalEntry entry, int pattern) = _hits[0];
+            LastEntry = entry;
+            LastMatch = pattern;
+
+            if (clearMatches)
+            {
+                _journal.Clear(entry);
+                _hits.RemoveAt(0);
+            }
+
+            return true;
+        }
+    }
+
+    public override string ToString() => $"<PyJournalMatcher Patterns={Patterns.Length}>";
+
+    public string __repr__() => ToString();
+}
@@ -107,14 +107,7 @@ public class PyMobile : PyEntity
     public string NameAndProps(bool wait = false, int timeout = 10)
     {
         if (wait)
-        {
-            System.DateTime expire = System.DateTime.UtcNow.AddSeconds(timeout);
-
-            while (!MainThreadQueue.InvokeOnMainThread(() => Client.Game.UO.World.OPL.Contains(Serial)) && System.DateTime.UtcNow < expire)
-            {
-                System.Threading.Thread.Sleep(100);
-            }
-        }
+            ScriptWaits.WaitUntil(() => Client.Game.UO.World.OPL.Contains(Serial), timeout, ScriptWaits.ScriptToken, ScriptWaits.OnOPLReceived);
 
         return MainThreadQueue.InvokeOnMainThread(() =>
         {
@@ -0,0 +1,115 @@
+using System;
+using System.Threading;
+using ClassicUO.Game;
+using IronPython.Runtime;
+using Microsoft.Xna.Framework;
+
+namespace ClassicUO.LegionScripting.PyClasses;
+
+/// <summary>
+/// A long distance path being worked out in the background, returned by API.PathfindAsync.
+/// Tiles can be read while the rest of the route is still being generated, so a script can start walking right away.
+/// The request is cancelled automatically when the script stops.
+/// Example:
+/// ```py
+/// req = API.PathfindAsync(1414, 1515)
+/// while not req.Done or req.Pending:
+///   tiles = req.Read(8)
+///   if tiles:
+///     x, y = tiles[-1]
+///     API.Pathfind(x, y, distance=0, wait=True)
+///   else:
+///     API.Pause(0.1)
+/// ```
+/// </summary>
+public class PyPathRequest
+{
+    private readonly PathRequest _request;
+    private readonly API _api;
+
+    internal PyPathRequest(PathRequest request, API api)
+    {
+        _request = request;
+        _api = api;
+    }
+
+    public int TargetX => _request.TargetX;
+    public int TargetY => _request.TargetY;
+
+    /// <summary>
+    /// True once generation has ended, whether a path was found or not.
+    /// </summary>
+    public bool Done => _request.IsComplete;
+
+    /// <summary>
+    /// True if a path to the exact target was found. Partial paths still end with the target tile but this stays False.
+    /// </summary>
+    public bool Found => _request.Found;
+
+    public bool Cancelled => _request.IsCancelled;
+
+    /// <summary>
+    /// Why the path is partial or missing, for example "Could not find any viable path to target.". None if there is nothing to report.
+    /// </summary>
+    public string Message => _request.Message;
+
+    /// <summary>
+    /// Number of tiles generated so far, including ones already read.
+    /// </summary>
+    public int Count => _request.Count;
+
+    /// <summary>
+    /// Number of generated tiles that have not been read yet.
+    /// </summary>
+    public int Pending => _request.Tiles.Count;
+
+    /// <summary>
+    /// Take the tiles generated since the last read, in walking order.
+    /// </summary>
+    /// <param name="max">Most tiles to return, 0 for all available</param>
+    /// <returns>A list of (x, y) tuples, empty if nothing new is ready yet</returns>
+    public PythonList Read(int max = 0)
+    {
+        var list = new PythonList();
+
+        while ((max <= 0 || list.Count < max) && _request.Tiles.TryDequeue(out Point tile))
+            list.Add(new PythonTuple(new object[] { tile.X, tile.Y }));
+
+        return list;
+    }
+
+    /// <summary>
+    /// Wait until generation has ended.
+    /// </summary>
+    /// <param name="timeout">Seconds to wait, 0-30</param>
+    /// <returns>True if generation ended, False if it timed out</returns>
+    public bool Wait(double timeout = 10)
+    {
+        timeout = Math.Clamp(timeout, 0, 30);
+
+        bool done;
+
+        try
+        {
+            done = _request.Completion.Wait((int)(timeout * 1000), _api.CancellationToken.Token);
+        }
+        catch (OperationCanceledException)
+        {
+            throw new ThreadInterruptedException();
+        }
+
+        if (_api.StopRequested)
+            throw new ThreadInterruptedException();
+
+        return done;
+    }
+
+    /// <summary>
+    /// Stop generating, tiles already generated can still be read.
+    /// </summary>
+    public void Cancel() => _request.Cancel();
+
+    public override string ToString() => $"<PyPathRequest to {TargetX}, {TargetY}, {Count} tiles{(Done ? Found ? ", found" : ", done" : "")}>";
+
+    public string __repr__() => ToString();
+}
@@ -0,0 +1,230 @@
+using System;
+using System.Collections.Generic;
+using ClassicUO.Game;
+using ClassicUO.Game.GameObjects;
+using IronPython.Runtime;
+using static ClassicUO.LegionScripting.API;
+
+namespace ClassicUO.LegionScripting.PyClasses;
+
+/// <summary>
+/// A read-only copy of the player, nearby mobiles and the backpack, all taken in the same game frame.
+/// Reading values from a snapshot never waits on the game thread. Use API.Snapshot() to get a new one.
+/// Example:
+/// ```py
+/// snap = API.Snapshot()
+/// for mob in snap.Mobiles:
+///   if mob.Notoriety == API.Notoriety.Ally and mob.Hits < mob.HitsMax:
+///     API.SysMsg(f"{mob.Name} needs healing")
+/// ```
+/// </summary>
+public class PySnapshot
+{
+    /// <summary>
+    /// When this snapshot was taken.
+    /// </summary>
+    public readonly DateTime Time;
+
+    /// <summary>
+    /// The player, or None if not logged in.
+    /// </summary>
+    public readonly PyMobileSnapshot Player;
+
+    /// <summary>
+    /// All mobiles within range when the snapshot was taken, nearest first. Does not include the player.
+    /// </summary>
+    public readonly PyMobileSnapshot[] Mobiles;
+
+    /// <summary>
+    /// The player's backpack and everything inside it, or None if not included.
+    /// </summary>
+    public readonly PyItemSnapshot Backpack;
+
+    private readonly Dictionary<uint, PyMobileSnapshot> _mobiles = new();
+    private readonly Dictionary<uint, PyItemSnapshot> _items = new();
+
+    /// <summary>
+    /// Must be created on the main thread.
+    /// </summary>
+    internal PySnapshot(World world, int distance, bool includeBackpack)
+    {
+        Time = DateTime.Now;
+
+        if (world?.Player == null)
+        {
+            Mobiles = [];
+            return;
+        }
+
+        Player = new PyMobileSnapshot(world.Player);
+        _mobiles[Player.Serial] = Player;
+
+        var mobiles = new List<PyMobileSnapshot>();
+
+        foreach (Mobile m in world.Mobiles.Values)
+        {
+            if (m.IsDestroyed || m == world.Player || m.Distance > distance)
+                continue;
+
+            var snap = new PyMobileSnapshot(m);
+            mobiles.Add(snap);
+            _mobiles[snap.Serial] = snap;
+        }
+
+        mobiles.Sort((a, b) => a.Distance.CompareTo(b.Distance));
+        Mobiles = mobiles.ToArray();
+
+        if (includeBackpack && world.Player.Backpack is Item backpack)
+            Backpack = new PyItemSnapshot(backpack, _items);
+    }
+
+    /// <summary>
+    /// Get a mobile from this snapshot by serial.
+    /// </summary>
+    /// <param name="serial"></param>
+    /// <returns>The mobile snapshot or None</returns>
+    public PyMobileSnapshot GetMobile(uint serial) => _mobiles.GetValueOrDefault(serial);
+
+    /// <summary>
+    /// Get an item from the backpack tree of this snapshot by serial.
+    /// </summary>
+    /// <param name="serial"></param>
+    /// <returns>The item snapshot or None</returns>
+    public PyItemSnapshot GetItem(uint serial) => _items.GetValueOrDefault(serial);
+
+    /// <summary>
+    /// Find all items in the backpack tree matching a graphic, and optionally a hue.
+    /// </summary>
+    /// <param name="graphic"></param>
+    /// <param name="hue">Leave blank to match any hue</param>
+    /// <returns>A list of item snapshots</returns>
+    public PythonList FindType(uint graphic, ushort hue = ushort.MaxValue)
+    {
+        var list = new PythonList();
+
+        foreach (PyItemSnapshot item in _items.Values)
+            if (item.Graphic == graphic && (hue == ushort.MaxValue || item.Hue == hue))
+                list.Add(item);
+
+        return list;
+    }
+
+    public override string ToString() => $"<PySnapshot Time={Time:HH:mm:ss.fff} Mobiles={Mobiles.Length} Items={_items.Count}>";
+
+    public string __repr__() => ToString();
+}
+
+/// <summary>
+/// A read-only copy of a mobile, see API.Snapshot().
+/// </summary>
+public class PyMobileSnapshot
+{
+    public readonly uint Serial;
+    public readonly string Name;
+    public readonly ushort Graphic;
+    public readonly ushort Hue;
+    public readonly ushort X;
+    public readonly ushort Y;
+    public readonly sbyte Z;
+    public readonly int Distance;
+    public readonly int Hits;
+    public readonly int HitsMax;
+    public readonly int Mana;
+    public readonly int ManaMax;
+    public readonly int Stamina;
+    public readonly int StaminaMax;
+    public readonly Notoriety Notoriety;
+    public readonly bool IsDead;
+    public readonly bool IsPoisoned;
+    public readonly bool IsYellowHits;
+    public readonly bool IsHuman;
+    public readonly bool InWarMode;
+
+    internal PyMobileSnapshot(Mobile mobile)
+    {
+        Serial = mobile.Serial;
+        Name = mobile.Name ?? string.Empty;
+        Graphic = mobile.Graphic;
+        Hue = mobile.Hue;
+        X = mobile.X;
+        Y = mobile.Y;
+        Z = mobile.Z;
+        Distance = mobile.Distance;
+        Hits = mobile.Hits;
+        HitsMax = mobile.HitsMax;
+        Mana = mobile.Mana;
+        ManaMax = mobile.ManaMax;
+        Stamina = mobile.Stamina;
+        StaminaMax = mobile.StaminaMax;
+        Notoriety = (Notoriety)(byte)mobile.NotorietyFlag;
+        IsDead = mobile.IsDead;
+        IsPoisoned = mobile.IsPoisoned;
+        IsYellowHits = mobile.IsYellowHits;
+        IsHuman = mobile.IsHuman;
+        InWarMode = mobile.InWarMode;
+    }
+
+    public static implicit operator uint(PyMobileSnapshot mobile) => mobile?.Serial ?? 0;
+
+    public override string ToString() => $"<PyMobileSnapshot Serial=0x{Serial:X8} Name={Name} Hits={Hits}/{HitsMax} Pos=({X},{Y},{Z})>";
+
+    public string __repr__() => ToString();
+}
+
+/// <summary>
+/// A read-only copy of an item and its contents, see API.Snapshot().
+/// </summary>
+public class PyItemSnapshot
+{
+    public readonly uint Serial;
+    public readonly string Name;
+    public readonly ushort Graphic;
+    public readonly ushort Hue;
+    public readonly int Amount;
+    public readonly uint Container;
+    public readonly ushort X;
+    public readonly ushort Y;
+    public readonly bool IsContainer;
+    public readonly bool IsCorpse;
+
+    /// <summary>
+    /// Items directly inside this item.
+    /// </summary>
+    public readonly PyItemSnapshot[] Contents;
+
+    internal PyItemSnapshot(Item item, Dictionary<uint, PyItemSnapshot> index)
+    {
+        Serial = item.Serial;
+        Name = item.Name ?? string.Empty;
+        Graphic = item.Graphic;
+        Hue = item.Hue;
+        Amount = item.Amount;
+        Container = item.Container;
+        X = item.X;
+        Y = item.Y;
+        IsContainer = item.ItemData.IsContainer;
+        IsCorpse = item.IsCorpse;
+
+        index[Serial] = this;
+
+        if (item.Items == null)
+        {
+            Contents = [];
+            return;
+        }
+
+        var contents = new List<PyItemSnapshot>();
+
+        for (LinkedObject i = item.Items; i != null; i = i.Next)
+            if (i is Item child && !index.ContainsKey(child.Serial))
+                contents.Add(new PyItemSnapshot(child, index));
+
+        Contents = contents.ToArray();
+    }
+
+    public static implicit operator uint(PyItemSnapshot item) => item?.Serial ?? 0;
+
+    public override string ToString() => $"<PyItemSnapshot Serial=0x{Serial:X8} Graphic=0x{Graphic:X4} Hue=0x{Hue:X4} Amount={Amount}>";
+
+    public string __repr__() => ToString();
+}
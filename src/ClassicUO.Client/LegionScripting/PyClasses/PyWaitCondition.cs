@@ -0,0 +1,36 @@
+using System;
+
+namespace ClassicUO.LegionScripting.PyClasses;
+
+/// <summary>
+/// Something a script can wait for with API.WaitFor().
+/// Create these with API.WhenJournal, API.WhenGump, API.WhenTarget, API.WhenBuff, API.WhenHitsBelow or API.WhenItemInContainer.
+/// </summary>
+public class PyWaitCondition
+{
+    /// <summary>
+    /// A short description of what this condition waits for.
+    /// </summary>
+    public readonly string Name;
+
+    /// <summary>
+    /// Checked on the main thread.
+    /// </summary>
+    internal readonly Func<bool> Check;
+
+    /// <summary>
+    /// Each one subscribes a callback on the main thread and returns the action that unsubscribes it.
+    /// </summary>
+    internal readonly Func<Action, Action>[] Signals;
+
+    internal PyWaitCondition(string name, Func<bool> check, params Func<Action, Action>[] signals)
+    {
+        Name = name;
+        Check = check;
+        Signals = signals;
+    }
+
+    public override string ToString() => $"<PyWaitCondition {Name}>";
+
+    public string __repr__() => ToString();
+}
@@ -0,0 +1,135 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.IO;
+using System.Threading;
+using System.Threading.Tasks;
+using ClassicUO.Utility.Logging;
+using IronPython.Hosting;
+using Microsoft.Scripting.Hosting;
+
+namespace ClassicUO.LegionScripting;
+
+/// <summary>
+/// Keeps a few IronPython engines created and warmed up in the background so starting a script doesn't pay for engine creation,
+/// search path setup and the first import of common modules.
+/// Each engine is handed to a single script, engines are never shared between scripts since the API object lives in the engine's builtins.
+/// </summary>
+internal static class ScriptEnginePool
+{
+    public const int POOL_SIZE = 2;
+
+    private const string WARMUP_SCRIPT =
+        """
+        for _m in ('sys', 'os', 'time', 'math', 'random', 're', 'collections', 'datetime', 'json'):
+            try:
+                __import__(_m)
+            except Exception:
+                pass
+        """;
+
+    private static readonly ConcurrentQueue<ScriptEngine> _engines = new();
+    private static int _pending;
+    private static bool _enabled;
+
+    /// <summary>
+    /// Number of warm engines waiting to be leased.
+    /// </summary>
+    public static int Available => _engines.Count;
+
+    /// <summary>
+    /// Start filling the pool in the background.
+    /// </summary>
+    public static void Init()
+    {
+        _enabled = true;
+        Refill();
+    }
+
+    /// <summary>
+    /// Take a warm engine from the pool, or create one now if the pool is empty.
+    /// </summary>
+    /// <param name="scriptDirectory">Directory of the script, added to the engine search paths</param>
+    public static ScriptEngine Lease(string scriptDirectory)
+    {
+        if (!_engines.TryDequeue(out ScriptEngine engine))
+            engine = CreateEngine(false);
+
+        Refill();
+
+        ICollection<string> paths = engine.GetSearchPaths();
+        string dir = !string.IsNullOrWhiteSpace(scriptDirectory) ? scriptDirectory : Environment.CurrentDirectory;
+
+        if (!paths.Contains(dir))
+        {
+            paths.Add(dir);
+            engine.SetSearchPaths(paths);
+        }
+
+        return engine;
+    }
+
+    /// <summary>
+    /// Drop all idle engines and stop refilling the pool.
+    /// </summary>
+    public static void Clear()
+    {
+        _enabled = false;
+
+        while (_engines.TryDequeue(out ScriptEngine engine))
+            engine.Runtime.Shutdown();
+    }
+
+    private static void Refill()
+    {
+        while (_enabled)
+        {
+            // Reserve the slot before checking so concurrent refills can't both take the last one.
+            // An engine is enqueued before its slot is released, so this never counts too few.
+            if (_engines.Count + Interlocked.Increment(ref _pending) > POOL_SIZE)
+            {
+                Interlocked.Decrement(ref _pending);
+
+                break;
+            }
+
+            Task.Run
+            (() =>
+                {
+                    try
+                    {
+                        ScriptEngine engine = CreateEngine(true);
+
+                        if (_enabled)
+                            _engines.Enqueue(engine);
+                        else
+                            engine.Runtime.Shutdown();
+                    }
+                    catch (Exception e)
+                    {
+                        Log.Error($"Failed to create python engine: {e}");
+                    }
+                    finally
+                    {
+                        Interlocked.Decrement(ref _pending);
+                    }
+                }
+            );
+        }
+    }
+
+    private static ScriptEngine CreateEngine(bool warm)
+    {
+        ScriptEngine engine = Python.CreateEngine();
+
+        ICollection<string> paths = engine.GetSearchPaths();
+        paths.Add(Path.Combine(CUOEnviroment.ExecutablePath, "iplib"));
+        paths.Add(Path.Combine(CUOEnviroment.ExecutablePath, "LegionScripts"));
+        engine.SetSearchPaths(paths);
+
+        if (warm)
+            engine.Execute(WARMUP_SCRIPT, engine.CreateScope());
+
+        return engine;
+    }
+}
@@ -1,11 +1,13 @@
 using System;
-using System.Collections.Generic;
 using System.IO;
+using System.Security.Cryptography;
 using System.Text;
 using System.Threading;
 using ClassicUO.Game;
+using ClassicUO.Utility;
 using ClassicUO.Utility.Logging;
 using IronPython.Hosting;
+using Microsoft.Scripting;
 using Microsoft.Scripting.Hosting;
 
 namespace ClassicUO.LegionScripting;
@@ -23,6 +25,13 @@ public class ScriptFile
     public ScriptEngine PythonEngine;
     public ScriptScope PythonScope;
     public API ScopedApi;
+    public string ContentHash { get; private set; }
+
+    private volatile bool _changed = true;
+    private CompiledCode _compiledCode;
+    private ScriptEngine _compiledEngine;
+    private string _compiledHash;
+    private object _defaultRecursionLimit;
 
     public bool IsPlaying => PythonThread != null;
 
@@ -59,6 +68,7 @@ public class ScriptFile
         {
             File.WriteAllText(temp, contents);
             File.Move(temp, FullPath, true);
+            MarkChanged();
 
             GameActions.Print(World, $"Saved {FileName}.");
         }
@@ -70,40 +80,67 @@ public class ScriptFile
 
     public string[] ReadFromFile()
     {
+        _changed = false;
+
         try
         {
             string[] c = File.ReadAllLines(FullPath, Encoding.UTF8);
             FileContentsJoined = string.Join("\n", c);
 
             string pattern = @"^\s*(?:from\s+[\w.]+\s+import\s+API|import\s+API)\s*$";
-            FileContentsJoined = System.Text.RegularExpressions.Regex.Replace(FileContentsJoined, pattern, string.Empty, System.Text.RegularExpressions.RegexOptions.Multiline);
+            FileContentsJoined = RegexHelper.GetRegex(pattern, System.Text.RegularExpressions.RegexOptions.Multiline).Replace(FileContentsJoined, string.Empty);
+            ContentHash = Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(FileContentsJoined)));
 
             return c;
         }
         catch (Exception e)
         {
             Log.Error($"Error reading script file: {e}");
+            _changed = true;
             return [];
         }
     }
 
-    public bool FileExists() => File.Exists(FullPath);
+    /// <summary>
+    /// Re-read the file only if it changed on disk since the last read.
+    /// </summary>
+    public string[] ReadFromFileIfChanged() => _changed || FileContentsJoined == null ? FileContents = ReadFromFile() : FileContents;
 
-    public void SetupPythonEngine()
+    /// <summary>
+    /// Flag the file as changed on disk, the next play will re-read and recompile it.
+    /// </summary>
+    public void MarkChanged() => _changed = true;
+
+    /// <summary>
+    /// Get the compiled script for the current engine, only compiling again if the contents or engine changed.
+    /// </summary>
+    public CompiledCode GetCompiledCode()
     {
-        if (PythonEngine != null && !LegionScripting.LScriptSettings.DisableModuleCache)
-            return;
+        if (_compiledCode != null && _compiledEngine == PythonEngine && _compiledHash == ContentHash)
+            return _compiledCode;
+
+        ScriptSource source = PythonEngine.CreateScriptSourceFromString(FileContentsJoined, FullPath, SourceCodeKind.File);
 
-        PythonEngine = Python.CreateEngine();
+        _compiledCode = source.Compile();
+        _compiledEngine = PythonEngine;
+        _compiledHash = ContentHash;
 
-        string dir = System.IO.Path.GetDirectoryName(FullPath);
-        ICollection<string> paths = PythonEngine.GetSearchPaths();
-        paths.Add(System.IO.Path.Combine(CUOEnviroment.ExecutablePath, "iplib"));
-        paths.Add(System.IO.Path.Combine(CUOEnviroment.ExecutablePath, "LegionScripts"));
+        return _compiledCode;
+    }
 
-        paths.Add(!string.IsNullOrWhiteSpace(dir) ? dir : Environment.CurrentDirectory);
+    public bool FileExists() => File.Exists(FullPath);
+
+    public void SetupPythonEngine()
+    {
+        if (PythonEngine == null || LegionScripting.LScriptSettings.DisableModuleCache)
+        {
+            PythonEngine = ScriptEnginePool.Lease(System.IO.Path.GetDirectoryName(FullPath));
+            _defaultRecursionLimit = PythonEngine.GetSysModule().GetVariable("getrecursionlimit")();
+        }
 
-        PythonEngine.SetSearchPaths(paths);
+        // The engine is kept between plays, so the limit is set every time in case the setting was changed since
+        PythonEngine.GetSysModule().GetVariable("setrecursionlimit")
+            (LegionScripting.LScriptSettings.LightweightThreads ? LegionScripting.LIGHTWEIGHT_RECURSION_LIMIT : _defaultRecursionLimit);
     }
 
     public void SetupPythonScope()
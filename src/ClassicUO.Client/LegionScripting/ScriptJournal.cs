@@ -0,0 +1,285 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using ClassicUO.Configuration;
+using ClassicUO.Game.Managers;
+using ClassicUO.LegionScripting.PyClasses;
+
+namespace ClassicUO.LegionScripting;
+
+/// <summary>
+/// Append-only journal shared by all running scripts.
+/// Every entry gets a sequence number, scripts only keep a <see cref="ScriptJournalCursor"/> into this buffer instead of their own copy.
+/// </summary>
+internal sealed class ScriptJournal
+{
+    /// <summary>
+    /// Hard limit of entries kept, the max journal entries setting can not go above this.
+    /// </summary>
+    public const int CAPACITY = 2048;
+
+    private readonly PyJournalEntry[] _entries = new PyJournalEntry[CAPACITY];
+    private readonly object _lock = new();
+    private long _next;
+
+    /// <summary>
+    /// The sequence number the next entry will get.
+    /// </summary>
+    public long NextSequence
+    {
+        get
+        {
+            lock (_lock)
+                return _next;
+        }
+    }
+
+    /// <summary>
+    /// The oldest sequence number still visible to scripts.
+    /// </summary>
+    public long OldestSequence
+    {
+        get
+        {
+            lock (_lock)
+                return OldestUnsafe();
+        }
+    }
+
+    /// <summary>
+    /// The number of recent entries visible to scripts.
+    /// </summary>
+    private static int Window => Math.Clamp(ProfileManager.CurrentProfile?.MaxJournalEntries ?? 250, 1, CAPACITY);
+
+    public void Add(JournalEntry entry)
+    {
+        lock (_lock)
+        {
+            _entries[_next % CAPACITY] = new PyJournalEntry(entry) { Sequence = _next };
+            _next++;
+        }
+    }
+
+    /// <summary>
+    /// Copy all retained entries with a sequence number of at least <paramref name="from"/>, oldest first.
+    /// </summary>
+    public void Read(long from, List<PyJournalEntry> into)
+    {
+        lock (_lock)
+        {
+            for (long s = Math.Max(from, OldestUnsafe()); s < _next; s++)
+                into.Add(_entries[s % CAPACITY]);
+        }
+    }
+
+    /// <summary>
+    /// Same as <see cref="Read"/> but only entries newer than <paramref name="cutoff"/>, found with a binary search on time.
+    /// </summary>
+    public void ReadSince(long from, DateTime cutoff, List<PyJournalEntry> into)
+    {
+        lock (_lock)
+        {
+            long lo = Math.Max(from, OldestUnsafe()), hi = _next;
+
+            while (lo < hi)
+            {
+                long mid = lo + (hi - lo) / 2;
+
+                if (_entries[mid % CAPACITY].Time < cutoff)
+                    lo = mid + 1;
+                else
+                    hi = mid;
+            }
+
+            for (long s = lo; s < _next; s++)
+                into.Add(_entries[s % CAPACITY]);
+        }
+    }
+
+    /// <summary>
+    /// Get the oldest retained entry from <paramref name="from"/> on that is not in <paramref name="skip"/>, without copying the rest.
+    /// </summary>
+    public bool TryFirst(long from, HashSet<long> skip, out PyJournalEntry entry)
+    {
+        lock (_lock)
+        {
+            for (long s = Math.Max(from, OldestUnsafe()); s < _next; s++)
+            {
+                if (skip.Count == 0 || !skip.Contains(s))
+                {
+                    entry = _entries[s % CAPACITY];
+
+                    return true;
+                }
+            }
+        }
+
+        entry = null;
+
+        return false;
+    }
+
+    /// <summary>
+    /// Number of retained entries from <paramref name="from"/> on that are not in <paramref name="skip"/>.
+    /// </summary>
+    public int Count(long from, HashSet<long> skip)
+    {
+        lock (_lock)
+        {
+            long start = Math.Max(from, OldestUnsafe());
+            long count = Math.Max(0, _next - start);
+
+            foreach (long s in skip)
+            {
+                if (s >= start && s < _next)
+                    count--;
+            }
+
+            return (int)count;
+        }
+    }
+
+    /// <summary>
+    /// Oldest sequence number still visible, must hold the lock.
+    /// </summary>
+    private long OldestUnsafe() => Math.Max(0, _next - Window);
+}
+
+/// <summary>
+/// A single script's view of the <see cref="ScriptJournal"/>.
+/// </summary>
+internal sealed class ScriptJournalCursor
+{
+    private readonly ScriptJournal _journal;
+    private readonly HashSet<long> _cleared = new();
+    private long _clearedUpTo;
+
+    public ScriptJournalCursor(ScriptJournal journal)
+    {
+        _journal = journal;
+        _clearedUpTo = journal.NextSequence;
+    }
+
+    /// <summary>
+    /// All entries this script can see, oldest first.
+    /// </summary>
+    public List<PyJournalEntry> Entries()
+    {
+        var list = new List<PyJournalEntry>();
+        _journal.Read(Interlocked.Read(ref _clearedUpTo), list);
+
+        return RemoveCleared(list);
+    }
+
+    /// <summary>
+    /// Entries this script can see that are newer than <paramref name="cutoff"/>, oldest first.
+    /// </summary>
+    public List<PyJournalEntry> EntriesSince(DateTime cutoff)
+    {
+        var list = new List<PyJournalEntry>();
+        _journal.ReadSince(Interlocked.Read(ref _clearedUpTo), cutoff, list);
+
+        return RemoveCleared(list);
+    }
+
+    /// <summary>
+    /// Entries this script can see with a sequence number of at least <paramref name="sequence"/>, oldest first.
+    /// </summary>
+    public List<PyJournalEntry> EntriesFrom(long sequence)
+    {
+        var list = new List<PyJournalEntry>();
+        _journal.Read(Math.Max(sequence, Interlocked.Read(ref _clearedUpTo)), list);
+
+        return RemoveCleared(list);
+    }
+
+    /// <summary>
+    /// Number of entries this script can see.
+    /// </summary>
+    public int Count
+    {
+        get
+        {
+            lock (_cleared)
+                return _journal.Count(Interlocked.Read(ref _clearedUpTo), _cleared);
+        }
+    }
+
+    /// <summary>
+    /// Get the oldest entry this script can see without hiding it.
+    /// </summary>
+    public bool TryPeek(out PyJournalEntry entry)
+    {
+        lock (_cleared)
+            return _journal.TryFirst(Interlocked.Read(ref _clearedUpTo), _cleared, out entry);
+    }
+
+    /// <summary>
+    /// Get the oldest entry this script can see and move the read position past it.
+    /// </summary>
+    public bool TryDequeue(out PyJournalEntry entry)
+    {
+        lock (_cleared)
+        {
+            if (!_journal.TryFirst(Interlocked.Read(ref _clearedUpTo), _cleared, out entry))
+                return false;
+
+            Interlocked.Exchange(ref _clearedUpTo, entry.Sequence + 1);
+
+            // Single cleared entries behind the read position are hidden by it now
+            if (_cleared.Count > 0)
+                _cleared.RemoveWhere(s => s <= entry.Sequence);
+
+            return true;
+        }
+    }
+
+    /// <summary>
+    /// Check if an entry is still in the journal and has not been cleared by this script.
+    /// </summary>
+    public bool IsVisible(PyJournalEntry entry)
+    {
+        if (entry.Sequence < Interlocked.Read(ref _clearedUpTo) || entry.Sequence < _journal.OldestSequence)
+            return false;
+
+        lock (_cleared)
+            return !_cleared.Contains(entry.Sequence);
+    }
+
+    /// <summary>
+    /// Hide everything currently in the journal from this script.
+    /// </summary>
+    public void Clear()
+    {
+        lock (_cleared)
+        {
+            Interlocked.Exchange(ref _clearedUpTo, _journal.NextSequence);
+            _cleared.Clear();
+        }
+    }
+
+    /// <summary>
+    /// Hide a single entry from this script.
+    /// </summary>
+    public void Clear(PyJournalEntry entry)
+    {
+        lock (_cleared)
+        {
+            _cleared.Add(entry.Sequence);
+
+            if (_cleared.Count > ScriptJournal.CAPACITY)
+                _cleared.RemoveWhere(s => s < _journal.NextSequence - ScriptJournal.CAPACITY);
+        }
+    }
+
+    private List<PyJournalEntry> RemoveCleared(List<PyJournalEntry> list)
+    {
+        lock (_cleared)
+        {
+            if (_cleared.Count > 0)
+                list.RemoveAll(e => _cleared.Contains(e.Sequence));
+        }
+
+        return list;
+    }
+}
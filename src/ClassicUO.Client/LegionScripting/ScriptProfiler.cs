@@ -0,0 +1,256 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Globalization;
+using System.IO;
+using System.Linq;
+using System.Text;
+using System.Text.Json;
+using System.Threading;
+using ClassicUO.Game.Managers;
+using ClassicUO.Utility;
+
+namespace ClassicUO.LegionScripting;
+
+/// <summary>
+/// Optional per script, per API method timing of main thread calls.
+/// While enabled every call a script dispatches to the main thread records how long it sat in the queue and how long it ran,
+/// main thread time is also reported to <see cref="Profiler"/> under an "LScript:name" context.
+/// </summary>
+internal static class ScriptProfiler
+{
+    /// <summary>
+    /// Histogram bucket upper bounds in ms, the last bucket holds everything above the final bound.
+    /// </summary>
+    public static readonly double[] BUCKETS_MS = [0.1, 0.5, 1, 5, 16, 50, 100, 500];
+
+    private static readonly ConcurrentDictionary<string, ScriptProfile> _scripts = new();
+
+    [ThreadStatic]
+    private static string _currentScript;
+
+    private static bool _enabled;
+
+    public static bool Enabled
+    {
+        get => _enabled;
+        set
+        {
+            _enabled = value;
+            MainThreadQueue.DispatchHook = value ? Wrap : null;
+        }
+    }
+
+    public static IEnumerable<ScriptProfile> Scripts => _scripts.Values;
+
+    /// <summary>
+    /// Mark the calling thread as running this script, called when the script thread starts.
+    /// Profiles are keyed by full path so scripts with the same name in different folders are kept apart.
+    /// </summary>
+    public static void SetCurrentScript(string fullPath) => _currentScript = fullPath;
+
+    public static void Reset() => _scripts.Clear();
+
+    /// <summary>
+    /// Record time the current script spent in API.Pause.
+    /// </summary>
+    public static void RecordPause(long ticks)
+    {
+        if (!_enabled || _currentScript == null)
+            return;
+
+        ScriptProfile profile = GetProfile(_currentScript);
+        Interlocked.Increment(ref profile.PauseCount);
+        Interlocked.Add(ref profile.PauseTicks, ticks);
+    }
+
+    private static ScriptProfile GetProfile(string script) => _scripts.GetOrAdd(script, s => new ScriptProfile(s));
+
+    private static Action Wrap(Action action, string caller)
+    {
+        if (_currentScript == null || caller == null)
+            return action;
+
+        ScriptProfile profile = GetProfile(_currentScript);
+        ApiCallStats stats = profile.Calls.GetOrAdd(caller, c => new ApiCallStats(c));
+        long queued = Stopwatch.GetTimestamp();
+
+        return () =>
+        {
+            long start = Stopwatch.GetTimestamp();
+            Profiler.EnterContext(profile.ContextName);
+
+            try
+            {
+                action();
+            }
+            finally
+            {
+                Profiler.ExitContext(profile.ContextName);
+                stats.Record(start - queued, Stopwatch.GetTimestamp() - start);
+            }
+        };
+    }
+
+    internal static double ToMs(long ticks) => ticks * 1000d / Stopwatch.Frequency;
+
+    /// <summary>
+    /// Export all recorded stats as CSV, one row per script and method.
+    /// </summary>
+    public static string ExportCsv(string path)
+    {
+        var sb = new StringBuilder();
+        sb.Append("Script,Method,Calls,QueuedTotalMs,QueuedAvgMs,QueuedMaxMs,ExecTotalMs,ExecAvgMs,ExecMaxMs");
+
+        foreach (double b in BUCKETS_MS)
+            sb.Append(",Exec<=").Append(b.ToString(CultureInfo.InvariantCulture)).Append("ms");
+
+        sb.Append(",Exec>").Append(BUCKETS_MS[^1].ToString(CultureInfo.InvariantCulture)).Append("ms\n");
+
+        foreach (ScriptProfile script in _scripts.Values.OrderBy(s => s.Name))
+        {
+            sb.Append(Csv(script.Name)).Append(",Pause,").Append(script.PauseCount).Append(",,,,").Append(F(ToMs(script.PauseTicks))).Append(",,");
+            sb.Append(',', BUCKETS_MS.Length + 1).Append('\n');
+
+            foreach (ApiCallStats c in script.Calls.Values.OrderByDescending(c => c.ExecTicks))
+            {
+                sb.Append(Csv(script.Name)).Append(',').Append(Csv(c.Name)).Append(',').Append(c.Count).Append(',');
+                sb.Append(F(ToMs(c.QueuedTicks))).Append(',').Append(F(c.AvgQueuedMs)).Append(',').Append(F(ToMs(c.MaxQueuedTicks))).Append(',');
+                sb.Append(F(ToMs(c.ExecTicks))).Append(',').Append(F(c.AvgExecMs)).Append(',').Append(F(ToMs(c.MaxExecTicks)));
+
+                foreach (long n in c.ExecHistogram)
+                    sb.Append(',').Append(n);
+
+                sb.Append('\n');
+            }
+        }
+
+        File.WriteAllText(path, sb.ToString());
+
+        return path;
+
+        static string F(double v) => v.ToString("0.###", CultureInfo.InvariantCulture);
+        static string Csv(string v) => v.Contains(',') || v.Contains('"') ? $"\"{v.Replace("\"", "\"\"")}\"" : v;
+    }
+
+    /// <summary>
+    /// Export all recorded stats as JSON.
+    /// </summary>
+    public static string ExportJson(string path)
+    {
+        using (FileStream fs = File.Create(path))
+        using (var w = new Utf8JsonWriter(fs, new JsonWriterOptions { Indented = true }))
+        {
+            w.WriteStartObject();
+            w.WriteStartArray("bucketsMs");
+
+            foreach (double b in BUCKETS_MS)
+                w.WriteNumberValue(b);
+
+            w.WriteEndArray();
+            w.WriteStartArray("scripts");
+
+            foreach (ScriptProfile script in _scripts.Values.OrderBy(s => s.Name))
+            {
+                w.WriteStartObject();
+                w.WriteString("script", script.Name);
+                w.WriteNumber("pauseCount", script.PauseCount);
+                w.WriteNumber("pauseMs", ToMs(script.PauseTicks));
+                w.WriteStartArray("calls");
+
+                foreach (ApiCallStats c in script.Calls.Values.OrderByDescending(c => c.ExecTicks))
+                {
+                    w.WriteStartObject();
+                    w.WriteString("method", c.Name);
+                    w.WriteNumber("count", c.Count);
+                    w.WriteNumber("queuedMs", ToMs(c.QueuedTicks));
+                    w.WriteNumber("queuedMaxMs", ToMs(c.MaxQueuedTicks));
+                    w.WriteNumber("execMs", ToMs(c.ExecTicks));
+                    w.WriteNumber("execMaxMs", ToMs(c.MaxExecTicks));
+                    WriteHistogram(w, "queuedHistogram", c.QueuedHistogram);
+                    WriteHistogram(w, "execHistogram", c.ExecHistogram);
+                    w.WriteEndObject();
+                }
+
+                w.WriteEndArray();
+                w.WriteEndObject();
+            }
+
+            w.WriteEndArray();
+            w.WriteEndObject();
+        }
+
+        return path;
+
+        static void WriteHistogram(Utf8JsonWriter w, string name, long[] histogram)
+        {
+            w.WriteStartArray(name);
+
+            foreach (long n in histogram)
+                w.WriteNumberValue(n);
+
+            w.WriteEndArray();
+        }
+    }
+}
+
+internal sealed class ScriptProfile
+{
+    public readonly string FullPath;
+
+    /// <summary>
+    /// Path relative to the scripts folder.
+    /// </summary>
+    public readonly string Name;
+
+    public readonly string ContextName;
+    public readonly ConcurrentDictionary<string, ApiCallStats> Calls = new();
+    public long PauseCount;
+    public long PauseTicks;
+
+    public ScriptProfile(string fullPath)
+    {
+        FullPath = fullPath;
+        Name = string.IsNullOrEmpty(LegionScripting.ScriptPath) ? fullPath : Path.GetRelativePath(LegionScripting.ScriptPath, fullPath).Replace(Path.DirectorySeparatorChar, '/');
+        ContextName = "LScript:" + Name;
+    }
+}
+
+internal sealed class ApiCallStats
+{
+    public readonly string Name;
+    public readonly long[] QueuedHistogram = new long[ScriptProfiler.BUCKETS_MS.Length + 1];
+    public readonly long[] ExecHistogram = new long[ScriptProfiler.BUCKETS_MS.Length + 1];
+    public long Count;
+    public long QueuedTicks, MaxQueuedTicks;
+    public long ExecTicks, MaxExecTicks;
+
+    public double AvgQueuedMs => Count == 0 ? 0 : ScriptProfiler.ToMs(QueuedTicks) / Count;
+    public double AvgExecMs => Count == 0 ? 0 : ScriptProfiler.ToMs(ExecTicks) / Count;
+
+    public ApiCallStats(string name) => Name = name;
+
+    public void Record(long queuedTicks, long execTicks)
+    {
+        //Only ever called from the main thread, no need for interlocked updates
+        Count++;
+        QueuedTicks += queuedTicks;
+        ExecTicks += execTicks;
+        MaxQueuedTicks = Math.Max(MaxQueuedTicks, queuedTicks);
+        MaxExecTicks = Math.Max(MaxExecTicks, execTicks);
+        QueuedHistogram[Bucket(queuedTicks)]++;
+        ExecHistogram[Bucket(execTicks)]++;
+    }
+
+    private static int Bucket(long ticks)
+    {
+        double ms = ScriptProfiler.ToMs(ticks);
+        int i = 0;
+
+        while (i < ScriptProfiler.BUCKETS_MS.Length && ms > ScriptProfiler.BUCKETS_MS[i])
+            i++;
+
+        return i;
+    }
+}
@@ -0,0 +1,171 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using ClassicUO.Game.Managers;
+using ClassicUO.LegionScripting.PyClasses;
+using ClassicUO.Utility.Logging;
+
+namespace ClassicUO.LegionScripting;
+
+/// <summary>
+/// Event driven waits for script threads.
+/// Instead of polling the main thread every frame, the waiting thread is parked until one of the given signals fires
+/// and the condition is re-checked on the main thread from inside that signal.
+/// </summary>
+internal static class ScriptWaits
+{
+    [ThreadStatic]
+    private static CancellationToken _scriptToken;
+
+    /// <summary>
+    /// Cancelled when the script running on the calling thread is stopped, <see cref="CancellationToken.None"/> outside script threads.
+    /// For waits in classes that have no <see cref="API"/> to take the token from.
+    /// </summary>
+    public static CancellationToken ScriptToken => _scriptToken;
+
+    /// <summary>
+    /// Mark the calling thread as running a script that stops with this token, called when the script thread starts.
+    /// </summary>
+    public static void SetScriptToken(CancellationToken token) => _scriptToken = token;
+
+    /// <summary>
+    /// Block the calling thread until <paramref name="condition"/> is true or the timeout expires.
+    /// The condition is always evaluated on the main thread: once when the wait starts, then again each time a signal fires.
+    /// </summary>
+    /// <param name="condition">Checked on the main thread</param>
+    /// <param name="timeout">Seconds to wait</param>
+    /// <param name="token">Cancels the wait</param>
+    /// <param name="signals">Each one subscribes a callback on the main thread and returns the action that unsubscribes it</param>
+    /// <returns>True if the condition was met, false if timed out</returns>
+    public static bool WaitUntil(Func<bool> condition, double timeout, CancellationToken token, params Func<Action, Action>[] signals) =>
+        WaitAny([new PyWaitCondition(string.Empty, condition, signals)], timeout, token) >= 0;
+
+    /// <summary>
+    /// Block the calling thread until any of the conditions is true or the timeout expires.
+    /// </summary>
+    /// <returns>The index of the first condition that was met, or -1 if timed out</returns>
+    public static int WaitAny(IList<PyWaitCondition> conditions, double timeout, CancellationToken token)
+    {
+        if (conditions == null || conditions.Count == 0)
+            return -1;
+
+        var signal = new ManualResetEventSlim(false);
+        var unsubscribe = new List<Action>();
+        int fired = -1;
+
+        void Check(int index)
+        {
+            try
+            {
+                if (!signal.IsSet && conditions[index].Check())
+                {
+                    fired = index;
+                    signal.Set();
+                }
+            }
+            catch (Exception e)
+            {
+                //Never let a script condition break the event that is being raised
+                Log.Warn($"Script wait condition failed: {e.Message}");
+            }
+        }
+
+        bool met = MainThreadQueue.InvokeOnMainThread(() =>
+        {
+            for (int i = 0; i < conditions.Count; i++)
+            {
+                Check(i);
+
+                if (signal.IsSet)
+                    return true;
+            }
+
+            for (int i = 0; i < conditions.Count; i++)
+            {
+                int index = i;
+
+                foreach (Func<Action, Action> s in conditions[i].Signals)
+                    unsubscribe.Add(s(() => Check(index)));
+            }
+
+            return false;
+        });
+
+        if (met)
+            return fired;
+
+        try
+        {
+            return signal.Wait(TimeSpan.FromSeconds(Math.Max(0, timeout)), token) ? fired : -1;
+        }
+        finally
+        {
+            MainThreadQueue.InvokeOnMainThread(() =>
+            {
+                foreach (Action u in unsubscribe)
+                    u?.Invoke();
+            });
+        }
+    }
+
+    public static Action OnTargetCursorChanged(Action callback)
+    {
+        EventHandler<bool> handler = (_, _) => callback();
+        EventSink.OnTargetCursorChanged += handler;
+
+        return () => EventSink.OnTargetCursorChanged -= handler;
+    }
+
+    public static Action OnGumpAdded(Action callback)
+    {
+        EventHandler<EventArgs> handler = (_, _) => callback();
+        EventSink.OnGumpAdded += handler;
+
+        return () => EventSink.OnGumpAdded -= handler;
+    }
+
+    public static Action OnOPLReceived(Action callback)
+    {
+        EventHandler<OPLEventArgs> handler = (_, _) => callback();
+        EventSink.OPLOnReceive += handler;
+
+        return () => EventSink.OPLOnReceive -= handler;
+    }
+
+    public static Action OnJournalEntryAdded(Action callback)
+    {
+        EventHandler<JournalEntry> handler = (_, _) => callback();
+        EventSink.JournalEntryAdded += handler;
+
+        return () => EventSink.JournalEntryAdded -= handler;
+    }
+
+    public static Action OnBuffAdded(Action callback)
+    {
+        EventHandler<BuffEventArgs> handler = (_, _) => callback();
+        EventSink.OnBuffAdded += handler;
+
+        return () => EventSink.OnBuffAdded -= handler;
+    }
+
+    public static Action OnPlayerHitsChanged(Action callback)
+    {
+        EventHandler<int> handler = (_, _) => callback();
+        EventSink.OnPlayerHitsChanged += handler;
+
+        return () => EventSink.OnPlayerHitsChanged -= handler;
+    }
+
+    public static Action OnItemCreatedOrUpdated(Action callback)
+    {
+        EventHandler<EventArgs> handler = (_, _) => callback();
+        EventSink.OnItemCreated += handler;
+        EventSink.OnItemUpdated += handler;
+
+        return () =>
+        {
+            EventSink.OnItemCreated -= handler;
+            EventSink.OnItemUpdated -= handler;
+        };
+    }
+}
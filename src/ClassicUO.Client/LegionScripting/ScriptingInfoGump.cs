@@ -1,5 +1,6 @@
 using System;
 using System.Collections.Generic;
+using System.IO;
 using System.Linq;
 using ClassicUO.Assets;
 using ClassicUO.Game;
@@ -24,6 +25,9 @@ namespace ClassicUO.LegionScripting
         private const int MIN_HEIGHT = 200;
         private static int lastX = 200, lastY = 200;
         private static int lastWidth = 300, lastHeight = 400;
+        private const int PROFILE_REFRESH_MS = 1000;
+        private const int PROFILE_TOP_CALLS = 10;
+        private uint nextProfileRefresh;
 
         public static ScriptingInfoGump Instance { get; private set; }
 
@@ -91,6 +95,81 @@ namespace ClassicUO.LegionScripting
             {
                 container?.Add(new InfoEntry(entry.Key, entry.Value?.ToString() ?? "", container.Width - 10));
             }
+
+            if (container != null)
+                AddProfilerSection();
+        }
+
+        public override void Update()
+        {
+            base.Update();
+
+            if (nextProfileRefresh != 0 && Time.Ticks < nextProfileRefresh)
+                return;
+
+            if (nextProfileRefresh == 0 || ScriptProfiler.Enabled)
+                UpdateUI();
+
+            nextProfileRefresh = Time.Ticks + PROFILE_REFRESH_MS;
+        }
+
+        private void AddProfilerSection()
+        {
+            var buttons = new Area(false);
+
+            AddProfilerButton(buttons, 0, 90, ScriptProfiler.Enabled ? "Profiler: On" : "Profiler: Off", () => ScriptProfiler.Enabled = !ScriptProfiler.Enabled)
+                .SetTooltip("Record how long each script's API calls wait for and run on the game thread");
+            AddProfilerButton(buttons, 95, 50, "Reset", ScriptProfiler.Reset);
+            AddProfilerButton(buttons, 150, 45, "CSV", () => ExportProfile("csv"));
+            AddProfilerButton(buttons, 200, 45, "JSON", () => ExportProfile("json"));
+
+            buttons.ForceSizeUpdate();
+            container.Add(buttons);
+
+            foreach (ScriptProfile script in ScriptProfiler.Scripts.OrderBy(s => s.Name))
+            {
+                if (script.PauseCount > 0)
+                    container.Add(new InfoEntry($"{script.Name} Pause", $"{script.PauseCount}x {ScriptProfiler.ToMs(script.PauseTicks) / 1000:0.0}s", container.Width - 10));
+
+                foreach (ApiCallStats call in script.Calls.Values.OrderByDescending(c => c.ExecTicks).Take(PROFILE_TOP_CALLS))
+                    container.Add(new InfoEntry($"{script.Name} {call.Name}", $"{call.Count}x wait {call.AvgQueuedMs:0.00}ms run {call.AvgExecMs:0.000}ms", container.Width - 10));
+            }
+        }
+
+        private NiceButton AddProfilerButton(Area area, int x, int width, string text, Action onClick)
+        {
+            var button = new NiceButton(x, 0, width, 20, ButtonAction.Activate, text)
+            {
+                IsSelectable = false,
+                DisplayBorder = true
+            };
+
+            button.MouseUp += (s, e) =>
+            {
+                if (e.Button != MouseButtonType.Left)
+                    return;
+
+                onClick();
+                nextProfileRefresh = 0; //Rebuild on the next update, not while this button is handling input
+            };
+
+            area.Add(button);
+
+            return button;
+        }
+
+        private static void ExportProfile(string format)
+        {
+            try
+            {
+                string path = Path.Combine(CUOEnviroment.ExecutablePath, "Data", $"lscript_profile_{DateTime.Now:yyyyMMdd_HHmmss}.{format}");
+                path = format == "csv" ? ScriptProfiler.ExportCsv(path) : ScriptProfiler.ExportJson(path);
+                GameActions.Print($"Exported script profile to {path}", Constants.HUE_SUCCESS);
+            }
+            catch (Exception e)
+            {
+                GameActions.Print($"Failed to export script profile: {e.Message}", Constants.HUE_ERROR);
+            }
         }
 
         protected override void OnMove(int x, int y)
@@ -43,7 +43,7 @@ internal static class Utility
     {
         var list = new List<Item>();
 
-        foreach (Item item in World.Items.Values)
+        foreach (Item item in FindCandidates(gfx, parentContainer, hue))
         {
             if (gfx != uint.MaxValue && item.Graphic != gfx)
                 continue;
@@ -71,6 +71,27 @@ internal static class Utility
         return list;
     }
 
+    /// <summary>
+    /// Pick the smallest set of items that could match from the world's item index, falling back to all items when no indexed filter is used.
+    /// </summary>
+    private static IEnumerable<Item> FindCandidates(uint gfx, uint parentContainer, ushort hue)
+    {
+        IReadOnlyCollection<Item> best = null;
+
+        if (gfx != uint.MaxValue)
+            best = gfx > ushort.MaxValue ? [] : World.ItemIndex.ByGraphic((ushort)gfx);
+
+        if (parentContainer != uint.MaxValue)
+            best = Smallest(best, World.ItemIndex.ByContainer(parentContainer));
+
+        if (hue != ushort.MaxValue)
+            best = Smallest(best, World.ItemIndex.ByHue(hue));
+
+        return best ?? (IEnumerable<Item>)World.Items.Values;
+
+        static IReadOnlyCollection<Item> Smallest(IReadOnlyCollection<Item> a, IReadOnlyCollection<Item> b) => a == null || b.Count < a.Count ? b : a;
+    }
+
     public static uint ContentsCount(Item container)
     {
         if (container == null)
@@ -84,6 +105,29 @@ internal static class Utility
         return c;
     }
 
+    /// <summary>
+    /// Check if a container, or any of its sub containers, holds an item with this graphic (and hue)
+    /// </summary>
+    public static bool ContainerHasItem(Item container, uint graphic, ushort hue = ushort.MaxValue)
+    {
+        if (container == null)
+            return false;
+
+        for (LinkedObject i = container.Items; i != null; i = i.Next)
+        {
+            if (i is not Item item)
+                continue;
+
+            if (item.Graphic == graphic && (hue == ushort.MaxValue || item.Hue == hue))
+                return true;
+
+            if (!item.IsEmpty && ContainerHasItem(item, graphic, hue))
+                return true;
+        }
+
+        return false;
+    }
+
     public static bool SearchItemNameAndProps(string search, Item item)
     {
         if (item == null)
@@ -209,15 +253,67 @@ internal static class Utility
         }
     }
 
-    public static Item FindNearestCorpsePython(int distance, API api) => World.Items.Values.Where(c => c.IsCorpse && c.Distance <= distance && !api.OnIgnoreList(c)).OrderBy(c => c.Distance).FirstOrDefault();
+    /// <summary>
+    /// Largest distance answered from the world's entity grids, anything further scans every entity.
+    /// </summary>
+    private const int GRID_MAX_RANGE = 64;
+
+    /// <summary>
+    /// Mobile distance is measured from their last queued step, which can be a few tiles from where they are placed on the map.
+    /// </summary>
+    private const int GRID_PADDING = 8;
+
+    /// <summary>
+    /// Mobiles that may be within <paramref name="distance"/> of the player, callers still need to check the exact distance.
+    /// </summary>
+    public static IEnumerable<Mobile> MobilesInRange(int distance)
+    {
+        if (distance > GRID_MAX_RANGE)
+            return World.Mobiles.Values;
+
+        var list = new List<Mobile>();
+        World.MobileGrid.Query(World.RangeSize.X, World.RangeSize.Y, distance + GRID_PADDING, list);
+
+        return list;
+    }
+
+    /// <summary>
+    /// Items that may be on the ground within <paramref name="distance"/> of the player, callers still need to check the exact distance.
+    /// </summary>
+    public static IEnumerable<Item> GroundItemsInRange(int distance)
+    {
+        if (distance > GRID_MAX_RANGE)
+            return World.Items.Values;
+
+        var list = new List<Item>();
+        World.ItemGrid.Query(World.RangeSize.X, World.RangeSize.Y, distance + GRID_PADDING, list);
+
+        return list;
+    }
+
+    public static Item FindNearestCorpsePython(int distance, API api)
+    {
+        Item nearest = null;
+
+        foreach (Item c in GroundItemsInRange(distance))
+        {
+            if (!c.IsCorpse || c.Distance > distance || api.OnIgnoreList(c))
+                continue;
+
+            if (nearest == null || c.Distance < nearest.Distance)
+                nearest = c;
+        }
+
+        return nearest;
+    }
 
-    public static uint FindNearestCheckPythonIgnore(ScanTypeObject scanType, API api)
+    public static uint FindNearestCheckPythonIgnore(ScanTypeObject scanType, API api, int maxDistance = int.MaxValue)
     {
         int distance = int.MaxValue;
         uint serial = 0;
 
         if (scanType == ScanTypeObject.Objects)
-            foreach (Item item in World.Items.Values)
+            foreach (Item item in GroundItemsInRange(maxDistance))
             {
                 if (item.IsMulti || item.IsDestroyed || !item.OnGround || api.OnIgnoreList(item)) continue;
 
@@ -228,7 +324,7 @@ internal static class Utility
                 }
             }
         else
-            foreach (Mobile mobile in World.Mobiles.Values)
+            foreach (Mobile mobile in MobilesInRange(maxDistance))
             {
                 if (mobile.IsDestroyed || mobile == World.Player || api.OnIgnoreList(mobile)) continue;
 
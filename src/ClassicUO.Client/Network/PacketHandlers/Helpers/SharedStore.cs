@@ -19,6 +19,11 @@ internal static class SharedStore
         _cliLocRequests.Add(serial);
     }
 
+    /// <summary>
+    /// True while a property request for the serial is queued and not sent yet, also the case when the server reported a newer revision.
+    /// </summary>
+    public static bool HasMegaCliLocRequest(uint serial) => _cliLocRequests.Contains(serial);
+
     public static void AddCustomHouseRequest(uint serial)
     {
         if (_customHouseRequests.Any(s => s == serial))
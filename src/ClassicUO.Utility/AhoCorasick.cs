@@ -0,0 +1,103 @@
+using System;
+using System.Collections.Generic;
+
+namespace ClassicUO.Utility;
+
+/// <summary>
+/// Multi pattern substring matcher. Finds which of many literal patterns occur in a text in a single pass over the text.
+/// Matching is ordinal and case sensitive, the same as <see cref="string.Contains(string)"/>.
+/// </summary>
+public sealed class AhoCorasick
+{
+    private const int NONE = int.MaxValue;
+
+    private readonly List<Dictionary<char, int>> _goto = [new()];
+    private readonly List<int> _best = [NONE];
+    private readonly int[] _fail;
+
+    public int PatternCount { get; }
+
+    public AhoCorasick(IReadOnlyList<string> patterns)
+    {
+        PatternCount = patterns.Count;
+
+        for (int i = 0; i < patterns.Count; i++)
+        {
+            string p = patterns[i] ?? string.Empty;
+            int state = 0;
+
+            foreach (char c in p)
+            {
+                if (!_goto[state].TryGetValue(c, out int next))
+                {
+                    next = _goto.Count;
+                    _goto.Add(new Dictionary<char, int>());
+                    _best.Add(NONE);
+                    _goto[state][c] = next;
+                }
+
+                state = next;
+            }
+
+            _best[state] = Math.Min(_best[state], i);
+        }
+
+        _fail = new int[_goto.Count];
+        var queue = new Queue<int>();
+
+        foreach (int child in _goto[0].Values)
+            queue.Enqueue(child);
+
+        while (queue.Count > 0)
+        {
+            int state = queue.Dequeue();
+
+            foreach (KeyValuePair<char, int> kv in _goto[state])
+            {
+                int child = kv.Value;
+                int f = _fail[state];
+
+                while (f != 0 && !_goto[f].ContainsKey(kv.Key))
+                    f = _fail[f];
+
+                _fail[child] = _goto[f].TryGetValue(kv.Key, out int target) && target != child ? target : 0;
+                _best[child] = Math.Min(_best[child], _best[_fail[child]]);
+                queue.Enqueue(child);
+            }
+        }
+    }
+
+    /// <summary>
+    /// Find the lowest index of any pattern contained in <paramref name="text"/>.
+    /// </summary>
+    /// <returns>The pattern index, or -1 if none are found</returns>
+    public int FirstMatch(string text)
+    {
+        int result = _best[0];
+
+        if (result == 0 || string.IsNullOrEmpty(text))
+            return result == NONE ? -1 : result;
+
+        int state = 0;
+
+        foreach (char c in text)
+        {
+            int next;
+
+            while (!_goto[state].TryGetValue(c, out next) && state != 0)
+                state = _fail[state];
+
+            state = _goto[state].TryGetValue(c, out next) ? next : 0;
+
+            if (_best[state] < result)
+            {
+                result = _best[state];
+
+                if (result == 0)
+                    break;
+            }
+        }
+
+        return result == NONE ? -1 : result;
+    }
+}
@@ -0,0 +1,100 @@
+using System;
+using System.Collections.Generic;
+
+namespace ClassicUO.Utility;
+
+/// <summary>
+/// Fixed capacity cache that drops the least recently used entry when full.
+/// All members are thread safe.
+/// </summary>
+public sealed class LruCache<TKey, TValue>
+{
+    private readonly Dictionary<TKey, LinkedListNode<(TKey Key, TValue Value)>> _map;
+    private readonly LinkedList<(TKey Key, TValue Value)> _order = new();
+    private readonly object _lock = new();
+
+    public int Capacity { get; }
+
+    public int Count
+    {
+        get
+        {
+            lock (_lock)
+                return _map.Count;
+        }
+    }
+
+    public LruCache(int capacity)
+    {
+        if (capacity <= 0)
+            throw new ArgumentOutOfRangeException(nameof(capacity));
+
+        Capacity = capacity;
+        _map = new Dictionary<TKey, LinkedListNode<(TKey, TValue)>>(capacity);
+    }
+
+    public bool TryGet(TKey key, out TValue value)
+    {
+        lock (_lock)
+        {
+            if (_map.TryGetValue(key, out LinkedListNode<(TKey Key, TValue Value)> node))
+            {
+                _order.Remove(node);
+                _order.AddFirst(node);
+                value = node.Value.Value;
+
+                return true;
+            }
+        }
+
+        value = default;
+
+        return false;
+    }
+
+    public void Set(TKey key, TValue value)
+    {
+        lock (_lock)
+        {
+            if (_map.TryGetValue(key, out LinkedListNode<(TKey Key, TValue Value)> node))
+            {
+                _order.Remove(node);
+                node.Value = (key, value);
+                _order.AddFirst(node);
+
+                return;
+            }
+
+            if (_map.Count >= Capacity)
+            {
+                LinkedListNode<(TKey Key, TValue Value)> last = _order.Last;
+                _order.RemoveLast();
+                _map.Remove(last.Value.Key);
+            }
+
+            _map[key] = _order.AddFirst((key, value));
+        }
+    }
+
+    public bool Remove(TKey key)
+    {
+        lock (_lock)
+        {
+            if (!_map.Remove(key, out LinkedListNode<(TKey Key, TValue Value)> node))
+                return false;
+
+            _order.Remove(node);
+
+            return true;
+        }
+    }
+
+    public void Clear()
+    {
+        lock (_lock)
+        {
+            _map.Clear();
+            _order.Clear();
+        }
+    }
+}
@@ -0,0 +1,66 @@
+using System.Collections.Generic;
+using ClassicUO.Game;
+using ClassicUO.Game.GameObjects;
+using FluentAssertions;
+using Xunit;
+
+namespace ClassicUO.UnitTests.Game
+{
+    public class EntityGridTest
+    {
+        [Fact]
+        public void Add_SameCell_KeepsEntityInPlace()
+        {
+            var world = new World();
+            var item = new Item(world);
+
+            world.ItemGrid.Add(item, 10, 10);
+            int cell = item.GridCell;
+
+            // What a step inside the same cell does: unlink from the tile, then add again
+            item.UnlinkFromTile();
+            item.GridCell.Should().Be(cell, "unlinking from a tile must not take the entity out of the grid");
+
+            world.ItemGrid.Add(item, 13, 12);
+
+            item.GridCell.Should().Be(cell);
+            world.ItemGrid.Count.Should().Be(1);
+        }
+
+        [Fact]
+        public void Add_OtherCell_MovesEntity()
+        {
+            var world = new World();
+            var item = new Item(world);
+
+            world.ItemGrid.Add(item, 10, 10);
+            int cell = item.GridCell;
+
+            item.UnlinkFromTile();
+            world.ItemGrid.Add(item, 30, 10);
+
+            item.GridCell.Should().NotBe(cell);
+            world.ItemGrid.Count.Should().Be(1);
+
+            var results = new List<Item>();
+            world.ItemGrid.Query(10, 10, 0, results);
+            results.Should().BeEmpty();
+
+            world.ItemGrid.Query(30, 10, 0, results);
+            results.Should().ContainSingle().Which.Should().BeSameAs(item);
+        }
+
+        [Fact]
+        public void RemoveFromTile_TakesEntityOutOfGrid()
+        {
+            var world = new World();
+            var item = new Item(world);
+
+            world.ItemGrid.Add(item, 10, 10);
+            item.RemoveFromTile();
+
+            item.GridCell.Should().Be(-1);
+            world.ItemGrid.Count.Should().Be(0);
+        }
+    }
+}
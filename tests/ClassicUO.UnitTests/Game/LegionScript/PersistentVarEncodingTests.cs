@@ -0,0 +1,55 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Numerics;
+using ClassicUO.LegionScripting;
+using FluentAssertions;
+using IronPython.Runtime;
+using Xunit;
+
+namespace ClassicUO.UnitTests.Game.LegionScript;
+
+public class PersistentVarEncodingTests
+{
+    [Fact]
+    public void Decode_ReturnsEncodedValues()
+    {
+        var kills = new PythonDictionary();
+        kills["ettin"] = 12;
+        kills[3] = new PythonList { 1.5, true, null, "troll" };
+        kills[new PythonTuple(new object[] { 10, 20 })] = new Bytes((IList<byte>)new byte[] { 1, 2, 255 });
+        kills["big"] = BigInteger.Pow(2, 100);
+        kills["long"] = -5_000_000_000L;
+
+        var decoded = (PythonDictionary)PersistentVarEncoding.Decode(PersistentVarEncoding.Encode(kills));
+
+        decoded["ettin"].Should().Be(12);
+        ((PythonList)decoded[3]).Should().Equal(1.5, true, null, "troll");
+        ((IList<byte>)decoded[new PythonTuple(new object[] { 10, 20 })]).Should().Equal(1, 2, 255);
+        decoded["big"].Should().Be(BigInteger.Pow(2, 100));
+        decoded["long"].Should().Be(new BigInteger(-5_000_000_000L));
+    }
+
+    [Fact]
+    public void ToDisplayString_UsesPythonSyntax()
+    {
+        var list = new PythonList { 1, "a'b", new PythonTuple(new object[] { false }) };
+
+        PersistentVarEncoding.ToDisplayString(PersistentVarEncoding.Encode(list)).Should().Be("[1, 'a\\'b', (False,)]");
+    }
+
+    [Fact]
+    public void Encode_UnsupportedType_Throws()
+    {
+        FluentActions.Invoking(() => PersistentVarEncoding.Encode(new PythonList { new object() })).Should().Throw<ArgumentException>();
+    }
+
+    [Fact]
+    public void Decode_CorruptData_Throws()
+    {
+        byte[] data = PersistentVarEncoding.Encode(new PythonList { "kills", 12 });
+
+        FluentActions.Invoking(() => PersistentVarEncoding.Decode(data[..^2])).Should().Throw<InvalidDataException>();
+        FluentActions.Invoking(() => PersistentVarEncoding.Decode([9, 0])).Should().Throw<InvalidDataException>();
+    }
+}
@@ -0,0 +1,33 @@
+using ClassicUO.LegionScripting.PyClasses;
+using FluentAssertions;
+using Xunit;
+
+namespace ClassicUO.UnitTests.Game.LegionScript;
+
+public class PyItemPropertiesTests
+{
+    [Fact]
+    public void Constructor_SplitsLinesAndValues()
+    {
+        var props = new PyItemProperties(0x40000001, "Katana ", "Hit Lightning 50%\n<basefont color=#FF0000>Blessed\nDurability 255 / 255");
+
+        props.Name.Should().Be("Katana");
+        props.Text.Should().StartWith("Katana\nHit Lightning 50%");
+        props.Lines.Should().HaveCount(3);
+        props.Lines[0].Should().Be("Hit Lightning 50%");
+        props.Get("hit lightning").Should().Be(50);
+        props.Has("Blessed").Should().BeTrue();
+        props.Values["Blessed"].Should().BeNull();
+        props.Get("Hit Fireball", -1).Should().Be(-1);
+    }
+
+    [Fact]
+    public void Constructor_NameOnly_HasNoProperties()
+    {
+        var props = new PyItemProperties(0x40000001, "Gold Coin", null);
+
+        props.Text.Should().Be("Gold Coin");
+        props.Lines.Should().BeEmpty();
+        props.Has("Gold Coin").Should().BeFalse();
+    }
+}
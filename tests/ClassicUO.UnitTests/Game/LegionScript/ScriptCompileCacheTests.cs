@@ -0,0 +1,137 @@
+using System;
+using System.Diagnostics;
+using System.IO;
+using ClassicUO.LegionScripting;
+using FluentAssertions;
+using IronPython.Hosting;
+using Microsoft.Scripting;
+using Microsoft.Scripting.Hosting;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace ClassicUO.UnitTests.Game.LegionScript;
+
+public class ScriptCompileCacheTests : IDisposable
+{
+    private const string SCRIPT = "import API\nx = 0\nfor i in range(100):\n    x += i\n";
+
+    private readonly ITestOutputHelper _output;
+    private readonly string _dir;
+    private readonly string _previousScriptPath;
+
+    public ScriptCompileCacheTests(ITestOutputHelper output)
+    {
+        _output = output;
+        _previousScriptPath = ClassicUO.LegionScripting.LegionScripting.ScriptPath;
+        _dir = Path.Combine(Path.GetTempPath(), "lscript_cache_" + Guid.NewGuid().ToString("N"));
+        Directory.CreateDirectory(_dir);
+        File.WriteAllText(Path.Combine(_dir, "test.py"), SCRIPT);
+        ClassicUO.LegionScripting.LegionScripting.ScriptPath = _dir;
+    }
+
+    public void Dispose()
+    {
+        ClassicUO.LegionScripting.LegionScripting.ScriptPath = _previousScriptPath;
+
+        try
+        {
+            Directory.Delete(_dir, true);
+        }
+        catch
+        {
+            // ignored
+        }
+    }
+
+    private ScriptFile CreateScript() => new(null, _dir, "test.py") { PythonEngine = Python.CreateEngine() };
+
+    [Fact]
+    public void GetCompiledCode_ReusesCodeUntilFileChanges()
+    {
+        ScriptFile script = CreateScript();
+
+        CompiledCode first = script.GetCompiledCode();
+        script.ReadFromFileIfChanged();
+        script.GetCompiledCode().Should().BeSameAs(first);
+
+        File.WriteAllText(script.FullPath, SCRIPT + "y = 1\n");
+        script.ReadFromFileIfChanged();
+        script.GetCompiledCode().Should().BeSameAs(first, "the file was not flagged as changed");
+
+        script.MarkChanged();
+        script.ReadFromFileIfChanged();
+        script.GetCompiledCode().Should().NotBeSameAs(first);
+    }
+
+    [Fact]
+    public void GetCompiledCode_RecompilesForNewEngine()
+    {
+        ScriptFile script = CreateScript();
+
+        CompiledCode first = script.GetCompiledCode();
+        script.PythonEngine = Python.CreateEngine();
+
+        script.GetCompiledCode().Should().NotBeSameAs(first);
+    }
+
+    [Fact]
+    public void GetCompiledCode_SameContentAfterReRead_ReusesCode()
+    {
+        ScriptFile script = CreateScript();
+        CompiledCode first = script.GetCompiledCode();
+        string hash = script.ContentHash;
+
+        // Rewritten with identical contents, the file is read again but hashes the same
+        File.WriteAllText(script.FullPath, SCRIPT);
+        script.MarkChanged();
+        script.ReadFromFileIfChanged();
+
+        script.ContentHash.Should().Be(hash);
+        script.GetCompiledCode().Should().BeSameAs(first);
+    }
+
+    [Fact]
+    public void ReadFromFileIfChanged_DoesNotReadUnchangedFile()
+    {
+        ScriptFile script = CreateScript();
+        string[] contents = script.FileContents;
+
+        File.Delete(script.FullPath);
+
+        script.ReadFromFileIfChanged().Should().BeSameAs(contents);
+        script.FileContentsJoined.Should().Contain("x += i");
+
+        script.MarkChanged();
+        script.ReadFromFileIfChanged().Should().BeEmpty("a changed file is read again");
+    }
+
+    [Fact]
+    [Trait("Category", "Benchmark")]
+    public void Benchmark_ColdVsWarmStart()
+    {
+        const int RUNS = 20;
+        ScriptFile script = CreateScript();
+
+        var sw = Stopwatch.StartNew();
+
+        for (int i = 0; i < RUNS; i++)
+        {
+            script.ReadFromFile();
+            script.PythonEngine.CreateScriptSourceFromString(script.FileContentsJoined, script.FullPath, SourceCodeKind.File)
+                .Execute(script.PythonEngine.CreateScope());
+        }
+
+        double cold = sw.Elapsed.TotalMilliseconds / RUNS;
+        sw.Restart();
+
+        for (int i = 0; i < RUNS; i++)
+        {
+            script.ReadFromFileIfChanged();
+            script.GetCompiledCode().Execute(script.PythonEngine.CreateScope());
+        }
+
+        double warm = sw.Elapsed.TotalMilliseconds / RUNS;
+
+        _output.WriteLine($"Cold start (read + compile + run): {cold:F3}ms, warm start (cached run): {warm:F3}ms");
+    }
+}
@@ -0,0 +1,127 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using ClassicUO.Game.Managers;
+using ClassicUO.LegionScripting;
+using ClassicUO.LegionScripting.PyClasses;
+using FluentAssertions;
+using Xunit;
+
+namespace ClassicUO.UnitTests.Game.LegionScript;
+
+public class ScriptJournalTests
+{
+    private static JournalEntry Entry(string text, DateTime time) => new() { Text = text, Name = "", Time = time };
+
+    [Fact]
+    public void Cursor_OnlySeesEntriesAddedAfterCreation()
+    {
+        var journal = new ScriptJournal();
+        journal.Add(Entry("before", DateTime.Now));
+
+        var cursor = new ScriptJournalCursor(journal);
+        journal.Add(Entry("after", DateTime.Now));
+
+        cursor.Entries().Select(e => e.Text).Should().Equal("after");
+    }
+
+    [Fact]
+    public void Clear_HidesEntriesOnlyForThatCursor()
+    {
+        var journal = new ScriptJournal();
+        var a = new ScriptJournalCursor(journal);
+        var b = new ScriptJournalCursor(journal);
+
+        journal.Add(Entry("one", DateTime.Now));
+        journal.Add(Entry("two", DateTime.Now));
+
+        a.Clear(a.Entries()[0]);
+        a.Entries().Select(e => e.Text).Should().Equal("two");
+        b.Entries().Should().HaveCount(2);
+
+        b.Clear();
+        b.Entries().Should().BeEmpty();
+        a.Entries().Should().HaveCount(1);
+    }
+
+    [Fact]
+    public void EntriesSince_ReturnsOnlyNewerEntries()
+    {
+        var journal = new ScriptJournal();
+        var cursor = new ScriptJournalCursor(journal);
+        DateTime now = DateTime.Now;
+
+        for (int i = 10; i >= 0; i--)
+            journal.Add(Entry(i.ToString(), now.AddSeconds(-i)));
+
+        cursor.EntriesSince(now.AddSeconds(-3.5)).Select(e => e.Text).Should().Equal("3", "2", "1", "0");
+    }
+
+    [Fact]
+    public void Journal_WrapsAroundCapacity()
+    {
+        var journal = new ScriptJournal();
+        var cursor = new ScriptJournalCursor(journal);
+
+        for (int i = 0; i < ScriptJournal.CAPACITY + 10; i++)
+            journal.Add(Entry(i.ToString(), DateTime.Now));
+
+        var entries = cursor.Entries();
+        entries.Should().NotBeEmpty();
+        entries[^1].Text.Should().Be((ScriptJournal.CAPACITY + 9).ToString());
+        entries.Select(e => e.Sequence).Should().BeInAscendingOrder();
+    }
+
+    [Fact]
+    public void JournalEntries_TryDequeue_HidesEntryFromCursor()
+    {
+        var journal = new ScriptJournal();
+        var cursor = new ScriptJournalCursor(journal);
+        var entries = new PyJournalEntries(cursor);
+
+        journal.Add(Entry("one", DateTime.Now));
+        journal.Add(Entry("two", DateTime.Now));
+
+        entries.Count.Should().Be(2);
+        entries.TryDequeue(out PyJournalEntry first).Should().BeTrue();
+        first.Text.Should().Be("one");
+        cursor.Entries().Select(e => e.Text).Should().Equal("two");
+
+        entries.Clear();
+        entries.IsEmpty.Should().BeTrue();
+        entries.TryDequeue(out _).Should().BeFalse();
+    }
+
+    [Fact]
+    public void JournalEntries_TryDequeue_SkipsClearedEntriesAndCountsDown()
+    {
+        var journal = new ScriptJournal();
+        var cursor = new ScriptJournalCursor(journal);
+        var entries = new PyJournalEntries(cursor);
+
+        for (int i = 0; i < 5; i++)
+            journal.Add(Entry(i.ToString(), DateTime.Now));
+
+        cursor.Clear(cursor.Entries()[2]);
+        entries.Count.Should().Be(4);
+
+        entries.TryPeek(out PyJournalEntry peeked).Should().BeTrue();
+        peeked.Text.Should().Be("0");
+        entries.Count.Should().Be(4, "peeking does not hide the entry");
+
+        var drained = new List<string>();
+
+        while (entries.TryDequeue(out PyJournalEntry entry))
+        {
+            drained.Add(entry.Text);
+            entries.Count.Should().Be(4 - drained.Count);
+        }
+
+        drained.Should().Equal("0", "1", "3", "4");
+
+        journal.Add(Entry("5", DateTime.Now));
+        entries.Count.Should().Be(1);
+        entries.TryDequeue(out PyJournalEntry late).Should().BeTrue();
+        late.Text.Should().Be("5");
+    }
+}
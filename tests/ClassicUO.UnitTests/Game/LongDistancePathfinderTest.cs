@@ -0,0 +1,44 @@
+using System.Threading;
+using ClassicUO.Game;
+using FluentAssertions;
+using Microsoft.Xna.Framework;
+using Xunit;
+
+namespace ClassicUO.UnitTests.Game
+{
+    public class LongDistancePathfinderTest
+    {
+        // Open map with a wall at x = 100 that only has a gap at y = 200
+        private static bool IsWalkable(int x, int y) => x != 100 || y == 200;
+
+        [Fact]
+        public void GetWalkingDistances_UsesWalkingNotStraightLine()
+        {
+            Point[] targets = [new(95, 10), new(110, 10), new(100, 50), new(90, 10)];
+
+            int[] distances = LongDistancePathfinder.GetWalkingDistances(90, 10, targets, 1, 500, IsWalkable, CancellationToken.None);
+
+            distances.Should().Equal(4, 379, 39, 0);
+        }
+
+        [Fact]
+        public void GetWalkingDistances_BeyondMaxDistance_IsMinusOne()
+        {
+            Point[] targets = [new(95, 10), new(110, 10), new(-1, -1)];
+
+            int[] distances = LongDistancePathfinder.GetWalkingDistances(90, 10, targets, 0, 300, IsWalkable, CancellationToken.None);
+
+            distances.Should().Equal(5, -1, -1);
+        }
+
+        [Fact]
+        public void GetWalkingDistances_HugeRange_IsClamped()
+        {
+            Point[] targets = [new(150, 10)];
+
+            int[] distances = LongDistancePathfinder.GetWalkingDistances(90, 10, targets, 5000, 500, IsWalkable, CancellationToken.None);
+
+            distances.Should().Equal(LongDistancePathfinder.GetWalkingDistances(90, 10, targets, LongDistancePathfinder.MAX_TARGET_RANGE, 500, IsWalkable, CancellationToken.None));
+        }
+    }
+}
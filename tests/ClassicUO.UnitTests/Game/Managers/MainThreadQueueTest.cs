@@ -0,0 +1,102 @@
+using System.Collections.Generic;
+using System.Threading;
+using ClassicUO.Game.Managers;
+using ClassicUO.LegionScripting;
+using FluentAssertions;
+using Xunit;
+
+namespace ClassicUO.UnitTests.Game.Managers
+{
+    public class MainThreadQueueTest
+    {
+        [Fact]
+        public void Batch_RunsAllInvokesInASingleFrame()
+        {
+            MainThreadQueue.Load();
+            int mainThreadId = Thread.CurrentThread.ManagedThreadId;
+
+            int frame = 0;
+            var frames = new List<int>();
+            var threads = new List<int>();
+            var results = new List<int>();
+
+            var worker = new Thread(() =>
+            {
+                using (MainThreadQueue.BeginBatch(1000))
+                {
+                    for (int i = 0; i < 5; i++)
+                    {
+                        int n = i;
+                        results.Add(MainThreadQueue.InvokeOnMainThread(() =>
+                        {
+                            frames.Add(frame);
+                            threads.Add(Thread.CurrentThread.ManagedThreadId);
+                            return n * 2;
+                        }));
+                    }
+                }
+            });
+
+            worker.Start();
+
+            while (worker.IsAlive)
+            {
+                MainThreadQueue.ProcessQueue();
+                frame++;
+                Thread.Sleep(1);
+            }
+
+            results.Should().Equal(0, 2, 4, 6, 8);
+            threads.Should().AllBeEquivalentTo(mainThreadId);
+            frames.Should().AllBeEquivalentTo(frames[0]);
+        }
+
+        [Fact]
+        public void Batch_FromMainThread_RunsInline()
+        {
+            MainThreadQueue.Load();
+
+            using (MainThreadQueue.BeginBatch())
+            {
+                MainThreadQueue.InvokeOnMainThread(() => 42).Should().Be(42);
+            }
+        }
+
+        [Fact]
+        public void ScriptProfiler_RecordsCallsPerScriptAndCaller()
+        {
+            MainThreadQueue.Load();
+            ScriptProfiler.Reset();
+            ScriptProfiler.Enabled = true;
+
+            try
+            {
+                var worker = new Thread(() =>
+                {
+                    ScriptProfiler.SetCurrentScript("profile_test.py");
+
+                    for (int i = 0; i < 3; i++)
+                        MainThreadQueue.InvokeOnMainThread(() => i);
+                });
+
+                worker.Start();
+
+                while (worker.IsAlive)
+                {
+                    MainThreadQueue.ProcessQueue();
+                    Thread.Sleep(1);
+                }
+
+                ScriptProfile profile = ScriptProfiler.Scripts.Should().ContainSingle(s => s.Name == "profile_test.py").Subject;
+                ApiCallStats stats = profile.Calls[nameof(ScriptProfiler_RecordsCallsPerScriptAndCaller)];
+                stats.Count.Should().Be(3);
+                stats.ExecHistogram.Should().HaveCount(ScriptProfiler.BUCKETS_MS.Length + 1);
+            }
+            finally
+            {
+                ScriptProfiler.Enabled = false;
+                ScriptProfiler.Reset();
+            }
+        }
+    }
+}
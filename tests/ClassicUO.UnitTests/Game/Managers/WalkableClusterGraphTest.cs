@@ -0,0 +1,97 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Threading;
+using ClassicUO.Game.Managers;
+using FluentAssertions;
+using Microsoft.Xna.Framework;
+using Xunit;
+
+namespace ClassicUO.UnitTests.Game.Managers
+{
+    public class WalkableClusterGraphTest
+    {
+        private const int SIZE = 256;
+
+        // Open map with a wall at x = 100 that only has a gap at y = 200
+        private static bool IsWalkable(int x, int y) => x != 100 || y == 200;
+
+        private static void AssertValidPath(List<Point> path, int startX, int startY, int targetX, int targetY)
+        {
+            path.Should().NotBeNull();
+            path[0].Should().Be(new Point(startX, startY));
+            path[^1].Should().Be(new Point(targetX, targetY));
+
+            for (int i = 1; i < path.Count; i++)
+            {
+                Math.Max(Math.Abs(path[i].X - path[i - 1].X), Math.Abs(path[i].Y - path[i - 1].Y)).Should().Be(1);
+                IsWalkable(path[i].X, path[i].Y).Should().BeTrue();
+            }
+        }
+
+        [Fact]
+        public void FindPath_GoesThroughTheGap()
+        {
+            var graph = new WalkableClusterGraph(0, SIZE, SIZE, IsWalkable);
+
+            List<Point> path = graph.FindPath(10, 10, 200, 10, IsWalkable, CancellationToken.None);
+
+            AssertValidPath(path, 10, 10, 200, 10);
+            path.Should().Contain(new Point(100, 200));
+        }
+
+        [Fact]
+        public void FindPath_OpenGround_IsNearlyStraight()
+        {
+            var graph = new WalkableClusterGraph(0, SIZE, SIZE, (_, _) => true);
+
+            List<Point> path = graph.FindPath(0, 0, 250, 120, (_, _) => true, CancellationToken.None);
+
+            path.Should().NotBeNull();
+            path.Count.Should().BeLessThan(251 + 10);
+        }
+
+        [Fact]
+        public void FindPath_StreamsTilesInOrder()
+        {
+            var graph = new WalkableClusterGraph(0, SIZE, SIZE, IsWalkable);
+            var streamed = new List<Point>();
+
+            List<Point> path = graph.FindPath(10, 10, 200, 10, IsWalkable, CancellationToken.None, streamed.Add);
+
+            streamed.Should().Equal(path);
+        }
+
+        [Fact]
+        public void FindPath_UnreachableTarget_ReturnsNull()
+        {
+            var graph = new WalkableClusterGraph(0, SIZE, SIZE, (x, y) => x != 100);
+
+            graph.FindPath(10, 10, 200, 10, (x, y) => x != 100, CancellationToken.None).Should().BeNull();
+        }
+
+        [Fact]
+        public void SaveAndLoad_KeepsBuiltClusters()
+        {
+            string file = Path.GetTempFileName();
+
+            try
+            {
+                var graph = new WalkableClusterGraph(0, SIZE, SIZE, IsWalkable) { MapChecksum = "abc" };
+                graph.FindPath(10, 10, 200, 10, IsWalkable, CancellationToken.None);
+                graph.SaveToFile(file);
+
+                var loaded = new WalkableClusterGraph(0, SIZE, SIZE, IsWalkable) { MapChecksum = "abc" };
+                loaded.LoadFromFile(file).Should().BeTrue();
+                loaded.ClusterCount.Should().Be(graph.ClusterCount);
+                AssertValidPath(loaded.FindPath(10, 10, 200, 10, IsWalkable, CancellationToken.None), 10, 10, 200, 10);
+
+                new WalkableClusterGraph(0, SIZE, SIZE, IsWalkable) { MapChecksum = "other" }.LoadFromFile(file).Should().BeFalse();
+            }
+            finally
+            {
+                File.Delete(file);
+            }
+        }
+    }
+}
@@ -0,0 +1,113 @@
+using System.IO;
+using System.Threading.Tasks;
+using ClassicUO.Game.Managers;
+using FluentAssertions;
+using Xunit;
+
+namespace ClassicUO.UnitTests.Game.Managers
+{
+    public class WalkableMapDataTest
+    {
+        [Fact]
+        public void SetWalkable_TracksDataPerTile()
+        {
+            var data = new WalkableMapData(0, 4, 3);
+            data.SetWalkable(9, 17, true);
+            data.SetWalkable(10, 17, false);
+
+            data.TryGetWalkable(9, 17, out bool walkable).Should().BeTrue();
+            walkable.Should().BeTrue();
+            data.HasDataForTile(10, 17).Should().BeTrue();
+            data.GetWalkable(10, 17).Should().BeFalse();
+            data.HasDataForTile(11, 17).Should().BeFalse();
+            data.HasDataForTile(100, 100).Should().BeFalse();
+        }
+
+        [Fact]
+        public void MergeChunk_KeepsExistingTiles()
+        {
+            var data = new WalkableMapData(0, 4, 3);
+            data.SetWalkable(10, 17, false);
+
+            data.MergeChunk(1, 2, ulong.MaxValue);
+
+            data.GetWalkable(10, 17).Should().BeFalse();
+            data.GetWalkable(11, 17).Should().BeTrue();
+            data.HasDataForTile(15, 23).Should().BeTrue();
+        }
+
+        [Fact]
+        public void CalculateGenerationProgress_StopsAtFirstMissingChunk()
+        {
+            var data = new WalkableMapData(0, 4, 3);
+            data.MergeChunk(0, 0, 0);
+            data.MergeChunk(0, 1, 0);
+            data.MergeChunk(1, 0, 0);
+
+            data.CalculateGenerationProgress().Should().Be(2);
+        }
+
+        [Fact]
+        public void CreateAndOpen_KeepsTilesAndChecksum()
+        {
+            string file = Path.GetTempFileName();
+
+            try
+            {
+                using (WalkableMapData data = WalkableMapData.Create(2, 4, 3, file, "abc="))
+                {
+                    data.SetWalkable(31, 23, true);
+                    data.Flush();
+                }
+
+                using (WalkableMapData loaded = WalkableMapData.Open(2, 4, 3, file))
+                {
+                    loaded.MapChecksum.Should().Be("abc=");
+                    loaded.GetWalkable(31, 23).Should().BeTrue();
+                    loaded.HasDataForTile(30, 23).Should().BeFalse();
+
+                    loaded.Reset("def=");
+                    loaded.HasDataForTile(31, 23).Should().BeFalse();
+                }
+
+                FluentActions.Invoking(() => WalkableMapData.Open(1, 4, 3, file)).Should().Throw<InvalidDataException>();
+
+                File.WriteAllBytes(file, new byte[10]);
+                FluentActions.Invoking(() => WalkableMapData.Open(2, 4, 3, file)).Should().Throw<InvalidDataException>();
+            }
+            finally
+            {
+                File.Delete(file);
+            }
+        }
+
+        [Fact]
+        public void Dispose_WhileReading_ReadsReturnNoData()
+        {
+            string file = Path.GetTempFileName();
+
+            try
+            {
+                WalkableMapData data = WalkableMapData.Create(0, 4, 3, file, "");
+                data.SetWalkable(9, 17, true);
+
+                Task reader = Task.Run(() =>
+                {
+                    for (int i = 0; i < 100_000; i++)
+                        data.TryGetWalkable(9, 17, out _);
+                });
+
+                data.Dispose();
+                reader.Wait();
+
+                data.TryGetWalkable(9, 17, out bool walkable).Should().BeFalse();
+                walkable.Should().BeFalse();
+                data.CalculateGenerationProgress().Should().Be(0);
+            }
+            finally
+            {
+                File.Delete(file);
+            }
+        }
+    }
+}
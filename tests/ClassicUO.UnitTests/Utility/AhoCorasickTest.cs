@@ -0,0 +1,38 @@
+using ClassicUO.Utility;
+using FluentAssertions;
+using Xunit;
+
+namespace ClassicUO.UnitTests.Utility
+{
+    public class AhoCorasickTest
+    {
+        [Theory]
+        [InlineData("You have been slain", 2)]
+        [InlineData("You put the item in your pack", 0)]
+        [InlineData("You see: a hers", 1)]
+        [InlineData("no match", -1)]
+        [InlineData("", -1)]
+        public void FirstMatch_ReturnsLowestPatternIndex(string text, int expected)
+        {
+            var matcher = new AhoCorasick(new[] { "You put", "he", "slain", "hers" });
+
+            matcher.FirstMatch(text).Should().Be(expected);
+        }
+
+        [Fact]
+        public void FirstMatch_PrefersEarlierPatternOverEarlierPosition()
+        {
+            var matcher = new AhoCorasick(new[] { "world", "hello" });
+
+            matcher.FirstMatch("hello world").Should().Be(0);
+        }
+
+        [Fact]
+        public void FirstMatch_EmptyPatternAlwaysMatches()
+        {
+            var matcher = new AhoCorasick(new[] { "abc", "" });
+
+            matcher.FirstMatch("xyz").Should().Be(1);
+        }
+    }
+}
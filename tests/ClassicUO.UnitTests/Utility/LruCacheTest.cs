@@ -0,0 +1,53 @@
+using ClassicUO.Utility;
+using FluentAssertions;
+using Xunit;
+
+namespace ClassicUO.UnitTests.Utility
+{
+    public class LruCacheTest
+    {
+        [Fact]
+        public void Set_EvictsLeastRecentlyUsed()
+        {
+            var cache = new LruCache<int, string>(2);
+            cache.Set(1, "a");
+            cache.Set(2, "b");
+            cache.TryGet(1, out _).Should().BeTrue();
+
+            cache.Set(3, "c");
+
+            cache.Count.Should().Be(2);
+            cache.TryGet(2, out _).Should().BeFalse();
+            cache.TryGet(1, out string a).Should().BeTrue();
+            a.Should().Be("a");
+            cache.TryGet(3, out _).Should().BeTrue();
+        }
+
+        [Fact]
+        public void Set_ExistingKey_ReplacesValue()
+        {
+            var cache = new LruCache<int, string>(2);
+            cache.Set(1, "a");
+            cache.Set(1, "b");
+
+            cache.Count.Should().Be(1);
+            cache.TryGet(1, out string value).Should().BeTrue();
+            value.Should().Be("b");
+        }
+
+        [Fact]
+        public void Remove_And_Clear()
+        {
+            var cache = new LruCache<int, string>(4);
+            cache.Set(1, "a");
+            cache.Set(2, "b");
+
+            cache.Remove(1).Should().BeTrue();
+            cache.Remove(1).Should().BeFalse();
+            cache.TryGet(1, out _).Should().BeFalse();
+
+            cache.Clear();
+            cache.Count.Should().Be(0);
+        }
+    }
+}